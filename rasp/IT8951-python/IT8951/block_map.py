@@ -0,0 +1,150 @@
+'''
+A map, kept in spare device memory, of where the pixels currently on the panel
+are stored in the controller. Most areas are loaded into the image buffer, but
+black/white areas sent at 1bpp live in their own buffer (see
+AutoEPDDisplay.update). With the map, a new process can read the displayed
+image back from the controller instead of keeping a copy of it on disk or
+assuming the panel is blank.
+
+The display is divided into 16x16 blocks, with one byte per block. The map is
+stored after a small header identifying it, so that memory that was never
+written by this module (e.g. after a power cycle) is not mistaken for a map.
+'''
+
+import struct
+import sys
+from array import array
+
+BLOCK_SIZE = 16
+
+# where a block's pixels are
+IN_IMG_BUF = 0
+IN_1BPP_BUF = 1
+UNKNOWN = 2
+
+MAGIC = b'IT8M'
+# magic, width, height, block size
+HEADER = struct.Struct('<4sHHH')
+
+class BlockMap:
+    '''
+    Parameters
+    ----------
+
+    epd : EPD
+        The device
+
+    address : int
+        Where in device memory to keep the map; needs HEADER.size + one byte per
+        block
+    '''
+
+    def __init__(self, epd, address):
+        self.epd = epd
+        self.address = address
+        self.dims = (epd.width, epd.height)
+        self.cols = -(-epd.width // BLOCK_SIZE)
+        self.rows = -(-epd.height // BLOCK_SIZE)
+
+        # host copy of the map, and whether the device copy is known to match it
+        self.blocks = bytearray([UNKNOWN]) * (self.cols*self.rows)
+        self._written = False
+
+    def plan(self, xy, dims, location):
+        '''
+        Return {block index: location} for the blocks that change when the area is
+        loaded into location. Blocks only partly covered by the area keep their
+        location if it's the same, and otherwise become UNKNOWN.
+        '''
+        x0, y0 = xy
+        x1, y1 = x0 + dims[0], y0 + dims[1]
+        changes = {}
+        for row in range(y0 // BLOCK_SIZE, -(-y1 // BLOCK_SIZE)):
+            top = row*BLOCK_SIZE
+            bottom = min(top + BLOCK_SIZE, self.dims[1])
+            for col in range(x0 // BLOCK_SIZE, -(-x1 // BLOCK_SIZE)):
+                left = col*BLOCK_SIZE
+                right = min(left + BLOCK_SIZE, self.dims[0])
+                i = row*self.cols + col
+
+                covered = x0 <= left and y0 <= top and x1 >= right and y1 >= bottom
+                if covered or self.blocks[i] == location:
+                    new = location
+                else:
+                    new = UNKNOWN
+
+                if new != self.blocks[i]:
+                    changes[i] = new
+        return changes
+
+    def apply(self, changes, location=None):
+        '''
+        Set the blocks in changes (from plan) on the host and on the device. If
+        location is given, all the blocks are set to it instead, e.g. UNKNOWN while
+        their pixels are being loaded.
+        '''
+        if not changes:
+            return
+
+        for i, new in changes.items():
+            self.blocks[i] = new if location is None else location
+
+        if not self._written:
+            self.mark_all(None)
+            return
+
+        # write the span of changed blocks, in whole words
+        start = HEADER.size + min(changes)
+        end = HEADER.size + max(changes) + 1
+        start -= start % 2
+        end += end % 2
+        data = self._header() + self.blocks
+        self._write(start, data[start:end])
+
+    def mark_all(self, location):
+        '''
+        Set every block to location and write the whole map to the device. A
+        location of None writes the host copy as it is.
+        '''
+        if location is not None:
+            self.blocks[:] = bytes([location]) * len(self.blocks)
+        self._write(0, self._header() + self.blocks)
+        self._written = True
+
+    def read(self):
+        '''
+        Read the map from the device into the host copy. Returns False if device
+        memory doesn't hold a map of this display.
+        '''
+        size = HEADER.size + len(self.blocks)
+        words = array('H', bytes(size + size % 2))
+        self.epd.read_memory_into(self.address, words)
+        if sys.byteorder == 'big':
+            words.byteswap()
+        data = words.tobytes()[:size]
+
+        magic, width, height, block_size = HEADER.unpack_from(data)
+        if magic != MAGIC or (width, height) != self.dims or block_size != BLOCK_SIZE:
+            return False
+
+        self.blocks[:] = data[HEADER.size:]
+        self._written = True
+        return True
+
+    def block_box(self, i):
+        row, col = divmod(i, self.cols)
+        left, top = col*BLOCK_SIZE, row*BLOCK_SIZE
+        return (left, top,
+                min(left + BLOCK_SIZE, self.dims[0]), min(top + BLOCK_SIZE, self.dims[1]))
+
+    def _header(self):
+        return bytearray(HEADER.pack(MAGIC, self.dims[0], self.dims[1], BLOCK_SIZE))
+
+    def _write(self, offset, data):
+        if len(data) % 2:
+            data = data + b'\0'
+        words = array('H', bytes(data))
+        # device memory is little endian
+        if sys.byteorder == 'big':
+            words.byteswap()
+        self.epd.write_memory(self.address + offset, words.tolist())
@@ -0,0 +1,57 @@
+'''
+Storage for the results of EPD.calibrate_spi, so that the calibration only has to
+be run once per panel. Results are kept in a small JSON file, keyed by which SPI
+device the panel is attached to and what the controller reports about itself.
+'''
+
+import json
+import os
+
+DEFAULT_PATH = os.path.expanduser('~/.config/IT8951/spi_calibration.json')
+
+
+def device_key(epd):
+    '''
+    A string identifying the panel attached to epd
+    '''
+    bus, device = epd.spi_location
+    return 'spidev{}.{} {}x{} {} {}'.format(
+        bus, device, epd.width, epd.height,
+        epd.firmware_version.strip('\0 '), epd.lut_version.strip('\0 ')
+    )
+
+
+def load(path, key):
+    '''
+    Return the (cmd_hz, data_hz) stored for key in path, or None if there is none
+    '''
+    try:
+        with open(path) as f:
+            entry = json.load(f)[key]
+    except (OSError, ValueError, KeyError):
+        return None
+    return entry['cmd_hz'], entry['data_hz']
+
+
+def save(path, key, clocks):
+    '''
+    Store (cmd_hz, data_hz) for key in path, keeping the entries of other devices
+    '''
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        entries = {}
+
+    cmd_hz, data_hz = clocks
+    entries[key] = {'cmd_hz': cmd_hz, 'data_hz': data_hz}
+
+    dirname = os.path.dirname(path)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+
+    # write to a temporary file first, so a crash can't leave a truncated file behind
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(entries, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
@@ -26,6 +26,12 @@ class Commands:
     DPY_BUF_AREA = 0x037
     VCOM         = 0x039
 
+# controller power states, with the codes of the commands that enter them
+class PowerStates:
+    RUN     = Commands.SYS_RUN
+    STANDBY = Commands.STANDBY
+    SLEEP   = Commands.SLEEP
+
 # rotation modes
 # TODO: make sure CW/CCW are correct
 class Rotate:
@@ -95,3 +101,11 @@ class Registers:
     MBASE = 0x200
     MCSR  = MBASE + 0x0
     LISAR = MBASE + 0x8
+
+# registers whose value the device changes by itself, so they can't be
+# served from a shadow copy of what we wrote
+volatile_registers = {
+    Registers.LUTAFSR,
+    Registers.LUT01AF,
+    Registers.MCSR,
+}
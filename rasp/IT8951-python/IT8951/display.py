@@ -1,9 +1,16 @@
 
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from time import perf_counter, time
 from PIL import Image, ImageChops
 
-from .constants import DisplayModes, PixelModes, low_bpp_modes
+from .constants import DisplayModes, PixelModes, Pins, PowerStates, low_bpp_modes
 from . import img_manip
+from .block_map import BlockMap, IN_1BPP_BUF, IN_IMG_BUF, UNKNOWN
+from .shared import SharedFrame
+from .trace import TraceRecorder
 
 try:
     from .interface import EPD
@@ -20,28 +27,69 @@ class AutoDisplay:
 
     Note: width and height should be of the physical display, and don't depend on
     rotation---they will be swapped automatically if rotate is set to CW or CCW
+
+    With track_gray, the display is divided into gray_tile_size tiles, and each tile
+    counts the black/white (DU) updates it has had since it was last updated in a
+    grayscale mode. Those leave black/white intermediates of grayscale pixels and
+    ghosting behind. The next grayscale update also refreshes the tiles with such
+    debt, and if ghosting_threshold is set, tiles are cleaned up with GC16 as soon as
+    they have had that many DU updates.
+
+    If trace is a path, every update is appended to that file, see trace.py
+
+    draw_full_async and draw_partial_async run the update in a background thread,
+    at most max_pending_draws at a time (see _submit)
+
+    If shared_frame is a path (e.g. shared.DEFAULT_PATH), frame_buf is kept in a
+    file in shared memory that other processes can draw into, and draw_commits
+    displays what they commit (see shared.py). It's in the panel's layout, so
+    rotate and mirror can't be used with it.
     '''
 
-    def __init__(self, width, height, rotate=None, mirror=False, track_gray=False):
+    def __init__(self, width, height, rotate=None, mirror=False, track_gray=False,
+                 gray_tile_size=64, ghosting_threshold=None, trace=None,
+                 max_pending_draws=2, shared_frame=None):
         self._set_rotate(rotate, mirror)
 
         self.display_dims = (width, height)
-        if rotate in ('CW', 'CCW'):
+        self.shared_frame = None
+        if shared_frame is not None:
+            if self._rotate_method is not None:
+                raise ValueError('a shared frame buffer can not be rotated or mirrored')
+            self.shared_frame = SharedFrame(shared_frame, self.display_dims)
+            self.frame_buf = self.shared_frame.image
+        elif rotate in ('CW', 'CCW'):
             self.frame_buf = Image.new('L', (height, width), 0xFF)
         else:
             self.frame_buf = Image.new('L', (width, height), 0xFF)
 
         # keep track of what we have updated,
         # so that we can automatically do partial updates of only the
-        # relevant portions of the display
-        self.prev_frame = None
+        # relevant portions of the display. only the 4 bits per pixel the display
+        # shows are kept (see prev_frame), which is half the memory of an image
+        self._prev_packed = None
 
         self.track_gray = track_gray
         if track_gray:
-            # keep track of what has changed since the last grayscale update
-            # so that we make sure we clear any black/white intermediates
+            if gray_tile_size <= 0 or gray_tile_size % 16:
+                raise ValueError('gray_tile_size must be a positive multiple of 16')
+
+            # keep track of what has changed since the last grayscale update, per
+            # tile, so that we make sure we clear any black/white intermediates
             # start out with no changes
-            self.gray_change_bbox = None
+            self.gray_tile_size = gray_tile_size
+            self.ghosting_threshold = ghosting_threshold
+            self._gray_tiles = (-(-width // gray_tile_size), -(-height // gray_tile_size))
+            self.gray_debt = bytearray(self._gray_tiles[0] * self._gray_tiles[1])
+
+        self.trace = None
+        if trace is not None:
+            self.trace = TraceRecorder(trace, self.display_dims)
+
+        # the worker for asynchronous draws is started on first use
+        self._executor = None
+        self._pending_draws = threading.BoundedSemaphore(max_pending_draws)
+        self._last_draw = None
 
     @property
     def width(self):
@@ -51,16 +99,66 @@ class AutoDisplay:
     def height(self):
         return self.frame_buf.height
 
-    def _get_frame_buf(self):
+    @property
+    def prev_frame(self):
         '''
-        Return the frame buf, rotated according to flip. Always returns a copy, even
-        when rotate is None.
+        The last frame sent to the display as it shows it, with the low 4 bits of each
+        pixel zero, or None. It's stored packed, so this returns a new image.
+        '''
+        if self._prev_packed is None:
+            return None
+        pixels = img_manip.unpack_4bpp(self._prev_packed, self.display_dims[0],
+                                       (0, 0) + self.display_dims)
+        return Image.frombytes('L', self.display_dims, bytes(pixels))
+
+    @prev_frame.setter
+    def prev_frame(self, frame):
+        if frame is None:
+            self._prev_packed = None
+        else:
+            self._prev_packed = img_manip.pack_4bpp(frame.tobytes(), frame.width)
+
+    def _get_frame_buf(self, copy=True):
+        '''
+        Return the frame buf, rotated according to flip. Returns a copy, even when
+        rotate is None, unless copy is False.
         '''
         if self._rotate_method is None:
-            return self.frame_buf.copy()
+            return self.frame_buf.copy() if copy else self.frame_buf
 
         return self.frame_buf.transpose(self._rotate_method)
 
+    def _display_box(self, box):
+        '''
+        Return box, in frame_buf coordinates, in the coordinates of the display
+        (see _get_frame_buf). None stays None.
+        '''
+        if box is None or self._rotate_method is None:
+            return box
+
+        x0, y0, x1, y1 = box
+        w, h = self.frame_buf.size
+        return {
+            Image.Transpose.ROTATE_90       : (y0, w-x1, y1, w-x0),
+            Image.Transpose.ROTATE_180      : (w-x1, h-y1, w-x0, h-y0),
+            Image.Transpose.ROTATE_270      : (h-y1, x0, h-y0, x1),
+            Image.Transpose.FLIP_LEFT_RIGHT : (w-x1, y0, w-x0, y1),
+            Image.Transpose.FLIP_TOP_BOTTOM : (x0, h-y1, x1, h-y0),
+            Image.Transpose.TRANSPOSE       : (y0, x0, y1, x1),
+            Image.Transpose.TRANSVERSE      : (h-y1, w-x1, h-y0, w-x0),
+        }[self._rotate_method]
+
+    @property
+    def _inverse_rotate_method(self):
+        '''
+        The transpose that undoes _rotate_method, from the display's layout back to
+        frame_buf's
+        '''
+        return {
+            Image.Transpose.ROTATE_90  : Image.Transpose.ROTATE_270,
+            Image.Transpose.ROTATE_270 : Image.Transpose.ROTATE_90,
+        }.get(self._rotate_method, self._rotate_method)
+
     def _set_rotate(self, rotate, mirror):
 
         if not mirror:
@@ -87,44 +185,175 @@ class AutoDisplay:
         '''
         Write the full image to the device, and display it using mode
         '''
-        frame = self._get_frame_buf()
+        self.wait_async()
+        self._draw_full(self._get_frame_buf(copy=False), mode)
+
+    def draw_partial(self, mode, box=None):
+        '''
+        Write only the rectangle bounding the pixels of the image that have changed
+        since the last call to draw_full or draw_partial
+
+        If box (left, upper, right, lower) is given, the caller promises that
+        frame_buf has not changed outside of it, and only box is compared.
+        '''
+        self.wait_async()
+        self._draw_partial(self._get_frame_buf(copy=False), mode, self._display_box(box))
+
+    def draw_full_async(self, mode):
+        '''
+        Like draw_full, but the update is done in a background thread. frame_buf is
+        copied before returning, so it can be drawn on right away.
+
+        Returns
+        -------
+
+        concurrent.futures.Future
+            Done when the image has been sent and the display told to show it.
+            result() raises any error of the update.
+        '''
+        return self._submit(self._draw_full, self._get_frame_buf(), mode)
+
+    def draw_partial_async(self, mode, box=None):
+        '''
+        Like draw_partial, but the update is done in a background thread, see
+        draw_full_async
+        '''
+        return self._submit(self._draw_partial, self._get_frame_buf(), mode,
+                            self._display_box(box))
+
+    def draw_commits(self, timeout=None, mode=DisplayModes.GC16):
+        '''
+        Wait up to timeout seconds (forever if None) for other processes to commit
+        changes to the shared frame buffer, and draw them with partial updates. Only
+        the committed rectangles are looked at. Consecutive commits in the same mode
+        are drawn together, and commits without a mode are drawn in mode.
 
-        self.update(frame.tobytes(), (0,0), self.display_dims, mode)
+        Returns
+        -------
 
+        int : how many commits were drawn
+        '''
+        if self.shared_frame is None:
+            raise ValueError('shared_frame was not enabled')
+
+        commits = self.shared_frame.read_commits(timeout)
+        self.wait_async()
+
+        # runs of commits in the same mode, with their boxes merged. None is anywhere
+        runs = []
+        for box, commit_mode in commits:
+            if commit_mode is None:
+                commit_mode = mode
+            if runs and runs[-1][1] == commit_mode:
+                prev_box = runs[-1][0]
+                if prev_box is not None and box is not None:
+                    box = self._merge_bbox(prev_box, box)
+                else:
+                    box = None
+                runs[-1] = (box, commit_mode)
+            else:
+                runs.append((box, commit_mode))
+
+        for box, run_mode in runs:
+            self._draw_partial(self.frame_buf, run_mode, box)
+        return len(commits)
+
+    def wait_async(self):
+        '''
+        Wait until all asynchronous draws are done. Errors are not raised here,
+        but by the futures' result().
+        '''
+        if self._last_draw is not None:
+            wait_futures([self._last_draw])
+
+    def close(self):
+        '''
+        Finish asynchronous draws and stop the worker thread, and close the trace
+        '''
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self.trace is not None:
+            self.trace.close()
+        if self.shared_frame is not None:
+            self.shared_frame.close()
+
+    def _submit(self, draw, frame, mode, *args):
+        '''
+        Queue a draw for the worker thread. Updates are done one at a time in the
+        order they were submitted. Blocks while max_pending_draws draws are already
+        queued or running, so that a caller producing frames faster than the
+        display takes them doesn't pile up copies of the frame buffer.
+        '''
+        self._pending_draws.acquire()
+        try:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1,
+                                                    thread_name_prefix='IT8951-draw')
+            future = self._executor.submit(draw, frame, mode, *args)
+        except BaseException:
+            self._pending_draws.release()
+            raise
+
+        future.add_done_callback(lambda f: self._pending_draws.release())
+        self._last_draw = future
+        return future
+
+    def _draw_full(self, frame, mode):
+        data = frame.tobytes()
+        self._send(data, (0,0), self.display_dims, mode)
+
+        packed = img_manip.pack_4bpp(data, self.display_dims[0])
         if self.track_gray:
             if mode == DisplayModes.DU:
-                diff_box = self._compute_diff_box(self.prev_frame, frame, round_to=8)
-                self.gray_change_bbox = self._merge_bbox(self.gray_change_bbox, diff_box)
+                self._add_gray_debt(self._prev_packed, packed, (0, 0) + self.display_dims)
             else:
-                self.gray_change_bbox = None
+                self._clear_gray_debt()
 
-        self.prev_frame = frame
+        self._prev_packed = packed
 
-    def draw_partial(self, mode):
+    def _draw_partial(self, frame, mode, dirty=None):
         '''
-        Write only the rectangle bounding the pixels of the image that have changed
-        since the last call to draw_full or draw_partial
+        With dirty, a box out of which the frame is known not to have changed, the
+        rest of the frame is neither packed nor compared
         '''
-
-        if self.prev_frame is None:  # first call since initialization
-            self.draw_full(mode)
+        if self._prev_packed is None:  # first call since initialization
+            self._draw_full(frame, mode)
+            return
 
         if mode in low_bpp_modes:
-            round_box = 8
+            # these are usually black/white updates, which can be sent at 1bpp if
+            # they are aligned to 16 pixels (see AutoEPDDisplay.update)
+            round_box = 16
         else:
             round_box = 4
 
-        frame = self._get_frame_buf()
-
-        # compute diff for this frame
-        diff_box = self._compute_diff_box(self.prev_frame, frame, round_to=round_box)
+        # compute diff for this frame. changes only in the low 4 bits of pixels
+        # wouldn't show, so they don't count
+        if dirty is None:
+            search_box = (0, 0) + self.display_dims
+            packed = img_manip.pack_4bpp(frame.tobytes(), self.display_dims[0])
+        else:
+            # whole bytes of the packed frame
+            search_box = self._clip_bbox(self._round_bbox(dirty, round_to=2))
+            packed = self._repack_box(frame, search_box)
+        diff_box = img_manip.diff_box_4bpp(self._prev_packed, packed, self.display_dims[0],
+                                           search_box)
+        if diff_box is not None:
+            diff_box = self._clip_bbox(self._round_bbox(diff_box, round_to=round_box))
 
+        # tiles with black/white intermediates to refresh in grayscale, and the mode
+        cleanup_rects = []
+        cleanup_mode = mode
         if self.track_gray:
-            self.gray_change_bbox = self._merge_bbox(self.gray_change_bbox, diff_box)
-            # reset grayscale changes to zero
-            if mode != DisplayModes.DU:
-                diff_box = self._round_bbox(self.gray_change_bbox, round_to=round_box)
-                self.gray_change_bbox = None
+            if mode == DisplayModes.DU:
+                self._add_gray_debt(self._prev_packed, packed, diff_box)
+                if self.ghosting_threshold is not None:
+                    cleanup_rects = self._take_gray_debt(self.ghosting_threshold)
+                    cleanup_mode = DisplayModes.GC16
+            else:
+                cleanup_rects = [rect for rect in self._take_gray_debt(1)
+                                 if not self._contains(diff_box, rect)]
 
         # if it is, nothing to do
         if diff_box is not None:
@@ -133,14 +362,38 @@ class AutoDisplay:
             # if we are using a black/white only mode, any pixels that changed should be
             # converted to black/white
             if mode == DisplayModes.DU:
-                img_manip.make_changes_bw(frame.crop(diff_box), buf)
+                prev = img_manip.unpack_4bpp(self._prev_packed, self.display_dims[0], diff_box)
+                img_manip.make_changes_bw(Image.frombytes('L', buf.size, bytes(prev)), buf)
 
-            xy = (diff_box[0], diff_box[1])
-            dims = (diff_box[2]-diff_box[0], diff_box[3]-diff_box[1])
+            self._send_box(buf, diff_box, mode)
 
-            self.update(buf.tobytes(), xy, dims, mode)
+        for rect in cleanup_rects:
+            self._send_box(frame.crop(rect), rect, cleanup_mode)
 
-        self.prev_frame = frame
+        self._prev_packed = packed
+
+    def _repack_box(self, frame, box):
+        '''
+        Return a copy of the packed previous frame, with the pixels in box packed
+        from frame. box must start and end on even columns, or at the display edge.
+        '''
+        packed = bytearray(self._prev_packed)
+        if box[2] <= box[0] or box[3] <= box[1]:
+            return packed
+
+        width = box[2] - box[0]
+        rows = img_manip.pack_4bpp(frame.crop(box).tobytes(), width)
+        stride = (self.display_dims[0]+1) // 2
+        row_bytes = (width+1) // 2
+        for i in range(box[3] - box[1]):
+            start = (box[1]+i)*stride + box[0]//2
+            packed[start:start+row_bytes] = rows[i*row_bytes:(i+1)*row_bytes]
+        return packed
+
+    def _send_box(self, buf, box, mode):
+        xy = (box[0], box[1])
+        dims = (box[2]-box[0], box[3]-box[1])
+        self._send(buf.tobytes(), xy, dims, mode)
 
     def clear(self):
         '''
@@ -150,6 +403,84 @@ class AutoDisplay:
         self.frame_buf.paste(0xFF, box=(0, 0, self.width, self.height))
         self.draw_full(DisplayModes.INIT)
 
+    def _tile_box(self, col, row):
+        size = self.gray_tile_size
+        return (col*size, row*size,
+                min((col+1)*size, self.display_dims[0]), min((row+1)*size, self.display_dims[1]))
+
+    def _add_gray_debt(self, prev_packed, packed, box):
+        '''
+        Count a black/white update for the tiles in which pixels differ between
+        the packed frames prev_packed and packed, looking only inside box. With no
+        prev_packed, every tile in box counts as changed.
+        '''
+        if box is None:
+            return
+
+        size = self.gray_tile_size
+        cols = self._gray_tiles[0]
+        for row in range(box[1] // size, -(-box[3] // size)):
+            for col in range(box[0] // size, -(-box[2] // size)):
+                if prev_packed is not None:
+                    tile = self._tile_box(col, row)
+                    # clipped to box
+                    area = (max(tile[0], box[0]), max(tile[1], box[1]),
+                            min(tile[2], box[2]), min(tile[3], box[3]))
+                    if img_manip.diff_box_4bpp(prev_packed, packed, self.display_dims[0],
+                                               area) is None:
+                        continue
+                i = row*cols + col
+                self.gray_debt[i] = min(self.gray_debt[i] + 1, 0xFF)
+
+    def _clear_gray_debt(self):
+        self.gray_debt[:] = bytes(len(self.gray_debt))
+
+    def _take_gray_debt(self, threshold):
+        '''
+        Reset the tiles that have had at least threshold black/white updates, and
+        return them as a list of rectangles. Adjacent tiles are merged into runs
+        along rows, and runs spanning the same columns in consecutive rows into
+        one rectangle.
+        '''
+        cols, rows = self._gray_tiles
+        rects = []
+        # runs of the previous row, by (first col, last col), to rect index
+        prev_runs = {}
+        for row in range(rows):
+            runs = {}
+            col = 0
+            while col < cols:
+                if self.gray_debt[row*cols + col] < threshold:
+                    col += 1
+                    continue
+
+                start = col
+                while col < cols and self.gray_debt[row*cols + col] >= threshold:
+                    self.gray_debt[row*cols + col] = 0
+                    col += 1
+
+                box = self._merge_bbox(self._tile_box(start, row), self._tile_box(col-1, row))
+                key = (start, col)
+                if key in prev_runs:
+                    i = prev_runs[key]
+                    rects[i] = self._merge_bbox(rects[i], box)
+                else:
+                    i = len(rects)
+                    rects.append(box)
+                runs[key] = i
+            prev_runs = runs
+        return rects
+
+    @staticmethod
+    def _contains(outer, inner):
+        '''
+        Whether bbox outer contains bbox inner
+        '''
+        if outer is None:
+            return False
+        return (outer[0] <= inner[0] and outer[1] <= inner[1] and
+                outer[2] >= inner[2] and outer[3] >= inner[3])
+
     @classmethod
     def _compute_diff_box(cls, a, b, round_to=2):
         '''
@@ -185,6 +516,13 @@ class AutoDisplay:
         maxy += round_to-1 - (maxy-1)%round_to
         return (minx, miny, maxx, maxy)
 
+    def _clip_bbox(self, box):
+        '''
+        Clip a bounding box to the display
+        '''
+        return (max(box[0], 0), max(box[1], 0),
+                min(box[2], self.display_dims[0]), min(box[3], self.display_dims[1]))
+
     @staticmethod
     def _merge_bbox(a, b):
         '''
@@ -202,6 +540,19 @@ class AutoDisplay:
         maxy = max(a[3], b[3])
         return (minx, miny, maxx, maxy)
 
+    def _send(self, data, xy, dims, mode):
+        '''
+        Call update, recording it if tracing
+        '''
+        if self.trace is None:
+            self.update(data, xy, dims, mode)
+            return
+
+        start = time()
+        t = perf_counter()
+        self.update(data, xy, dims, mode)
+        self.trace.record(start, perf_counter() - t, data, xy, dims, mode)
+
     def update(self, data, xy, dims, mode):
         raise NotImplementedError
 
@@ -209,11 +560,26 @@ class AutoDisplay:
 class AutoEPDDisplay(AutoDisplay):
     '''
     This class initializes the EPD, and uses it to display the updates
+
+    While asynchronous draws are pending, the worker thread owns the EPD: call
+    wait_async() before using self.epd directly
+
+    With restore_frame, a map of where each area of the displayed image is stored
+    in device memory is kept in device memory too (see block_map.py), and the
+    displayed image is read back from the controller at startup, if it has kept
+    its memory. Partial updates then continue from what is on the panel, instead
+    of starting with a full update.
+
+    With idle_timeout, the controller is put into idle_state (standby or sleep)
+    after that many seconds without updates, and woken up for the next one (see
+    power.py). Both are ignored if an epd is passed in.
     '''
 
     def __init__(self, epd=None, vcom=-2.06,
-                 bus=0, device=0, spi_hz=24000000,
-                 **kwargs):
+                 bus=0, device=0, spi_hz=24000000, calibration_path=None,
+                 preload_slots=4, allow_1bpp=True, restore_frame=False,
+                 hrdy_pin=Pins.HRDY, reset_pin=Pins.RESET,
+                 idle_timeout=None, idle_state=PowerStates.STANDBY, **kwargs):
 
         if epd is None:
             if EPD is None:
@@ -221,11 +587,97 @@ class AutoEPDDisplay(AutoDisplay):
                                    'backend with "pip install ./" or "python setup.py '
                                    'build_ext --inplace"?')
 
-            epd = EPD(vcom=vcom, bus=bus, device=device, data_hz=spi_hz)
+            epd = EPD(vcom=vcom, bus=bus, device=device, data_hz=spi_hz,
+                      calibration_path=calibration_path,
+                      hrdy_pin=hrdy_pin, reset_pin=reset_pin,
+                      idle_timeout=idle_timeout, idle_state=idle_state)
 
         self.epd = epd
         AutoDisplay.__init__(self, self.epd.width, self.epd.height, **kwargs)
 
+        # frames uploaded ahead of time into spare device memory, see preload()
+        self.preload_slots = preload_slots
+        self.preloaded = {}
+
+        # send areas that are pure black/white at 1bpp instead of 4bpp. they are
+        # loaded into the frame slot after the preload slots, so that the packed
+        # bits don't overwrite the image buffer
+        self.allow_1bpp = allow_1bpp
+        self._1bpp_address = self.epd.frame_slot_address(preload_slots)
+
+        # the block map goes in the slot after that
+        self.block_map = None
+        if restore_frame:
+            self.block_map = BlockMap(self.epd, self.epd.frame_slot_address(preload_slots+1))
+            self.restore_prev_frame()
+
+    def close(self):
+        '''
+        Like AutoDisplay.close, and also stop the EPD's idle thread, if any
+        '''
+        AutoDisplay.close(self)
+        self.epd.power.close()
+
+    def restore_prev_frame(self):
+        '''
+        Set prev_frame and frame_buf to the image on the panel, read back from device
+        memory. Needs restore_frame. Returns False, leaving them as they were, if
+        device memory doesn't tell what is displayed; e.g. the controller was power
+        cycled, or parts of the image were shown from preloaded frames.
+
+        Pixels loaded at 4bpp come back with the low 4 bits cleared, so the next
+        partial update also resends pixels whose values differ only in those bits.
+        '''
+        if self.block_map is None:
+            raise ValueError('restore_frame was not enabled')
+
+        self.wait_async()
+        self.epd.wait_display_ready()
+        if not self.block_map.read() or UNKNOWN in self.block_map.blocks:
+            return False
+
+        pixels = self.epd.read_img_area((0, 0), self.display_dims)
+        frame = Image.frombytes('L', self.display_dims, bytes(pixels))
+
+        # black/white areas sent at 1bpp, read a row of adjacent blocks at a time
+        bw_boxes = []
+        for i, location in enumerate(self.block_map.blocks):
+            if location != IN_1BPP_BUF:
+                continue
+            box = self.block_map.block_box(i)
+            if bw_boxes and bw_boxes[-1][2] == box[0] and bw_boxes[-1][1] == box[1]:
+                bw_boxes[-1] = self._merge_bbox(bw_boxes[-1], box)
+            else:
+                bw_boxes.append(box)
+
+        for box in bw_boxes:
+            dims = (box[2]-box[0], box[3]-box[1])
+            bw = self.epd.read_img_area_1bpp(box[:2], dims, address=self._1bpp_address)
+            frame.paste(Image.frombytes('L', dims, bytes(bw)), box[:2])
+
+        self.prev_frame = frame
+        inverse = {
+            Image.Transpose.ROTATE_270: Image.Transpose.ROTATE_90,
+            Image.Transpose.ROTATE_90: Image.Transpose.ROTATE_270,
+        }.get(self._rotate_method, self._rotate_method)
+        self.frame_buf.paste(frame if inverse is None else frame.transpose(inverse))
+
+        if self.track_gray:
+            # black/white areas were most likely drawn with DU
+            self._clear_gray_debt()
+            for box in bw_boxes:
+                self._add_gray_debt(None, None, box)
+
+        return True
+
+    def _fits_blocks(self, xy, dims):
+        '''
+        Whether the area covers whole blocks of the block map vertically (1bpp areas
+        are aligned horizontally anyway)
+        '''
+        bottom = xy[1] + dims[1]
+        return xy[1] % 16 == 0 and (bottom % 16 == 0 or bottom == self.display_dims[1])
+
     def update(self, data, xy, dims, mode, pixel_format=PixelModes.M_4BPP):
 
         # these modes only use two pixels, so use a more dense packing for them
@@ -235,21 +687,118 @@ class AutoEPDDisplay(AutoDisplay):
         # else:
         #     pixel_format = PixelModes.M_4BPP
 
-        # send image to controller
+        self.epd.wait_display_ready()
+
+        use_1bpp = (self.allow_1bpp and pixel_format == PixelModes.M_4BPP
+                    and xy[0] % 16 == 0 and dims[0] % 16 == 0
+                    and (self.block_map is None or self._fits_blocks(xy, dims))
+                    and img_manip.is_bw(data))
+
+        if self.block_map is not None:
+            # if we're interrupted while loading, the blocks can't be trusted
+            changes = self.block_map.plan(xy, dims, IN_1BPP_BUF if use_1bpp else IN_IMG_BUF)
+            self.block_map.apply(changes, UNKNOWN)
+
+        if use_1bpp:
+            self.epd.load_img_area_1bpp(data, xy, dims, address=self._1bpp_address)
+            self.epd.display_area_1bpp(xy, dims, mode, address=self._1bpp_address)
+        else:
+            # send image to controller
+            self.epd.load_img_area(
+                data,
+                xy=xy,
+                dims=dims,
+                pixel_format=pixel_format
+            )
+
+            # display sent image
+            self.epd.display_area(
+                xy,
+                dims,
+                mode
+            )
+
+        if self.block_map is not None:
+            self.block_map.apply(changes)
+
+    def preload(self, key, img=None):
+        '''
+        Upload an image into a spare frame buffer of the device, without displaying it.
+        It can later be shown with display_preloaded(key), which only sends a command
+        instead of the whole image. Useful for e.g. error screens, which should show up
+        as fast as possible. Only the 4 bits per pixel the display shows are kept in
+        memory (see prev_frame).
+
+        Parameters
+        ----------
+
+        key : hashable
+            A name for the image. Preloading the same key again replaces the image.
+
+        img : PIL.Image, optional
+            An image with the dimensions of frame_buf. Defaults to frame_buf itself.
+        '''
+        if img is None:
+            img = self.frame_buf
+        if img.size != self.frame_buf.size:
+            raise ValueError('image dimensions do not match the frame buffer')
+
+        if key in self.preloaded:
+            slot = self.preloaded[key][0]
+        else:
+            used = {slot for slot, _ in self.preloaded.values()}
+            free = [slot for slot in range(self.preload_slots) if slot not in used]
+            if not free:
+                raise ValueError('all {} preload slots are in use'.format(self.preload_slots))
+            slot = free[0]
+
+        img = img.convert('L')
+        frame = img if self._rotate_method is None else img.transpose(self._rotate_method)
+
+        # the device is not shared with the async draw worker
+        self.wait_async()
         self.epd.wait_display_ready()
         self.epd.load_img_area(
-            data,
-            xy=xy,
-            dims=dims,
-            pixel_format=pixel_format
+            frame.tobytes(),
+            xy=(0, 0),
+            dims=self.display_dims,
+            address=self.epd.frame_slot_address(slot),
         )
 
-        # display sent image
-        self.epd.display_area(
-            xy,
-            dims,
-            mode
-        )
+        self.preloaded[key] = (slot, img_manip.pack_4bpp(frame.tobytes(), self.display_dims[0]))
+
+    def display_preloaded(self, key, mode=DisplayModes.GC16):
+        '''
+        Display an image that was uploaded earlier with preload(key). The frame buffer is
+        set to that image too, as the display shows it (with the low 4 bits of each pixel
+        zero), so later partial updates are computed against it.
+        '''
+        slot, packed = self.preloaded[key]
+
+        self.wait_async()
+        self.epd.wait_display_ready()
+        self.epd.display_area_buf((0, 0), self.display_dims, mode,
+                                  self.epd.frame_slot_address(slot))
+        if self.block_map is not None:
+            # the image buffer doesn't have what is displayed anymore
+            self.block_map.mark_all(UNKNOWN)
+
+        self._prev_packed = packed
+        frame = self.prev_frame
+        if self._rotate_method is not None:
+            frame = frame.transpose(self._inverse_rotate_method)
+        self.frame_buf.paste(frame)
+        if self.track_gray:
+            if mode == DisplayModes.DU:
+                self._add_gray_debt(None, None, (0, 0) + self.display_dims)
+            else:
+                self._clear_gray_debt()
+
+    def discard_preloaded(self, key):
+        '''
+        Free the slot used by a preloaded image
+        '''
+        del self.preloaded[key]
 
 
 class VirtualEPDDisplay(AutoDisplay):
@@ -0,0 +1,244 @@
+'''
+A pure Python stand-in for the SPI class in spi.pyx, which emulates enough of the
+IT8951 controller to exercise EPD without any hardware attached. Pass an instance
+as the spi argument of EPD.
+
+The emulator can also be told the highest SPI clocks at which the "wiring" still
+works; above those, words moving over the bus get corrupted, just like a real
+panel with long cables would. This is what makes EPD.calibrate_spi testable.
+'''
+
+from . import img_manip
+from .constants import Commands, Registers
+
+
+class EmulatedSPI:
+    '''
+    Emulates the IT8951 controller behind the interface of the SPI class.
+
+    Parameters
+    ----------
+
+    width, height : int
+        Dimensions of the emulated panel
+
+    img_buf_address : int
+        Address of the image buffer reported by GET_DEV_INFO
+
+    frames : int
+        How many full 8bpp frames of memory to provide after the image buffer
+
+    max_cmd_hz, max_data_hz : int, optional
+        The highest command/data clocks that transfer reliably. If omitted, any
+        clock works.
+    '''
+
+    def __init__(self, width=1872, height=1404, img_buf_address=0x119F00, frames=8,
+                 firmware_version='emulated', lut_version='emulated',
+                 max_cmd_hz=None, max_data_hz=None,
+                 cmd_hz=1000000, data_hz=24000000, max_block_size=4096):
+
+        self.width = width
+        self.height = height
+        self.img_buf_address = img_buf_address
+        self.firmware_version = firmware_version
+        self.lut_version = lut_version
+
+        self.max_cmd_hz = max_cmd_hz
+        self.max_data_hz = max_data_hz
+        self.cmd_hz = cmd_hz
+        self.data_hz = data_hz
+        self.max_block_size = max_block_size
+
+        self.memory = bytearray(img_buf_address + (frames+1)*width*height)
+        self.panel = bytearray([0xFF]*(width*height))
+        self.registers = {}
+        self.vcom = 0
+        # SYS_RUN, STANDBY or SLEEP, whichever was sent last
+        self.power_state = Commands.SYS_RUN
+
+        # a log of (command, args) of everything that was sent, for tests to inspect
+        self.commands = []
+
+        self._cmd = None
+        self._args = []
+        self._expected_args = 0
+        self._read_queue = []
+        self._img_area = None
+        self._burst = None
+
+    ##### helpers
+
+    def _corrupt(self, word, hz, max_hz):
+        if max_hz is not None and hz > max_hz:
+            return word ^ 0x0001
+        return word
+
+    def _word(self, address):
+        return self.memory[address] | (self.memory[address+1] << 8)
+
+    def _set_word(self, address, word):
+        self.memory[address] = word & 0xFF
+        self.memory[address+1] = word >> 8
+
+    def _reg_address(self, address):
+        return (self.registers.get(address+2, 0) << 16) | self.registers.get(address, 0)
+
+    ##### the interface of SPI
+
+    def wait_ready(self):
+        pass
+
+    def write_cmd(self, cmd, *args):
+        cmd = self._corrupt(cmd, self.cmd_hz, self.max_cmd_hz)
+        if self.power_state != Commands.SYS_RUN and cmd != Commands.SYS_RUN:
+            # catch commands sent without waking the controller up first
+            raise RuntimeError('command 0x{:x} sent while the controller is not running'.format(cmd))
+        self._cmd = cmd
+        self._args = []
+        self._expected_args = {
+            Commands.REG_RD       : 1,
+            Commands.REG_WR       : 2,
+            Commands.MEM_BST_RD_T : 4,
+            Commands.MEM_BST_WR   : 4,
+            Commands.LD_IMG       : 1,
+            Commands.LD_IMG_AREA  : 5,
+            Commands.DPY_AREA     : 5,
+            Commands.DPY_BUF_AREA : 7,
+        }.get(cmd, 0)
+
+        if cmd == Commands.VCOM:
+            # VCOM has one argument for reads and two for writes
+            self._expected_args = 1
+
+        if self._expected_args == 0:
+            self._execute()
+
+        for arg in args:
+            self.write_data([arg])
+
+    def write_data(self, ary):
+        for word in ary:
+            word = self._corrupt(word, self.cmd_hz, self.max_cmd_hz)
+
+            if self._burst is not None and self._burst['write']:
+                self._set_word(self._burst['address'], word)
+                self._burst['address'] += 2
+                continue
+
+            self._args.append(word)
+            if len(self._args) == self._expected_args:
+                if self._cmd == Commands.VCOM and self._args == [1]:
+                    self._expected_args = 2
+                    continue
+                self._execute()
+
+    def read_data(self, n):
+        rtn = []
+        for _ in range(n):
+            if self._burst is not None and not self._burst['write']:
+                word = self._word(self._burst['address'])
+                self._burst['address'] += 2
+            elif self._read_queue:
+                word = self._read_queue.pop(0)
+            else:
+                word = 0
+            rtn.append(self._corrupt(word, self.cmd_hz, self.max_cmd_hz))
+        return rtn
+
+    def read_data_into(self, out):
+        for i, word in enumerate(self.read_data(len(out))):
+            out[i] = word
+
+    def read_int(self):
+        return self.read_data(1)[0]
+
+    def pack_and_write_pixels(self, pixbuf, bpp, lut=None, width=0, mirror=False):
+        if self._img_area is None:
+            # like the real controller, ignore pixels that arrive out of place
+            return
+
+        # unpack what the real packer would send, so that its transforms are covered too
+        packed = img_manip.pack_pixels(pixbuf, bpp, lut=lut, width=width, mirror=mirror)
+        pix_per_byte = 8 // bpp
+        mask = (1 << bpp) - 1
+
+        corrupt = self.max_data_hz is not None and self.data_hz > self.max_data_hz
+        base, x, y, w, h = self._img_area
+        for i in range(min(len(pixbuf), w*h)):
+            shift = 8 - bpp*(i % pix_per_byte + 1)
+            val = ((packed[i // pix_per_byte] >> shift) & mask) << (8-bpp)
+            if corrupt and i % 2:
+                val ^= 0x01
+            self.memory[base + (y + i//w)*self.width + x + i%w] = val
+
+    ##### command execution
+
+    def _execute(self):
+        cmd, args = self._cmd, self._args
+        self.commands.append((cmd, tuple(args)))
+        self._cmd = None
+        self._args = []
+
+        if cmd in (Commands.SYS_RUN, Commands.STANDBY, Commands.SLEEP):
+            self.power_state = cmd
+
+        elif cmd == Commands.GET_DEV_INFO:
+            data = [self.width, self.height,
+                    self.img_buf_address & 0xFFFF, self.img_buf_address >> 16]
+            for version in (self.firmware_version, self.lut_version):
+                version = version.encode('ascii')[:16].ljust(16, b'\0')
+                data += [(version[i] << 8) | version[i+1] for i in range(0, 16, 2)]
+            self._read_queue = data
+
+        elif cmd == Commands.REG_RD:
+            self._read_queue = [self.registers.get(args[0], 0)]
+
+        elif cmd == Commands.REG_WR:
+            self.registers[args[0]] = args[1]
+
+        elif cmd == Commands.VCOM:
+            if args[0] == 0:
+                self._read_queue = [self.vcom]
+            else:
+                self.vcom = args[1]
+
+        elif cmd in (Commands.MEM_BST_RD_T, Commands.MEM_BST_WR):
+            address = args[0] | (args[1] << 16)
+            self._burst = {
+                'address': address,
+                'write': cmd == Commands.MEM_BST_WR,
+            }
+
+        elif cmd == Commands.MEM_BST_END:
+            self._burst = None
+
+        elif cmd == Commands.LD_IMG:
+            self._img_area = (self._reg_address(Registers.LISAR), 0, 0, self.width, self.height)
+
+        elif cmd == Commands.LD_IMG_AREA:
+            self._img_area = (self._reg_address(Registers.LISAR),) + tuple(args[1:5])
+
+        elif cmd == Commands.LD_IMG_END:
+            self._img_area = None
+
+        elif cmd == Commands.DPY_AREA:
+            self._display(self.img_buf_address, *args[:4])
+
+        elif cmd == Commands.DPY_BUF_AREA:
+            self._display(args[5] | (args[6] << 16), *args[:4])
+
+    def _display(self, base, x, y, w, h):
+        if self.registers.get(Registers.UP1SR+2, 0) & (1<<2):
+            # 1bpp mode: each byte of a row holds 8 pixels, least significant bit first
+            color_table = self.registers.get(Registers.BGVR, 0)
+            zero_gray, one_gray = color_table >> 8, color_table & 0xFF
+            for row in range(y, y+h):
+                for col in range(x, x+w):
+                    bit = (self.memory[base + row*self.width + col//8] >> (col % 8)) & 1
+                    self.panel[row*self.width + col] = one_gray if bit else zero_gray
+            return
+
+        for row in range(y, y+h):
+            start = row*self.width + x
+            self.panel[start:start+w] = self.memory[base+start:base+start+w]
@@ -0,0 +1,5 @@
+# declarations for cimporting from other modules of the package (see spi.pyx)
+
+cdef Py_ssize_t pack_pixels_into(const unsigned char [:] pixbuf, Py_ssize_t start, Py_ssize_t count,
+                                 int bpp, const unsigned char [:] lut, int mirror_width,
+                                 unsigned char [:] out, Py_ssize_t out_start) nogil
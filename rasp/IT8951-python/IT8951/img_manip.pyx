@@ -12,6 +12,7 @@ cimport cython
 def make_changes_bw(prev_frame, new_frame):
     '''
     Take any pixels that have changed and map them from grayscale to black/white.
+    Only the 4 bits of each pixel the display shows are compared.
     '''
 
     if prev_frame.size != new_frame.size:
@@ -30,6 +31,217 @@ def make_changes_bw(prev_frame, new_frame):
     cdef unsigned char* new_buf = (<unsigned char**>new_ptr)[0]
 
     cdef int i
-    for i in range(len(prev_buf)):
-        if prev_buf[i] != new_buf[i]:
-            new_buf[i] = 0xF0 if new_buf[i] > 0xB0 else 0x00
+    cdef int n = len(prev_buf)
+    with nogil:
+        for i in range(n):
+            if (prev_buf[i] ^ new_buf[i]) & 0xF0:
+                new_buf[i] = 0xF0 if new_buf[i] > 0xB0 else 0x00
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def is_bw(const unsigned char [:] buf):
+    '''
+    Return whether every pixel of buf is black or white once reduced to 4 bits, so
+    that the buffer can be sent as 1bpp without any loss.
+    '''
+    cdef Py_ssize_t i
+    cdef unsigned char level
+    cdef bint rtn = True
+    with nogil:
+        for i in range(buf.shape[0]):
+            level = buf[i] >> 4
+            if level != 0x0 and level != 0xF:
+                rtn = False
+                break
+    return rtn
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pack_1bpp(const unsigned char [:] buf):
+    '''
+    Pack pixels into bits, 8 pixels per byte with the leftmost pixel in the least
+    significant bit (the layout the IT8951 expects in 1bpp mode). Pixels of 0x80 and
+    above become 1.
+    '''
+    cdef Py_ssize_t n = buf.shape[0]
+    packed = bytearray((n+7)//8)
+    cdef unsigned char [:] out = packed
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(n):
+            out[i >> 3] |= (buf[i] >> 7) << (i & 7)
+    return bytes(packed)
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pack_4bpp(const unsigned char [:] buf, int width):
+    '''
+    Pack rows of pixels width wide into 4 bits per pixel, two pixels per byte with
+    the leftmost in the high nibble. Each row starts on a new byte. The low 4 bits
+    of the pixels, which the display doesn't show, are dropped.
+    '''
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef int height = n // width
+    cdef int stride = (width+1) // 2
+    packed = bytearray(stride*height)
+    cdef unsigned char [:] out = packed
+    cdef int x, y
+    cdef Py_ssize_t row_in, row_out
+    with nogil:
+        for y in range(height):
+            row_in = <Py_ssize_t>y*width
+            row_out = <Py_ssize_t>y*stride
+            for x in range(0, width-1, 2):
+                out[row_out + x//2] = (buf[row_in+x] & 0xF0) | (buf[row_in+x+1] >> 4)
+            if width & 1:
+                out[row_out + stride-1] = buf[row_in+width-1] & 0xF0
+    return packed
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def unpack_4bpp(const unsigned char [:] packed, int width, box):
+    '''
+    Unpack the area box = (minx, miny, maxx, maxy) of pixels packed by pack_4bpp
+    into 1 byte per pixel, as the display shows them (the low 4 bits are zero)
+    '''
+    cdef int x0 = box[0], y0 = box[1], x1 = box[2], y1 = box[3]
+    cdef int stride = (width+1) // 2
+    cdef int w = x1 - x0
+    pixels = bytearray(w*(y1-y0))
+    cdef unsigned char [:] out = pixels
+    cdef int x, y
+    cdef unsigned char b
+    with nogil:
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                b = packed[<Py_ssize_t>y*stride + x//2]
+                out[<Py_ssize_t>(y-y0)*w + x-x0] = (b & 0xF0) if x % 2 == 0 else (b << 4)
+    return pixels
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def diff_box_4bpp(const unsigned char [:] a, const unsigned char [:] b, int width, box):
+    '''
+    Find the bounding box (minx, miny, maxx, maxy) of the pixels inside box that
+    differ between two frames packed by pack_4bpp, or None if none do
+    '''
+    if a.shape[0] != b.shape[0]:
+        raise ValueError('packed frames have different sizes')
+
+    cdef int x0 = box[0], y0 = box[1], x1 = box[2], y1 = box[3]
+    cdef int stride = (width+1) // 2
+    cdef int minx = x1, miny = y1, maxx = -1, maxy = -1
+    cdef int x, y
+    cdef Py_ssize_t row
+    cdef unsigned char d
+    with nogil:
+        for y in range(y0, y1):
+            row = <Py_ssize_t>y*stride
+            # leftmost difference in this row
+            for x in range(x0, x1):
+                d = a[row + x//2] ^ b[row + x//2]
+                if (d & 0xF0 if x % 2 == 0 else d & 0x0F):
+                    break
+            else:
+                continue
+
+            if x < minx:
+                minx = x
+            if y < miny:
+                miny = y
+            maxy = y
+
+            # rightmost, scanning only the part not already known to be inside
+            x = x1 - 1
+            while x > maxx and x >= minx:
+                d = a[row + x//2] ^ b[row + x//2]
+                if (d & 0xF0 if x % 2 == 0 else d & 0x0F):
+                    maxx = x
+                    break
+                x -= 1
+
+    if maxy < 0:
+        return None
+    return (minx, miny, maxx+1, maxy+1)
+
+# the transform table that leaves pixels as they are
+IDENTITY_LUT = bytes(range(256))
+
+def transform_args(Py_ssize_t n, lut, int width, bint mirror):
+    '''
+    Check the transform options of pack_pixels for a buffer of n pixels, and return
+    them as (lut, mirror_width) for pack_pixels_into
+    '''
+    if lut is None:
+        lut = IDENTITY_LUT
+    elif len(lut) != 256:
+        raise ValueError('transform table must have 256 entries')
+
+    if not mirror:
+        return lut, 0
+    if width <= 0 or n % width:
+        raise ValueError('mirroring needs the width of the rows in the buffer')
+    return lut, width
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+@cython.cdivision(True)
+cdef Py_ssize_t pack_pixels_into(const unsigned char [:] pixbuf, Py_ssize_t start, Py_ssize_t count,
+                                 int bpp, const unsigned char [:] lut, int mirror_width,
+                                 unsigned char [:] out, Py_ssize_t out_start) nogil:
+    '''
+    Pack count pixels of pixbuf starting at start into out[out_start:], and return
+    the number of bytes written, which is rounded up to full 16-bit words. Each pixel
+    is looked up in lut on the way. If mirror_width is nonzero, pixbuf is rows of
+    that many pixels, which are taken from right to left.
+    '''
+    cdef int pix_per_byte = 8 // bpp
+    cdef Py_ssize_t nbytes = 2*((count + 2*pix_per_byte - 1) // (2*pix_per_byte))
+    cdef Py_ssize_t end = start + count
+    cdef Py_ssize_t pix_idx = start, src = start, row_start = 0
+    cdef Py_ssize_t byte_idx
+    cdef int i, t, col = 0
+
+    if mirror_width:
+        col = start % mirror_width
+        row_start = start - col
+
+    for byte_idx in range(nbytes):
+        t = 0
+        for i in range(pix_per_byte):
+            t <<= bpp
+            # the padding up to a full word is left zero
+            if pix_idx < end:
+                if mirror_width:
+                    src = row_start + mirror_width-1 - col
+                    col += 1
+                    if col == mirror_width:
+                        col = 0
+                        row_start += mirror_width
+                else:
+                    src = pix_idx
+                t |= lut[pixbuf[src]] >> (8-bpp)
+            pix_idx += 1
+        out[out_start + byte_idx] = t
+
+    return nbytes
+
+def pack_pixels(const unsigned char [:] buf, int bpp, lut=None, int width=0, bint mirror=False):
+    '''
+    Pack pixels into bytes the way SPI.pack_and_write_pixels sends them, bpp bits per
+    pixel with the leftmost in the high bits, padded to a full 16-bit word.
+
+    lut is an optional table of 256 values that each pixel is mapped through before
+    it's packed, e.g. a gamma curve or an inversion. With mirror, each row of width
+    pixels is packed from right to left. Both come at no extra pass over the pixels.
+    '''
+    lut, mirror_width = transform_args(buf.shape[0], lut, width, mirror)
+    cdef const unsigned char [:] lut_view = lut
+    cdef int pix_per_word = 16 // bpp
+    packed = bytearray(2*((buf.shape[0] + pix_per_word - 1) // pix_per_word))
+    cdef unsigned char [:] out = packed
+    cdef int mw = mirror_width
+    with nogil:
+        pack_pixels_into(buf, 0, buf.shape[0], bpp, lut_view, mw, out, 0)
+    return packed
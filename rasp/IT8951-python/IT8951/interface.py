@@ -1,10 +1,30 @@
 
-from . import constants
-from .constants import Commands, Registers, PixelModes
-from .spi import SPI
-
+from . import constants, calibration, img_manip
+from .constants import Commands, Registers, PixelModes, PowerStates
+from .power import PowerManager
+
+try:
+    from .spi import SPI
+except ModuleNotFoundError:  # e.g. RPi.GPIO missing; only emulated backends will work
+    SPI = None
+
+import sys
+import functools
+from array import array
+from random import Random
 from time import sleep
 
+def _operation(method):
+    '''
+    Keep the controller running for the whole of method, so that it isn't put
+    into standby between the commands and data it sends (see PowerManager.in_use)
+    '''
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.power.in_use():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class EPD:
     '''
     An interface to the electronic paper display (EPD).
@@ -16,14 +36,46 @@ class EPD:
          The VCOM voltage that produces optimal display. Varies from
          device to device.
 
+    spi : SPI, optional
+         An already constructed SPI backend (or an emulator.EmulatedSPI). If
+         omitted, one is created from spi_kwargs.
+
+    calibration_path : str, optional
+         A file written by EPD.calibrate_spi. If it has an entry for this device,
+         the calibrated SPI clocks are used.
+
+    idle_timeout : float, optional
+         Put the controller into idle_state after this many seconds without
+         commands. It's woken up again before the next command. See power.py.
+
+    idle_state : PowerStates, optional
+         STANDBY (the default) or SLEEP
+
     **spi_kwargs
          Extra arguments will be passed to the SPI class's initialization.
          See spi.pyx for details.
     '''
 
-    def __init__(self, vcom=-1.5, **spi_kwargs):
+    def __init__(self, vcom=-1.5, spi=None, calibration_path=None,
+                 idle_timeout=None, idle_state=PowerStates.STANDBY, **spi_kwargs):
+
+        if spi is None:
+            if SPI is None:
+                raise RuntimeError('Problem importing the SPI backend. Is RPi.GPIO installed?')
+            spi = SPI(**spi_kwargs)
+        self.spi = spi
+
+        # every command goes through self.power, see _write_cmd
+        self.power = PowerManager(self, idle_timeout, idle_state)
 
-        self.spi = SPI(**spi_kwargs)
+        self.spi_location = (spi_kwargs.get('bus', 0), spi_kwargs.get('device', 0))
+
+        # shadow copy of the registers written or read by this process, see read_register
+        self._registers = {}
+        self._vcom_int = None
+
+        # preallocated, so that reading the system info doesn't allocate
+        self._dev_info_buf = array('H', bytes(2*20))
 
         self.width            = None
         self.height           = None
@@ -39,7 +91,14 @@ class EPD:
 
         self.set_vcom(vcom)
 
-    def load_img_area(self, buf, rotate_mode=constants.Rotate.NONE, xy=None, dims=None, pixel_format=None):
+        if calibration_path is not None:
+            clocks = calibration.load(calibration_path, calibration.device_key(self))
+            if clocks is not None:
+                self.spi.cmd_hz, self.spi.data_hz = clocks
+
+    @_operation
+    def load_img_area(self, buf, rotate_mode=constants.Rotate.NONE, xy=None, dims=None, pixel_format=None,
+                      address=None, lut=None, mirror=False):
         '''
         Write the pixel data in buf (an array of bytes, 1 per pixel) to device memory.
         This function does not actually display the image (see EPD.display_area).
@@ -60,18 +119,29 @@ class EPD:
         dims : (int, int), optional
             The dimensions of the area being pasted. If xy is omitted (or set to None), the
             dimensions are assumed to be the dimensions of the display area.
+
+        address : int, optional
+            Load into the buffer at this address of device memory instead of the image
+            buffer (see EPD.frame_slot_address and EPD.display_area_buf)
+
+        lut : bytes, optional
+            A table of 256 values that each pixel is mapped through while it's packed,
+            e.g. a gamma or contrast curve, or an inversion
+
+        mirror : bool, optional
+            Load each row of buf from right to left, i.e. flipped horizontally. Like lut,
+            this costs no extra pass over the pixels.
         '''
 
         endian_type = constants.EndianTypes.BIG
 
+        # check the transform before the controller is waiting for pixels
+        width = self.width if xy is None else dims[0]
+        img_manip.transform_args(len(buf), lut, width, mirror)
+
         if pixel_format is None:
             pixel_format = constants.PixelModes.M_4BPP
 
-        if xy is None:
-            self._load_img_start(endian_type, pixel_format, rotate_mode)
-        else:
-            self._load_img_area_start(endian_type, pixel_format, rotate_mode, xy, dims)
-
         try:
             bpp = {
                 PixelModes.M_2BPP : 2,
@@ -81,23 +151,170 @@ class EPD:
         except KeyError:
             raise ValueError("invalid pixel format") from None
 
-        self.spi.pack_and_write_pixels(buf, bpp)
+        if address is not None:
+            self._set_img_buf_base_addr(address)
 
-        self._load_img_end()
+        # later loads and updates must go to the image buffer again, even if this fails
+        try:
+            if xy is None:
+                self._load_img_start(endian_type, pixel_format, rotate_mode)
+            else:
+                self._load_img_area_start(endian_type, pixel_format, rotate_mode, xy, dims)
 
+            self.spi.pack_and_write_pixels(buf, bpp, lut=lut, width=width, mirror=mirror)
+
+            self._load_img_end()
+        finally:
+            if address is not None:
+                self._set_img_buf_base_addr(self.img_buf_address)
+
+    @_operation
     def display_area(self, xy, dims, display_mode):
         '''
         Update a portion of the display to whatever is currently stored in device memory
         for that region. Updated data can be written to device memory using EPD.write_img_area
         '''
-        self.spi.write_cmd(Commands.DPY_AREA, xy[0], xy[1], dims[0], dims[1], display_mode)
+        self._write_cmd(Commands.DPY_AREA, xy[0], xy[1], dims[0], dims[1], display_mode)
+
+    @_operation
+    def load_img_area_1bpp(self, buf, xy, dims, address=None):
+        '''
+        Write pixel data (1 byte per pixel, as for EPD.load_img_area) to device memory
+        as 1 bit per pixel, to be displayed with EPD.display_area_1bpp. Pixels of 0x80
+        and above are set, the rest cleared.
+
+        The controller has no 1bpp load format: the bits are loaded as 8bpp pixels, 8
+        panel pixels each, so the x coordinate and the width must be multiples of 16
+        (one 16-bit word).
+        '''
+        if xy[0] % 16 or dims[0] % 16:
+            raise ValueError('1bpp areas must be aligned to 16 pixels horizontally')
+
+        self.load_img_area(
+            img_manip.pack_1bpp(buf),
+            xy=(xy[0]//8, xy[1]),
+            dims=(dims[0]//8, dims[1]),
+            pixel_format=PixelModes.M_8BPP,
+            address=address,
+        )
+
+    @_operation
+    def display_area_1bpp(self, xy, dims, display_mode, zero_gray=0x00, one_gray=0xF0, address=None):
+        '''
+        Display an area loaded with EPD.load_img_area_1bpp. Cleared bits are shown as
+        zero_gray and set bits as one_gray.
+
+        The controller is switched to 1bpp mode for the duration of the update, so this
+        waits for the update to finish before returning.
+        '''
+        # set display to 1bpp mode
+        up1sr = self.read_register(Registers.UP1SR+2)
+        self.write_register(Registers.UP1SR+2, up1sr | (1<<2))
+
+        # set color table
+        self.write_register(Registers.BGVR, (zero_gray << 8) | one_gray)
+
+        try:
+            if address is None:
+                self.display_area(xy, dims, display_mode)
+            else:
+                self.display_area_buf(xy, dims, display_mode, address)
+            self.wait_display_ready()
+        finally:
+            # back to normal mode
+            self.write_register(Registers.UP1SR+2, up1sr & ~(1<<2))
+
+    @_operation
+    def display_area_buf(self, xy, dims, display_mode, address):
+        '''
+        Like EPD.display_area, but display from the buffer at address in device memory
+        instead of the image buffer. Nothing is sent over SPI except the command itself,
+        so this is very fast for images that were loaded ahead of time.
+        '''
+        self._write_cmd(Commands.DPY_BUF_AREA, xy[0], xy[1], dims[0], dims[1], display_mode,
+                           address & 0xFFFF, address >> 16)
+
+    @_operation
+    def read_img_area(self, xy, dims, address=None):
+        '''
+        Read an area of device memory back as pixels, 1 byte per pixel. The controller
+        stores pixels at 8 bits, so areas loaded at 4bpp come back with the low 4 bits
+        cleared. Full-width areas are read in as few bursts as possible.
+
+        Parameters
+        ----------
+
+        xy, dims : (int, int)
+            The area, as for EPD.load_img_area
+
+        address : int, optional
+            Read from the buffer at this address of device memory instead of the image
+            buffer
+
+        Returns
+        -------
+
+        bytearray
+        '''
+        if address is None:
+            address = self.img_buf_address
+
+        x, y = xy
+        w, h = dims
+
+        # memory is read in 16-bit words, so start from an even pixel
+        x0 = x - x % 2
+        row_words = (x + w - x0 + 1) // 2
+        stride = 2*row_words
+
+        words = array('H', bytes(stride*h))
+        if x0 == 0 and stride == self.width:
+            # whole rows are contiguous in memory
+            self.read_memory_into(address + y*self.width, words)
+        else:
+            rows = memoryview(words)
+            for row in range(h):
+                self.read_memory_into(address + (y+row)*self.width + x0,
+                                      rows[row*row_words:(row+1)*row_words])
+
+        # device memory is little endian, see _words_to_bytes
+        if sys.byteorder == 'big':
+            words.byteswap()
+        data = words.tobytes()
+
+        if x0 == x and stride == w:
+            return bytearray(data)
+        offset = x - x0
+        return bytearray(b''.join(data[row*stride+offset:row*stride+offset+w] for row in range(h)))
+
+    @_operation
+    def read_img_area_1bpp(self, xy, dims, zero_gray=0x00, one_gray=0xF0, address=None):
+        '''
+        Read an area loaded with EPD.load_img_area_1bpp back as pixels, 1 byte per pixel,
+        cleared bits as zero_gray and set bits as one_gray
+        '''
+        if xy[0] % 16 or dims[0] % 16:
+            raise ValueError('1bpp areas must be aligned to 16 pixels horizontally')
+
+        packed = self.read_img_area((xy[0]//8, xy[1]), (dims[0]//8, dims[1]), address=address)
+        return bytearray(_unpack_1bpp(packed, zero_gray, one_gray))
+
+    def frame_slot_address(self, slot):
+        '''
+        The address of the slot-th full frame buffer in the device memory past the
+        image buffer. Frames are stored at 8 bits per pixel, whatever their pixel
+        format was when loaded.
+        '''
+        return self.img_buf_address + (slot+1)*self.width*self.height
 
+    @_operation
     def update_system_info(self):
         '''
         Get information about the system, and store it in class attributes
         '''
-        self.spi.write_cmd(Commands.GET_DEV_INFO)
-        data = self.spi.read_data(20)
+        self._write_cmd(Commands.GET_DEV_INFO)
+        data = self._dev_info_buf
+        self.spi.read_data_into(data)
 
         if all(x == 0 for x in data):
             raise RuntimeError("communication with device failed")
@@ -108,21 +325,28 @@ class EPD:
         self.firmware_version = ''.join([chr(x>>8)+chr(x&0xFF) for x in data[4:12]])
         self.lut_version      = ''.join([chr(x>>8)+chr(x&0xFF) for x in data[12:20]])
 
-    def get_vcom(self):
+    @_operation
+    def get_vcom(self, cached=True):
         '''
-        Get the device's current value for VCOM voltage
+        Get the device's current value for VCOM voltage. Unless cached is False, this
+        is the value last set by this process, without asking the device.
         '''
-        self.spi.write_cmd(Commands.VCOM, 0)
-        vcom_int = self.spi.read_int()
-        return -vcom_int/1000
+        if cached and self._vcom_int is not None:
+            return -self._vcom_int/1000
 
+        self._write_cmd(Commands.VCOM, 0)
+        self._vcom_int = self.spi.read_int()
+        return -self._vcom_int/1000
+
+    @_operation
     def set_vcom(self, vcom):
         '''
         Set the device's VCOM voltage
         '''
         self._validate_vcom(vcom)
         vcom_int = int(-1000*vcom)
-        self.spi.write_cmd(Commands.VCOM, 1, vcom_int)
+        self._write_cmd(Commands.VCOM, 1, vcom_int)
+        self._vcom_int = vcom_int
 
     def _validate_vcom(self, vcom):
         # TODO: figure out the actual limits for vcom
@@ -130,99 +354,314 @@ class EPD:
             raise ValueError("vcom must be between -5 and 0")
 
     def run(self):
-        self.spi.write_cmd(Commands.SYS_RUN)
+        self.power.set_state(PowerStates.RUN)
 
     def standby(self):
-        self.spi.write_cmd(Commands.STANDBY)
+        self.power.set_state(PowerStates.STANDBY)
 
     def sleep(self):
-        self.spi.write_cmd(Commands.SLEEP)
+        self.power.set_state(PowerStates.SLEEP)
 
+    @_operation
     def wait_display_ready(self):
         while(self.read_register(Registers.LUTAFSR)):
             sleep(0.01)
 
+    def _write_cmd(self, cmd, *args):
+        self.power.before_command()
+        self.spi.write_cmd(cmd, *args)
+
     def _load_img_start(self, endian_type, pixel_format, rotate_mode):
         arg = (endian_type << 8) | (pixel_format << 4) | rotate_mode
-        self.spi.write_cmd(Commands.LD_IMG, arg)
+        self._write_cmd(Commands.LD_IMG, arg)
 
     def _load_img_area_start(self, endian_type, pixel_format, rotate_mode, xy, dims):
         arg0 = (endian_type << 8) | (pixel_format << 4) | rotate_mode
-        self.spi.write_cmd(Commands.LD_IMG_AREA, arg0, xy[0], xy[1], dims[0], dims[1])
+        self._write_cmd(Commands.LD_IMG_AREA, arg0, xy[0], xy[1], dims[0], dims[1])
 
     def _load_img_end(self):
-        self.spi.write_cmd(Commands.LD_IMG_END)
+        self._write_cmd(Commands.LD_IMG_END)
 
-    def read_register(self, address):
+    @_operation
+    def read_register(self, address, cached=True):
         '''
-        Read a device register
+        Read a device register.
+
+        Registers only change when written (except the ones in
+        constants.volatile_registers), so values written or read before are
+        returned from a shadow copy without touching the bus, unless cached is False.
         '''
-        self.spi.write_cmd(Commands.REG_RD, address)
-        return self.spi.read_int()
+        if cached and address in self._registers:
+            return self._registers[address]
+
+        self._write_cmd(Commands.REG_RD, address)
+        val = self.spi.read_int()
+
+        if address not in constants.volatile_registers:
+            self._registers[address] = val
+        return val
 
+    @_operation
+    def read_registers(self, addresses, out, cached=True):
+        '''
+        Read several device registers into the buffer out (e.g. an array.array('H')),
+        in the order given by addresses. Only registers that aren't in the shadow copy
+        are read from the device.
+        '''
+        for i, address in enumerate(addresses):
+            out[i] = self.read_register(address, cached=cached)
+        return out
+
+    @_operation
     def write_register(self, address, val):
         '''
         Write to a device register
         '''
-        self.spi.write_cmd(Commands.REG_WR, address)
+        self._write_cmd(Commands.REG_WR, address)
         self.spi.write_data((val,))
 
+        if address not in constants.volatile_registers:
+            self._registers[address] = val
+
+    def invalidate_register_cache(self):
+        '''
+        Forget the shadow copy of the registers, e.g. after the device was reset
+        '''
+        self._registers.clear()
+        self._vcom_int = None
+
     def _set_img_buf_base_addr(self, address):
         word0 = address >> 16
         word1 = address & 0xFFFF
-        self.write_register(Registers.LISAR+2, word0)
-        self.write_register(Registers.LISAR, word1)
+        # this is switched back and forth around loads into other buffers, so skip
+        # writes that would not change anything
+        if self._registers.get(Registers.LISAR+2) != word0:
+            self.write_register(Registers.LISAR+2, word0)
+        if self._registers.get(Registers.LISAR) != word1:
+            self.write_register(Registers.LISAR, word1)
+
+    def mem_burst_read_trigger(self, address, count):
+        '''
+        Set up a burst read of count 16-bit words of device memory, starting at address
+        '''
+        # these are both 32 bits, so we need to split them
+        # up into two 16 bit values
+        self._write_cmd(Commands.MEM_BST_RD_T,
+                           address & 0xFFFF, address >> 16,
+                           count & 0xFFFF, count >> 16)
+
+    def mem_burst_read_start(self):
+        self._write_cmd(Commands.MEM_BST_RD_S)
+
+    def mem_burst_write(self, address, count):
+        '''
+        Set up a burst write of count 16-bit words to device memory, starting at address.
+        The words themselves are then sent with spi.write_data.
+        '''
+        self._write_cmd(Commands.MEM_BST_WR,
+                           address & 0xFFFF, address >> 16,
+                           count & 0xFFFF, count >> 16)
+
+    def mem_burst_end(self):
+        self._write_cmd(Commands.MEM_BST_END)
+
+    def read_memory(self, address, count):
+        '''
+        Read count 16-bit words of device memory starting at address, and return them
+        as a list
+        '''
+        buf = array('H', bytes(2*count))
+        self.read_memory_into(address, buf)
+        return buf.tolist()
+
+    @_operation
+    def read_memory_into(self, address, out):
+        '''
+        Fill the buffer out (16-bit unsigned ints, e.g. an array.array('H')) with device
+        memory starting at address. Large reads are split into as many bursts as the SPI
+        transfer size requires.
+        '''
+        # two bytes per word, and four for the preamble + dummy bytes
+        words_per_burst = (self.spi.max_block_size - 4) // 2
+
+        out = memoryview(out)
+        for start in range(0, len(out), words_per_burst):
+            chunk = out[start:start+words_per_burst]
+            self.mem_burst_read_trigger(address + 2*start, len(chunk))
+            self.mem_burst_read_start()
+            self.spi.read_data_into(chunk)
+            self.mem_burst_end()
+
+    @_operation
+    def write_memory(self, address, words):
+        '''
+        Write a sequence of 16-bit words to device memory starting at address
+        '''
+        # two bytes per word, and two for the preamble
+        words_per_burst = (self.spi.max_block_size - 2) // 2
+
+        for start in range(0, len(words), words_per_burst):
+            chunk = words[start:start+words_per_burst]
+            self.mem_burst_write(address + 2*start, len(chunk))
+            self.spi.write_data(chunk)
+            self.mem_burst_end()
+
+    @_operation
+    def calibrate_spi(self, max_cmd_hz=12000000, max_data_hz=80000000, resolution_hz=500000,
+                      margin=0.1, rounds=3, rows=8, path=None):
+        '''
+        Find the highest command and data SPI clocks at which device memory reads back
+        exactly what was written, and switch to them.
+
+        Test patterns are written to the device memory right after the image buffer,
+        so the displayed image is not touched, but frame slot 0 is (see
+        EPD.frame_slot_address): calibrate before preloading anything. The command
+        clock is tested with memory burst writes and reads; the data clock by loading
+        pixels with LD_IMG_AREA, and reading them back at the (already calibrated)
+        command clock. Both are found by binary search between the clocks currently
+        in use, which must work, and the given maximums.
+
+        Parameters
+        ----------
+
+        max_cmd_hz, max_data_hz : int, optional
+            Upper bounds for the search
+
+        resolution_hz : int, optional
+            Stop searching once the interval is narrower than this
+
+        margin : float, optional
+            The fraction to back off from the highest clock that passed
+
+        rounds : int, optional
+            How many different patterns a clock must pass
+
+        rows : int, optional
+            Height, in panel rows, of the pixel patterns used for the data clock
 
-    ##########
-    # the following functions are transcribed from example code from waveshare, but have not
-    # been tested
+        path : str, optional
+            If given, store the result in this file (see calibration.load)
 
-    # def mem_burst_read_trigger(self, address, count):
-    #     # these are both 32 bits, so we need to split them
-    #     # up into two 16 bit values
+        Returns
+        -------
 
-    #     addr0 = address & 0xFFFF
-    #     addr1 = address >> 16
+        (int, int) : the command and data clocks now in use
+        '''
+        scratch = self.frame_slot_address(0)
+        rows = min(rows, self.height)
+
+        def cmd_ok(hz):
+            self.spi.cmd_hz = hz
+            for seed in range(rounds):
+                words = _test_pattern_words(seed, self.width//2)
+                try:
+                    self.write_memory(scratch, words)
+                    if self.read_memory(scratch, len(words)) != words:
+                        return False
+                except (IOError, TimeoutError):
+                    return False
+            return True
+
+        def data_ok(hz):
+            self.spi.data_hz = hz
+            for seed in range(rounds):
+                pixels = bytes(_test_pattern_bytes(seed, self.width*rows))
+                try:
+                    self.load_img_area(pixels, xy=(0, 0), dims=(self.width, rows),
+                                       pixel_format=PixelModes.M_8BPP, address=scratch)
+                    if _words_to_bytes(self.read_memory(scratch, len(pixels)//2)) != pixels:
+                        return False
+                except (IOError, TimeoutError):
+                    return False
+            return True
+
+        initial_cmd_hz = self.spi.cmd_hz
+        initial_data_hz = self.spi.data_hz
+
+        cmd_hz = _search_max_clock(cmd_ok, initial_cmd_hz, max_cmd_hz, resolution_hz)
+
+        # garbled commands at clocks that were too fast could have changed anything,
+        # so the shadow copy of the registers can't be trusted anymore
+        self.invalidate_register_cache()
+        if cmd_hz is None:
+            self.spi.cmd_hz = initial_cmd_hz
+            raise RuntimeError('SPI readback failed at the initial command clock')
+        cmd_hz = max(int(cmd_hz*(1-margin)), initial_cmd_hz)
+        self.spi.cmd_hz = cmd_hz
+
+        data_hz = _search_max_clock(data_ok, initial_data_hz, max_data_hz, resolution_hz)
+        if data_hz is None:
+            self.spi.data_hz = initial_data_hz
+            self._set_img_buf_base_addr(self.img_buf_address)
+            raise RuntimeError('SPI readback failed at the initial data clock')
+        data_hz = max(int(data_hz*(1-margin)), initial_data_hz)
+        self.spi.data_hz = data_hz
+
+        # leave the device pointing at the real image buffer, whatever happened above
+        self._set_img_buf_base_addr(self.img_buf_address)
 
-    #     len0 = count & 0xFFFF
-    #     len1 = count >> 16
+        if path is not None:
+            calibration.save(path, calibration.device_key(self), (cmd_hz, data_hz))
 
-    #     self.spi.write_cmd(Commands.MEM_BST_RD_T,
-    #                        addr0, addr1, len0, len1)
+        return cmd_hz, data_hz
 
-    # def mem_burst_read_start(self):
-    #     self.spi.write_cmd(Commands.MEM_BST_RD_S)
 
-    # def mem_burst_write(self, address, count):
-    #     addr0 = address & 0xFFFF
-    #     addr1 = address >> 16
+def _search_max_clock(ok, low, high, resolution):
+    '''
+    Binary search the highest clock in [low, high] for which ok(clock) is True,
+    assuming that all clocks below a working one work too. Returns None if even
+    low does not work.
+    '''
+    if not ok(low):
+        return None
 
-    #     len0 = count & 0xFFFF
-    #     len1 = count >> 16
+    if ok(high):
+        return high
 
-    #     self.spi.write_cmd(Commands.MEM_BST_WR,
-    #                    addr0, addr1, len0, len1)
+    while high - low > resolution:
+        mid = (low + high) // 2
+        if ok(mid):
+            low = mid
+        else:
+            high = mid
 
-    # def mem_burst_end(self):
-    #     self.spi.write_cmd(Commands.MEM_BST_END)
+    return low
 
-    # def display_area_1bpp(self, xy, dims, display_mode, background_gray, foreground_gray):
 
-    #     # set display to 1bpp mode
-    #     old_value = self.read_register(Registers.UP1SR+2)
-    #     self.write_register(Registers.UP1SR+2, old_val | (1<<2))
+def _test_pattern_bytes(seed, n):
+    '''
+    Byte patterns that toggle as many bits as possible; the first few
+    rounds are the classic fixed patterns, the rest are pseudo-random
+    '''
+    fixed = [0x00, 0xFF, 0xAA, 0x55]
+    if seed < len(fixed) - 1:
+        # alternate each fixed pattern with its neighbor, so every bit toggles
+        return [fixed[seed] if i % 2 else fixed[seed+1] for i in range(n)]
+    rng = Random(seed)
+    return [rng.randrange(256) for _ in range(n)]
 
-    #     # set color table
-    #     self.write_register(Registers.BGVR, (background_gray << 8) | foreground_gray)
 
-    #     # display image
-    #     self.display_area(xy, dims, display_mode)
-    #     self.wait_display_ready()
+def _test_pattern_words(seed, n):
+    b = _test_pattern_bytes(seed, 2*n)
+    return [(b[2*i] << 8) | b[2*i+1] for i in range(n)]
 
-    #     # back to normal mode
-    #     old_value = self.read_register(Registers.UP1SR+2)
-    #     self.write_register(Registers.UP1SR+2, old_value & ~(1<<2))
 
-    # def display_area_buf(self, xy, dims, display_mode, display_buf_address):
-    #     self.spi.write_cmd(Commands.DPY_BUF_AREA, xy[0], xy[1], dims[0], dims[1], display_mode,
-    #                        display_buf_address & 0xFFFF, display_buf_address >> 16)
+def _unpack_1bpp(packed, zero_gray, one_gray):
+    '''
+    Expand bytes of 8 pixels each, least significant bit first (see
+    img_manip.pack_1bpp), to 1 byte per pixel
+    '''
+    table = [bytes(one_gray if (b >> i) & 1 else zero_gray for i in range(8))
+             for b in range(256)]
+    return b''.join(table[b] for b in packed)
+
+
+def _words_to_bytes(words):
+    '''
+    Device memory is little endian: the low byte of each word comes first
+    '''
+    rtn = bytearray(2*len(words))
+    for i, w in enumerate(words):
+        rtn[2*i] = w & 0xFF
+        rtn[2*i+1] = w >> 8
+    return bytes(rtn)
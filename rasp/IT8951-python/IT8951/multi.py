@@ -0,0 +1,138 @@
+'''
+Drive several panels from one host in parallel.
+
+Each panel has its own AutoDisplay (e.g. an AutoEPDDisplay on its own SPI device
+and HRDY/RESET pins), and the updates of all panels are run in worker threads,
+one per panel. The pixel packing and SPI transfers in spi.pyx release the GIL,
+and waiting for a panel to become ready sleeps, so the panels upload and refresh
+concurrently instead of one after another.
+'''
+
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+
+from .constants import DisplayModes
+from .display import AutoEPDDisplay
+
+class MultiDisplay:
+    '''
+    Updates several displays at once.
+
+    Parameters
+    ----------
+
+    displays : dict(str, AutoDisplay)
+        The displays, by name
+    '''
+
+    def __init__(self, displays):
+        if not displays:
+            raise ValueError('at least one display is needed')
+
+        self.displays = dict(displays)
+        self._executor = ThreadPoolExecutor(max_workers=len(self.displays),
+                                            thread_name_prefix='IT8951-panel')
+
+    @classmethod
+    def from_config(cls, panels):
+        '''
+        Create an AutoEPDDisplay per panel.
+
+        Parameters
+        ----------
+
+        panels : dict(str, dict)
+            Arguments for AutoEPDDisplay by panel name, e.g.
+            {'left': {'vcom': -1.15, 'device': 0},
+             'right': {'vcom': -1.46, 'device': 1, 'hrdy_pin': 23, 'reset_pin': 27}}
+        '''
+        displays = {name: AutoEPDDisplay(**kwargs) for name, kwargs in panels.items()}
+        return cls(displays)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown()
+
+    def _run_all(self, fn, names=None):
+        '''
+        Call fn(name, display) for each display in a worker thread, and wait for
+        all of them. Returns the time each call took, by name.
+        '''
+        if names is None:
+            names = self.displays.keys()
+
+        def timed(name):
+            start = time()
+            fn(name, self.displays[name])
+            return time() - start
+
+        futures = {name: self._executor.submit(timed, name) for name in names}
+
+        timings = {}
+        errors = {}
+        for name, future in futures.items():
+            try:
+                timings[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+
+        if errors:
+            # the other panels were still updated, raise only once all are done
+            first = next(iter(errors.values()))
+            raise RuntimeError('updating panels failed: {}'.format(
+                ', '.join('{} ({})'.format(name, e) for name, e in errors.items()))) from first
+
+        return timings
+
+    def _draw(self, images, mode, full):
+        def draw(name, display):
+            img = images[name]
+            if callable(img):
+                # e.g. fetch the image, which then overlaps with the other panels' uploads
+                img = img()
+            display.frame_buf.paste(img, (0, 0))
+            if full:
+                display.draw_full(mode)
+            else:
+                display.draw_partial(mode)
+
+        return self._run_all(draw, images.keys())
+
+    def draw_full(self, images, mode=DisplayModes.GC16):
+        '''
+        Write full images to the displays, and display them using mode.
+
+        Parameters
+        ----------
+
+        images : dict(str, PIL.Image or callable)
+            The image for each display to update, by display name. Instead of an
+            image, a function returning one can be given; it's called in the
+            display's worker thread.
+
+        mode : int, optional
+            The display mode (from constants.DisplayModes)
+
+        Returns
+        -------
+
+        dict(str, float) : how long updating each display took, in seconds
+        '''
+        return self._draw(images, mode, full=True)
+
+    def draw_partial(self, images, mode=DisplayModes.GC16):
+        '''
+        Like draw_full, but only the changed part of each display is updated
+        '''
+        return self._draw(images, mode, full=False)
+
+    def clear(self):
+        '''
+        Clear all displays
+        '''
+        return self._run_all(lambda name, display: display.clear())
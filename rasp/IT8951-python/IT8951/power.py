@@ -0,0 +1,198 @@
+'''
+Tracks the power state of the controller, and puts it into standby or sleep
+after a period without commands. EPD sends every command through
+PowerManager.before_command, which first wakes the controller up with SYS_RUN if
+needed, so callers never see the state change. Whole operations, e.g. loading
+an image, run inside PowerManager.in_use, so the controller is never put into
+standby between their commands and data.
+
+The time spent in each state and how long each wake-up took are kept, so that
+the power saved can be weighed against the latency added to the first command
+after an idle period (see PowerManager.stats).
+'''
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+
+from .constants import Commands, PowerStates
+
+STATE_NAMES = {
+    PowerStates.RUN     : 'run',
+    PowerStates.STANDBY : 'standby',
+    PowerStates.SLEEP   : 'sleep',
+}
+
+# how many wake-up latencies are kept for the stats
+LATENCY_SAMPLES = 1000
+
+class PowerManager:
+    '''
+    Parameters
+    ----------
+
+    epd : EPD
+        The device
+
+    idle_timeout : float, optional
+        Seconds without commands after which a background thread puts the
+        controller into idle_state. Counted from the end of the last operation
+        (see in_use). If omitted, the state only changes with set_state.
+
+    idle_state : PowerStates, optional
+        STANDBY or SLEEP
+
+    clock : callable, optional
+        Returns the current time in seconds
+    '''
+
+    def __init__(self, epd, idle_timeout=None, idle_state=PowerStates.STANDBY, clock=perf_counter):
+        if idle_state not in (PowerStates.STANDBY, PowerStates.SLEEP):
+            raise ValueError('idle_state must be PowerStates.STANDBY or PowerStates.SLEEP')
+
+        self.epd = epd
+        self.idle_timeout = idle_timeout
+        self.idle_state = idle_state
+        self.clock = clock
+
+        # the controller runs after a reset
+        self.state = PowerStates.RUN
+        self.time_in_state = dict.fromkeys(STATE_NAMES, 0.0)
+        self.entered = dict.fromkeys(STATE_NAMES, 0)
+        self.wake_latencies = deque(maxlen=LATENCY_SAMPLES)
+
+        now = clock()
+        self._state_since = now
+        self._last_command = now
+
+        # held while changing state, so that the idle thread never sends a command
+        # in the middle of another one
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self._closed = False
+        # operations in progress, see in_use
+        self._active = 0
+
+        self._thread = None
+        if idle_timeout is not None:
+            self._thread = threading.Thread(target=self._idle_loop, name='IT8951 power',
+                                            daemon=True)
+            self._thread.start()
+
+    def before_command(self):
+        '''
+        Wake the controller up if it isn't running, and note that it's in use
+        '''
+        with self._lock:
+            if self.state != PowerStates.RUN:
+                self._wake()
+            self._last_command = self.clock()
+
+    @contextmanager
+    def in_use(self):
+        '''
+        Keep the controller from being put into idle_state while the body sends
+        commands and data, e.g. all the pixels of an image. It's still only woken
+        up by the first command. Can be nested, and used from several threads.
+        '''
+        with self._lock:
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._last_command = self.clock()
+                # the idle thread waits without a timeout while operations run
+                self._changed.notify()
+
+    def set_state(self, state):
+        '''
+        Move the controller to state (a PowerStates value). Display updates in
+        progress are finished first.
+        '''
+        with self._lock:
+            if state == self.state:
+                return
+            if self.state != PowerStates.RUN:
+                self._wake()
+            if state == PowerStates.RUN:
+                return
+
+            self.epd.wait_display_ready()
+            self.epd.spi.write_cmd(state)
+            self._enter(state)
+
+    def check_idle(self):
+        '''
+        Put the controller into idle_state if there have been no commands for
+        idle_timeout seconds. Returns the seconds left until then, or None if the
+        controller isn't running, an operation is in progress (see in_use), or
+        there is no idle_timeout.
+        '''
+        with self._lock:
+            if self.idle_timeout is None or self.state != PowerStates.RUN or self._active:
+                return None
+
+            remaining = self._last_command + self.idle_timeout - self.clock()
+            if remaining > 0:
+                return remaining
+
+            self.set_state(self.idle_state)
+            return None
+
+    def stats(self):
+        '''
+        Return a dict with the seconds spent in each state and how many times each
+        was entered (by state name), and the wake-up latencies in milliseconds
+        '''
+        with self._lock:
+            seconds = dict(self.time_in_state)
+            seconds[self.state] += self.clock() - self._state_since
+            entered = dict(self.entered)
+            latencies = sorted(self.wake_latencies)
+
+        rtn = {
+            'state': STATE_NAMES[self.state],
+            'seconds': {STATE_NAMES[s]: v for s, v in seconds.items()},
+            'entered': {STATE_NAMES[s]: v for s, v in entered.items()},
+            'wake_mean_ms': 0,
+            'wake_max_ms': 0,
+        }
+        if latencies:
+            rtn['wake_mean_ms'] = 1000 * sum(latencies) / len(latencies)
+            rtn['wake_max_ms'] = 1000 * latencies[-1]
+        return rtn
+
+    def close(self):
+        '''
+        Stop the idle thread. The controller is left in its current state.
+        '''
+        with self._lock:
+            self._closed = True
+            self._changed.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _wake(self):
+        start = self.clock()
+        self.epd.spi.write_cmd(Commands.SYS_RUN)
+        self.epd.spi.wait_ready()
+        self.wake_latencies.append(self.clock() - start)
+        self._enter(PowerStates.RUN)
+        # the idle thread waits without a timeout while the controller is idle
+        self._changed.notify()
+
+    def _enter(self, state):
+        now = self.clock()
+        self.time_in_state[self.state] += now - self._state_since
+        self._state_since = now
+        self.state = state
+        self.entered[state] += 1
+
+    def _idle_loop(self):
+        with self._lock:
+            while not self._closed:
+                self._changed.wait(self.check_idle())
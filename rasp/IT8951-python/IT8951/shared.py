@@ -0,0 +1,175 @@
+'''
+A frame buffer in shared memory, so that other local processes can draw into
+what the display shows without encoding images or sending them over a socket.
+
+The buffer is a file, normally in /dev/shm, with a small header followed by the
+pixels: 1 byte per pixel, row by row, in the panel's layout (not rotated). The
+display side (AutoDisplay with shared_frame) creates it; producers open it and
+draw through SharedFrame.image (a Pillow image over the memory) or
+SharedFrame.pixels, e.g. with numpy:
+
+    frame = SharedFrame('/dev/shm/it8951-frame')
+    pixels = numpy.frombuffer(frame.pixels, numpy.uint8).reshape(frame.height, frame.width)
+    pixels[100:200, 100:300] = 0
+    frame.commit((100, 100, 300, 200))
+
+Nothing is displayed until a producer commits. Commits are fixed-size messages
+on a FIFO next to the buffer, telling which rectangle changed and in which
+display mode to show it. They are shorter than PIPE_BUF, so commits of several
+producers never interleave. Producers should not draw into an area between
+committing it and the display showing it, or the display may show it half-drawn.
+'''
+
+import errno
+import mmap
+import os
+import select
+import stat
+import struct
+from PIL import Image
+
+DEFAULT_PATH = '/dev/shm/it8951-frame'
+
+MAGIC = b'IT8S'
+VERSION = 1
+# magic, version, width, height
+HEADER = struct.Struct('<4sHHH')
+# the pixels start at this offset, so that rows of even widths are word aligned
+PIXELS_OFFSET = 64
+
+# x0, y0, x1, y1, mode. An empty box means anywhere
+COMMIT = struct.Struct('<HHHHB')
+NO_MODE = 0xFF
+
+class SharedFrame:
+    '''
+    Parameters
+    ----------
+
+    path : str
+        The buffer file. The commit FIFO is path + '.commit'.
+
+    dims : (int, int), optional
+        Width and height of the display. Given by the display side, which creates
+        the buffer and reads the commits. A buffer of the same dimensions that
+        already exists is reused with its pixels, so producers keep working across
+        restarts of the display side. Without dims, an existing buffer is opened.
+    '''
+
+    def __init__(self, path=DEFAULT_PATH, dims=None):
+        self.path = path
+        self.fifo_path = path + '.commit'
+        self.is_display = dims is not None
+        self._fifo = None
+        self._pending = b''
+
+        if self.is_display:
+            self.width, self.height = dims
+            size = PIXELS_OFFSET + self.width*self.height
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+            try:
+                header = os.pread(fd, HEADER.size, 0)
+                reuse = (os.fstat(fd).st_size == size and
+                         header == HEADER.pack(MAGIC, VERSION, self.width, self.height))
+                if not reuse:
+                    os.ftruncate(fd, 0)
+                    os.ftruncate(fd, size)
+                self.mmap = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+
+            if not reuse:
+                self.mmap[PIXELS_OFFSET:] = b'\xFF' * (self.width*self.height)
+                self.mmap[:HEADER.size] = HEADER.pack(MAGIC, VERSION, self.width, self.height)
+
+            if not os.path.exists(self.fifo_path):
+                os.mkfifo(self.fifo_path, 0o666)
+            elif not stat.S_ISFIFO(os.stat(self.fifo_path).st_mode):
+                raise ValueError('{} exists and is not a FIFO'.format(self.fifo_path))
+            # opened for writing too, so that reads don't see end of file while no
+            # producer has the FIFO open
+            self._fifo = os.open(self.fifo_path, os.O_RDWR | os.O_NONBLOCK)
+        else:
+            fd = os.open(path, os.O_RDWR)
+            try:
+                self.mmap = mmap.mmap(fd, 0)
+            finally:
+                os.close(fd)
+
+            magic, version, self.width, self.height = HEADER.unpack_from(self.mmap, 0)
+            if magic != MAGIC or version != VERSION:
+                self.mmap.close()
+                raise ValueError('{} is not a shared frame buffer'.format(path))
+
+        self.pixels = memoryview(self.mmap)[PIXELS_OFFSET:PIXELS_OFFSET + self.width*self.height]
+
+        # Pillow treats images over a buffer as read-only, and would copy them on the
+        # first write. This one is meant to be written.
+        self.image = Image.frombuffer('L', (self.width, self.height), self.pixels, 'raw', 'L', 0, 1)
+        self.image.readonly = 0
+
+    def commit(self, box=None, mode=None):
+        '''
+        Tell the display that the pixels in box (left, top, right, bottom) changed,
+        or anywhere if box is None. mode is the display mode to show them in, or
+        None for the display's default. Blocks if the display is far behind.
+        '''
+        if self._fifo is None:
+            try:
+                self._fifo = os.open(self.fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError as e:
+                if e.errno == errno.ENXIO:
+                    raise RuntimeError('No display is reading commits from {}'.format(
+                        self.fifo_path)) from None
+                raise
+            os.set_blocking(self._fifo, True)
+
+        if box is None:
+            box = (0, 0, 0, 0)
+        os.write(self._fifo, COMMIT.pack(*box, NO_MODE if mode is None else mode))
+
+    def read_commits(self, timeout=None):
+        '''
+        Wait up to timeout seconds (forever if None) for commits, and return all
+        that have arrived as a list of (box, mode). box and mode are None if the
+        producer didn't give them.
+        '''
+        if not self.is_display:
+            raise ValueError('Only the display side reads commits')
+
+        ready, _, _ = select.select([self._fifo], [], [], timeout)
+        if not ready:
+            return []
+
+        data = self._pending
+        while True:
+            try:
+                chunk = os.read(self._fifo, 64*COMMIT.size)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            data += chunk
+
+        n = len(data) // COMMIT.size
+        self._pending = data[n*COMMIT.size:]
+
+        commits = []
+        for i in range(n):
+            x0, y0, x1, y1, mode = COMMIT.unpack_from(data, i*COMMIT.size)
+            box = (x0, y0, x1, y1) if x1 > x0 and y1 > y0 else None
+            commits.append((box, None if mode == NO_MODE else mode))
+        return commits
+
+    def close(self):
+        if self._fifo is not None:
+            os.close(self._fifo)
+            self._fifo = None
+        self.image = None
+        try:
+            self.pixels.release()
+            self.mmap.close()
+        except BufferError:
+            # images over the memory are still in use elsewhere, e.g. as an
+            # AutoDisplay's frame_buf. It's unmapped once they are gone.
+            pass
@@ -17,11 +17,13 @@ cimport cython
 import os
 from posix.ioctl cimport ioctl
 from libc.string cimport memset
+from IT8951.img_manip cimport pack_pixels_into
 from time import time, sleep
 
 import RPi.GPIO as GPIO
 
 from .constants import Pins, PixelModes
+from .img_manip import transform_args
 
 cdef extern from "linux/spi/spidev.h":
     struct spi_ioc_transfer:
@@ -40,13 +42,19 @@ cdef extern from "linux/spi/spidev.h":
     cdef int SPI_IOC_WR_MODE, SPI_IOC_WR_BITS_PER_WORD, SPI_IOC_WR_MAX_SPEED_HZ
 
 cdef class SPI:
-    cdef int fd, _mode, _bits_per_word, data_hz, cmd_hz, delay
-    cdef int max_block_size
+    cdef int fd, _mode, _bits_per_word, delay
+    cdef readonly int hrdy_pin, reset_pin
+    cdef readonly int max_block_size
+
+    # exposed so that the clocks can be tuned at runtime (see EPD.calibrate_spi)
+    cdef public int data_hz, cmd_hz
     cdef float timeout_secs
 
     cdef unsigned char [:] write_buf, read_buf
+    cdef unsigned short [:] int_buf
 
-    def __cinit__(self, bus=0, device=0, int cmd_hz=1000000, int data_hz=24000000, float timeout_secs=5):
+    def __cinit__(self, bus=0, device=0, int cmd_hz=1000000, int data_hz=24000000, float timeout_secs=5,
+                  int hrdy_pin=Pins.HRDY, int reset_pin=Pins.RESET):
         self.fd = -1
         fd_path = '/dev/spidev{}.{}'.format(bus, device)
         self.fd = os.open(fd_path, os.O_RDWR)
@@ -56,6 +64,7 @@ cdef class SPI:
         # pre-allocate buffers so we aren't reallocating them all the time
         self.write_buf = cython.view.array(shape=(self.max_block_size,), itemsize=sizeof(unsigned char), format='B')
         self.read_buf  = cython.view.array(shape=(self.max_block_size,), itemsize=sizeof(unsigned char), format='B')
+        self.int_buf   = cython.view.array(shape=(1,), itemsize=sizeof(unsigned short), format='H')
 
         # the default spi frequency is way too fast; also it seems that we can set the SPI frequency for data transfer
         # to be a lot higher than for sending commands
@@ -66,18 +75,22 @@ cdef class SPI:
 
         self.delay = 0
 
+        # each panel needs its own HRDY and RESET pins when several are connected
+        self.hrdy_pin = hrdy_pin
+        self.reset_pin = reset_pin
+
         GPIO.setmode(GPIO.BCM)
         GPIO.setwarnings(False)
-        GPIO.setup(Pins.HRDY, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-        GPIO.setup(Pins.RESET, GPIO.OUT, initial=GPIO.HIGH)
+        GPIO.setup(self.hrdy_pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+        GPIO.setup(self.reset_pin, GPIO.OUT, initial=GPIO.HIGH)
 
         # reset
-        GPIO.output(Pins.RESET, GPIO.LOW)
+        GPIO.output(self.reset_pin, GPIO.LOW)
         sleep(0.1)
-        GPIO.output(Pins.RESET, GPIO.HIGH)
+        GPIO.output(self.reset_pin, GPIO.HIGH)
 
     def __del__(self):
-        GPIO.cleanup([Pins.HRDY, Pins.RESET])
+        GPIO.cleanup([self.hrdy_pin, self.reset_pin])
         if self.fd != -1:
             os.close(self.fd)
 
@@ -103,7 +116,7 @@ cdef class SPI:
         Wait for the device's ready pin to be set
         '''
         start = time()
-        while not GPIO.input(Pins.HRDY):
+        while not GPIO.input(self.hrdy_pin):
             if time()-start > self.timeout_secs:
                 raise TimeoutError("Timed out waiting for display to respond")
             sleep(0.001)
@@ -113,6 +126,9 @@ cdef class SPI:
         Perform an SPI transaction of *size* bytes on the preallocated read and write buffers.
         '''
         cdef spi_ioc_transfer tr
+        cdef int result
+        cdef int fd = self.fd
+        cdef int request = SPI_IOC_MESSAGE(1)
 
         self.wait_ready()
 
@@ -130,7 +146,10 @@ cdef class SPI:
 
         #print('w:', ','.join(hex(x) for x in write_buf))
 
-        result = ioctl(self.fd, SPI_IOC_MESSAGE(1), &tr);
+        # release the GIL, so that other threads (e.g. driving other panels) can run
+        # while the kernel does the transfer
+        with nogil:
+            result = ioctl(fd, request, &tr)
 
         #print('r:', ','.join(hex(x) for x in read_buf))
 
@@ -142,23 +161,31 @@ cdef class SPI:
         Send preamble, and return a buffer of 16-bit unsigned ints of length count
         containing the data received
         '''
+        rtn = cython.view.array(shape=(count,), itemsize=sizeof(unsigned short), format='H')
+        self.read_into(preamble, rtn)
+        return rtn
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def read_into(self, int preamble, unsigned short [:] out):
+        '''
+        Send preamble, and fill out (a buffer of 16-bit unsigned ints, e.g. an
+        array.array('H')) with the data received
+        '''
+        cdef int count = out.shape[0]
         cdef int buflen = 2*count + 4  # two bytes per int, and the extra is for the preamble + dummy bytes
 
+        if buflen > self.max_block_size:
+            raise ValueError('cannot read more than {} words at once'.format((self.max_block_size-4)//2))
+
         self.write_buf[0] = preamble >> 8
         self.write_buf[1] = preamble & 0xFF
 
         self.transfer(buflen, speed=self.cmd_hz)
 
-        rtn = cython.view.array(shape=(count,), itemsize=sizeof(unsigned short), format='H')
         cdef int i
         for i in range(count):
-            rtn[i] = self.read_buf[2*i + 4] << 8
-            rtn[i] |= self.read_buf[2*i + 5]
-
-        #print('read data:', ','.join(hex(x) for x in rtn))
-
-        return rtn
+            out[i] = (self.read_buf[2*i + 4] << 8) | self.read_buf[2*i + 5]
 
     def write(self, int preamble, ary):
         '''
@@ -179,35 +206,36 @@ cdef class SPI:
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.initializedcheck(False)
-    @cython.cdivision(True)
-    def pack_and_write_pixels(self, const unsigned char [:] pixbuf, int bpp):
+    def pack_and_write_pixels(self, const unsigned char [:] pixbuf, int bpp, lut=None, int width=0,
+                              bint mirror=False):
         '''
         Pack pixels into a byte buffer, and write them to the device. Pixbuf should be
         an array with each value an individual pixel, in the range 0x00-0xFF.
+
+        lut (256 values) and mirror transform the pixels while they are packed, see
+        img_manip.pack_pixels. Mirroring needs the width of the rows in pixbuf.
         '''
-        cdef int pix_count, nbytes, i, byte_idx, pix_shift, block_start, t
+        lut, mirror_width = transform_args(pixbuf.shape[0], lut, width, mirror)
+        cdef const unsigned char [:] lut_view = lut
+        cdef int mw = mirror_width
+        cdef Py_ssize_t pix_count, nbytes, block_start
         cdef int preamble = 0x0000
         cdef int pix_per_byte = 8 // bpp
-        cdef int pixbuf_len = len(pixbuf)
+        cdef Py_ssize_t pixbuf_len = pixbuf.shape[0]
 
         # transfer only full 16 bit words
-        cdef int pix_per_block = 2*pix_per_byte * ((self.max_block_size - 2)//2)
+        cdef Py_ssize_t pix_per_block = 2*pix_per_byte * ((self.max_block_size - 2)//2)
+        cdef unsigned char [:] write_buf = self.write_buf
 
         for block_start in range(0, pixbuf_len, pix_per_block):
             pix_count = min(pix_per_block, pixbuf_len-block_start)
 
-            self.write_buf[0] = preamble >> 8
-            self.write_buf[1] = preamble & 0xFF
+            write_buf[0] = preamble >> 8
+            write_buf[1] = preamble & 0xFF
 
-            # TODO: make the following more readable
-            nbytes = 2 + 2*((pix_count+2*pix_per_byte-1)//(2*pix_per_byte))
-            for byte_idx in range(2, nbytes):
-                t = 0
-                for i in range(pix_per_byte):
-                    pix_idx = block_start + (byte_idx-2)*pix_per_byte + i
-                    t <<= bpp
-                    t |= pixbuf[pix_idx] >> (8-bpp)
-                self.write_buf[byte_idx] = t
+            with nogil:
+                nbytes = 2 + pack_pixels_into(pixbuf, block_start, pix_count, bpp, lut_view, mw,
+                                              write_buf, 2)
 
             # it seems we can crank up the SPI speed here somewhat
             self.transfer(nbytes, speed=self.data_hz)
@@ -255,11 +283,24 @@ cdef class SPI:
         '''
         return self.read(0x1000, n)
 
+    def read_data_into(self, out):
+        '''
+        Read len(out) 16-bit words of data from the device into the buffer out
+
+        Parameters
+        ----------
+
+        out : writable buffer of unsigned shorts
+            Where to store the data, e.g. an array.array('H')
+        '''
+        self.read_into(0x1000, out)
+
     def read_int(self):
         '''
         Read a single 16 bit int from the device
         '''
-        return self.read_data(1)[0]
+        self.read_into(0x1000, self.int_buf)
+        return self.int_buf[0]
 
 
     ##### properties to get/set mode, frequency, bits per word
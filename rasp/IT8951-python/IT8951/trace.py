@@ -0,0 +1,257 @@
+'''
+Record the updates an AutoDisplay sends, and replay them into any display.
+
+Pass trace='path/to/file' to AutoDisplay (or AutoEPDDisplay etc.) and every
+update(data, xy, dims, mode) call is appended to that file, with the time it was
+made and how long it took. The trace can then be fed back into another display,
+as fast as possible or with the recorded timing, to measure how changes to
+display.py or spi.pyx affect throughput and latency with real update patterns:
+
+    python -m IT8951.trace info updates.trace
+    python -m IT8951.trace replay updates.trace --backend emulated
+
+The file is a header followed by records, each with its pixel data compressed on
+its own. Recording only ever appends whole records, so a trace from a device that
+lost power is readable up to its last complete record.
+'''
+
+import argparse
+import struct
+import warnings
+import zlib
+from collections import namedtuple
+from time import perf_counter, sleep
+
+MAGIC = b'IT8T'
+VERSION = 1
+
+# magic, version, display width, display height
+FILE_HEADER = struct.Struct('<4sHHH')
+
+# time, duration, x, y, width, height, mode, length of the compressed data
+RECORD = struct.Struct('<ddHHHHBI')
+
+TraceEvent = namedtuple('TraceEvent', 'time duration xy dims mode data')
+
+class TraceRecorder:
+    '''
+    Appends updates to a trace file. If the file exists, it must be a trace of a
+    display with the same dimensions.
+
+    Parameters
+    ----------
+
+    path : str
+        The trace file
+
+    display_dims : tuple(int, int)
+        Width and height of the display
+
+    level : int
+        zlib compression level. Low levels are plenty for the mostly flat images
+        displays show, and cost less time during updates.
+    '''
+
+    def __init__(self, path, display_dims, level=1):
+        self.path = path
+        self.display_dims = tuple(display_dims)
+        self.level = level
+
+        self.f = open(path, 'ab')
+        if self.f.tell() == 0:
+            self.f.write(FILE_HEADER.pack(MAGIC, VERSION, *self.display_dims))
+            self.f.flush()
+        else:
+            existing = Trace(path).display_dims
+            if existing != self.display_dims:
+                self.f.close()
+                raise ValueError('{} is a trace of a {}x{} display'.format(path, *existing))
+
+    def record(self, start, duration, data, xy, dims, mode):
+        '''
+        Append an update that was started at time start (seconds since the epoch)
+        and took duration seconds
+        '''
+        compressed = zlib.compress(bytes(data), self.level)
+        # a single write, so that an interrupted process leaves at most one
+        # partial record at the end of the file
+        self.f.write(RECORD.pack(start, duration, xy[0], xy[1], dims[0], dims[1],
+                                 mode, len(compressed)) + compressed)
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+class Trace:
+    '''
+    A trace file opened for reading. Iterating over it yields a TraceEvent per
+    recorded update, with the pixel data decompressed.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            header = f.read(FILE_HEADER.size)
+
+        if len(header) < FILE_HEADER.size:
+            raise ValueError('{} is not a trace file'.format(path))
+        magic, version, width, height = FILE_HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError('{} is not a trace file'.format(path))
+        if version != VERSION:
+            raise ValueError('unsupported trace version {}'.format(version))
+
+        self.display_dims = (width, height)
+
+    def __iter__(self):
+        with open(self.path, 'rb') as f:
+            f.seek(FILE_HEADER.size)
+            while True:
+                header = f.read(RECORD.size)
+                if not header:
+                    return
+
+                if len(header) == RECORD.size:
+                    start, duration, x, y, w, h, mode, length = RECORD.unpack(header)
+                    compressed = f.read(length)
+                else:
+                    compressed = b''
+                    length = -1
+
+                if len(compressed) != length:
+                    warnings.warn('{} ends with an incomplete record'.format(self.path))
+                    return
+
+                yield TraceEvent(start, duration, (x, y), (w, h), mode,
+                                 zlib.decompress(compressed))
+
+def replay(events, display, realtime=False, speed=1.0):
+    '''
+    Send recorded updates to display.update
+
+    Parameters
+    ----------
+
+    events : iterable of TraceEvent
+        E.g. a Trace
+
+    display : AutoDisplay
+        Any display with the dimensions of the recorded one
+
+    realtime : bool
+        Keep the recorded time between updates, instead of sending them as fast
+        as possible
+
+    speed : float
+        With realtime, how many times faster than recorded to replay
+
+    Returns
+    -------
+
+    dict with 'updates', 'pixels', 'seconds' (total wall time, including waiting
+    for the last refresh if the display has an EPD) and 'latencies' (seconds
+    each update call took)
+    '''
+    latencies = []
+    pixels = 0
+    first = None
+
+    start = perf_counter()
+    for event in events:
+        if realtime:
+            if first is None:
+                first = event.time
+            delay = (event.time - first) / speed - (perf_counter() - start)
+            if delay > 0:
+                sleep(delay)
+
+        t = perf_counter()
+        display.update(event.data, event.xy, event.dims, event.mode)
+        latencies.append(perf_counter() - t)
+        pixels += event.dims[0] * event.dims[1]
+
+    epd = getattr(display, 'epd', None)
+    if epd is not None:
+        epd.wait_display_ready()
+
+    return {
+        'updates': len(latencies),
+        'pixels': pixels,
+        'seconds': perf_counter() - start,
+        'latencies': latencies,
+    }
+
+def latency_summary(latencies):
+    '''
+    Return (mean, median, 95th percentile, max) of latencies, in milliseconds
+    '''
+    if not latencies:
+        return (0, 0, 0, 0)
+    ordered = sorted(latencies)
+    n = len(ordered)
+    return (1000 * sum(ordered) / n, 1000 * ordered[n // 2],
+            1000 * ordered[min(n - 1, int(n * 0.95))], 1000 * ordered[-1])
+
+def _format_latencies(latencies):
+    return 'mean {:.1f} ms, median {:.1f} ms, p95 {:.1f} ms, max {:.1f} ms'.format(
+        *latency_summary(latencies))
+
+def _make_display(backend, dims, vcom):
+    from .display import AutoEPDDisplay, VirtualEPDDisplay
+
+    if backend == 'emulated':
+        from .emulator import EmulatedSPI
+        from .interface import EPD
+        spi = EmulatedSPI(width=dims[0], height=dims[1])
+        return AutoEPDDisplay(epd=EPD(vcom=vcom, spi=spi))
+
+    if backend == 'virtual':
+        return VirtualEPDDisplay(dims=dims)
+
+    display = AutoEPDDisplay(vcom=vcom)
+    if display.display_dims != dims:
+        raise ValueError('trace is of a {}x{} display, the device is {}x{}'.format(
+            *(dims + display.display_dims)))
+    return display
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Inspect and replay IT8951 update traces')
+    sub = p.add_subparsers(dest='command', required=True)
+
+    info = sub.add_parser('info', help='print a summary of a trace')
+    info.add_argument('path')
+
+    rep = sub.add_parser('replay', help='send the updates of a trace to a display')
+    rep.add_argument('path')
+    rep.add_argument('-b', '--backend', default='emulated', choices=['emulated', 'virtual', 'epd'],
+                     help='emulated controller (default), Tkinter window, or the real device')
+    rep.add_argument('-r', '--realtime', action='store_true',
+                     help='keep the recorded time between updates')
+    rep.add_argument('-s', '--speed', type=float, default=1.0,
+                     help='with --realtime, how many times faster than recorded to replay')
+    rep.add_argument('-v', '--vcom', type=float, default=-2.06)
+    return p.parse_args()
+
+def main():
+    args = parse_args()
+    trace = Trace(args.path)
+    recorded = [event.duration for event in trace]
+    print('{}x{} display, {} updates'.format(*trace.display_dims, len(recorded)))
+    print('recorded: {}'.format(_format_latencies(recorded)))
+
+    if args.command == 'replay':
+        display = _make_display(args.backend, trace.display_dims, args.vcom)
+        stats = replay(trace, display, realtime=args.realtime, speed=args.speed)
+        print('replayed: {}'.format(_format_latencies(stats['latencies'])))
+        print('{} updates, {:.1f} Mpixels in {:.2f} s ({:.1f} updates/s)'.format(
+            stats['updates'], stats['pixels'] / 1e6, stats['seconds'],
+            stats['updates'] / stats['seconds'] if stats['seconds'] else 0))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+'''
+Measure the memory of the previous frame AutoDisplay keeps, and how many updates
+are skipped because the changes are only in the low 4 bits of pixels, which the
+display doesn't show (e.g. an image re-rendered with slightly different
+antialiasing). Doesn't need a device: updates are only counted.
+'''
+
+import argparse
+from random import Random
+from timeit import default_timer
+
+from PIL import Image, ImageChops
+
+from IT8951.constants import DisplayModes
+from IT8951.display import AutoDisplay
+
+class CountingDisplay(AutoDisplay):
+    def __init__(self, *args, **kwargs):
+        AutoDisplay.__init__(self, *args, **kwargs)
+        self.updates = 0
+        self.pixels = 0
+
+    def update(self, data, xy, dims, mode):
+        self.updates += 1
+        self.pixels += dims[0]*dims[1]
+
+def rss_kb():
+    '''
+    Current and peak resident set size of this process, in kB
+    '''
+    values = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if name in ('VmRSS', 'VmHWM'):
+                values[name] = int(value.split()[0])
+    return values['VmRSS'], values['VmHWM']
+
+def make_frames(dims, count, seed=0):
+    '''
+    A gradient background, then alternately: the same image with noise in the low
+    4 bits of an area, and a real change of an area
+    '''
+    rng = Random(seed)
+    img = Image.linear_gradient('L').resize(dims)
+    for n in range(count):
+        img = img.copy()
+        w, h = rng.randrange(16, dims[0]//4), rng.randrange(16, dims[1]//4)
+        x, y = rng.randrange(dims[0]-w), rng.randrange(dims[1]-h)
+        box = (x, y, x+w, y+h)
+        if n % 2:
+            area = img.crop(box)
+            noise = Image.frombytes('L', (w, h), bytes(rng.randrange(16) for _ in range(w*h)))
+            area = ImageChops.add(area.point(lambda v: v & 0xF0), noise)
+            img.paste(area, box)
+        else:
+            img.paste(rng.randrange(0, 256, 16), box)
+        yield img
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Benchmark AutoDisplay previous-frame tracking')
+    p.add_argument('--width', type=int, default=1872)
+    p.add_argument('--height', type=int, default=1404)
+    p.add_argument('-n', '--frames', type=int, default=20)
+    return p.parse_args()
+
+def main():
+    args = parse_args()
+    dims = (args.width, args.height)
+    frames = list(make_frames(dims, args.frames))
+
+    rss_before, _ = rss_kb()
+    display = CountingDisplay(*dims)
+    display.draw_full(DisplayModes.GC16)
+
+    # what comparing full 8-bit frames would have flagged
+    raw_updates = 0
+    prev = display.frame_buf.copy()
+
+    start = default_timer()
+    for frame in frames:
+        if ImageChops.difference(prev, frame).getbbox() is not None:
+            raw_updates += 1
+        prev = frame
+
+        display.frame_buf.paste(frame)
+        display.draw_partial(DisplayModes.GC16)
+    elapsed = default_timer() - start
+    rss_after, rss_peak = rss_kb()
+
+    partial_updates = display.updates - 1
+    print('{}x{}, {} frames, {:.1f} ms per draw_partial'.format(
+        *dims, len(frames), 1000*elapsed/len(frames)))
+    print('previous frame: {} kB (an 8-bit image would be {} kB)'.format(
+        len(display._prev_packed)//1024, dims[0]*dims[1]//1024))
+    print('RSS: {} kB before the display, {} kB after, {} kB peak'.format(
+        rss_before, rss_after, rss_peak))
+    print('updates: {} sent, {} with 8-bit diffing, {} spurious updates avoided'.format(
+        partial_updates, raw_updates, raw_updates - partial_updates))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+
+import os
+import tempfile
+
+from IT8951.interface import EPD
+from IT8951.emulator import EmulatedSPI
+from IT8951 import calibration
+
+def make_epd(**kwargs):
+    spi = EmulatedSPI(width=64, height=32, img_buf_address=0x1000, frames=1,
+                      max_cmd_hz=6000000, max_data_hz=50000000,
+                      max_block_size=256)
+    return EPD(vcom=-2.0, spi=spi, **kwargs)
+
+def test_memory_roundtrip():
+    epd = make_epd()
+    # spans several bursts
+    words = list(range(0, 3000, 3))
+    epd.write_memory(epd.img_buf_address, words)
+    assert epd.read_memory(epd.img_buf_address, len(words)) == words
+
+def test_calibrate_finds_limits():
+    epd = make_epd()
+    cmd_hz, data_hz = epd.calibrate_spi(resolution_hz=100000, margin=0)
+    assert 5900000 <= cmd_hz <= 6000000
+    assert 49900000 <= data_hz <= 50000000
+    assert (epd.spi.cmd_hz, epd.spi.data_hz) == (cmd_hz, data_hz)
+
+def test_calibrate_keeps_image_buffer():
+    epd = make_epd()
+    epd.calibrate_spi()
+    assert all(x == 0 for x in epd.spi.memory[epd.img_buf_address:epd.img_buf_address + 64*32])
+    assert calibration_address(epd) == epd.img_buf_address
+
+def calibration_address(epd):
+    regs = epd.spi.registers
+    return (regs[0x200 + 0x8 + 2] << 16) | regs[0x200 + 0x8]
+
+def test_calibration_persists():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'calibration.json')
+        clocks = make_epd().calibrate_spi(path=path)
+
+        epd = make_epd(calibration_path=path)
+        assert (epd.spi.cmd_hz, epd.spi.data_hz) == clocks
+        assert calibration.load(path, 'some other device') is None
+
+def main():
+    test_memory_roundtrip()
+    test_calibrate_finds_limits()
+    test_calibrate_keeps_image_buffer()
+    test_calibration_persists()
+    print('All tests passed')
+
+if __name__ == '__main__':
+    main()
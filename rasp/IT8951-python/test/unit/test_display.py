@@ -0,0 +1,244 @@
+
+from PIL import Image
+
+from IT8951.constants import Commands, DisplayModes, PixelModes
+from IT8951.display import AutoEPDDisplay
+from IT8951.emulator import EmulatedSPI
+from IT8951.interface import EPD
+
+DIMS = (64, 32)
+
+def make_display(**kwargs):
+    spi = EmulatedSPI(width=DIMS[0], height=DIMS[1], img_buf_address=0x1000, frames=8)
+    return AutoEPDDisplay(epd=EPD(vcom=-2.0, spi=spi), **kwargs)
+
+def panel_image(display):
+    return Image.frombytes('L', DIMS, bytes(display.epd.spi.panel))
+
+def quantized(img):
+    '''
+    What the panel shows for img, after the 4bpp transfer
+    '''
+    return img.point(lambda x: x & 0xF0)
+
+def test_draw_full():
+    display = make_display()
+    display.frame_buf.paste(0x00, box=(8, 8, 24, 16))
+    display.draw_full(DisplayModes.GC16)
+    assert panel_image(display).tobytes() == quantized(display.frame_buf).tobytes()
+
+def test_preload():
+    display = make_display()
+    error_img = Image.new('L', DIMS, 0x00)
+    display.preload('error', error_img)
+
+    # nothing is displayed by preloading
+    assert all(x == 0xFF for x in display.epd.spi.panel)
+
+    display.display_preloaded('error')
+    assert panel_image(display).tobytes() == error_img.tobytes()
+    assert display.frame_buf.tobytes() == error_img.tobytes()
+
+    # partial updates continue from the preloaded image
+    display.frame_buf.paste(0xF0, box=(0, 0, 8, 8))
+    display.draw_partial(DisplayModes.GC16)
+    assert panel_image(display).tobytes() == quantized(display.frame_buf).tobytes()
+
+def test_preload_rotated():
+    display = make_display(rotate='CCW')
+    img = Image.new('L', display.frame_buf.size)
+    img.putdata([(x*7 + y*3) % 256 for y in range(img.height) for x in range(img.width)])
+    display.preload('gradient', img)
+
+    # only the packed frame is kept, 2 pixels to a byte
+    assert len(display.preloaded['gradient'][1]) == DIMS[0] * DIMS[1] // 2
+
+    display.display_preloaded('gradient')
+    assert display.frame_buf.tobytes() == quantized(img).tobytes()
+    assert panel_image(display).tobytes() == quantized(display._get_frame_buf()).tobytes()
+
+def test_bw_update_uses_1bpp():
+    display = make_display()
+    display.draw_full(DisplayModes.GC16)
+
+    display.frame_buf.paste(0x00, box=(20, 4, 28, 12))
+    display.draw_partial(DisplayModes.DU)
+
+    loads = [args for cmd, args in display.epd.spi.commands if cmd == Commands.LD_IMG_AREA]
+    pixel_format = (loads[-1][0] >> 4) & 0xF
+    assert pixel_format == PixelModes.M_8BPP
+    # 16 pixels to a word, 8 pixels to a byte
+    assert loads[-1][1:] == (16//8, 0, 16//8, 16)
+
+    assert panel_image(display).tobytes() == quantized(display.frame_buf).tobytes()
+
+def test_gray_update_uses_4bpp():
+    display = make_display()
+    display.draw_full(DisplayModes.GC16)
+
+    display.frame_buf.paste(0x80, box=(20, 4, 28, 12))
+    display.draw_partial(DisplayModes.GC16)
+
+    loads = [args for cmd, args in display.epd.spi.commands if cmd == Commands.LD_IMG_AREA]
+    assert (loads[-1][0] >> 4) & 0xF == PixelModes.M_4BPP
+    assert panel_image(display).tobytes() == quantized(display.frame_buf).tobytes()
+
+def test_invisible_changes_are_not_sent():
+    display = make_display()
+    display.frame_buf.paste(0x80, box=(0, 0, 64, 32))
+    display.draw_full(DisplayModes.GC16)
+    n = len(refreshes(display))
+
+    # the same gray level at 4 bits
+    display.frame_buf.paste(0x8C, box=(8, 8, 24, 16))
+    display.draw_partial(DisplayModes.GC16)
+    display.draw_partial(DisplayModes.DU)
+    assert len(refreshes(display)) == n
+
+def test_partial_box():
+    display = make_display(rotate='CW')
+    display.draw_full(DisplayModes.GC16)
+
+    # frame_buf is 32 wide, 64 high. only the box is looked at
+    display.frame_buf.paste(0x00, box=(4, 40, 12, 48))
+    display.draw_partial(DisplayModes.GC16, box=(0, 32, 16, 64))
+    assert panel_image(display).tobytes() == quantized(display._get_frame_buf()).tobytes()
+
+    display.frame_buf.paste(0x00, box=(20, 0, 28, 8))
+    display.draw_partial(DisplayModes.GC16, box=(0, 32, 16, 64))
+    # the change outside of the box is not drawn
+    assert panel_image(display).getpixel((59, 24)) == 0xF0
+
+def test_async_draws():
+    display = make_display(max_pending_draws=1)
+    display.draw_full(DisplayModes.GC16)
+
+    futures = []
+    expected = []
+    for x in range(0, 64, 16):
+        display.frame_buf.paste(0x00, box=(x, 0, x+16, 16))
+        expected.append(quantized(display.frame_buf))
+        futures.append(display.draw_partial_async(DisplayModes.GC16))
+        # the frame buffer was copied, drawing on it doesn't affect the queued update
+        display.frame_buf.paste(0x80, box=(x, 16, x+16, 32))
+        display.frame_buf.paste(0xFF, box=(x, 16, x+16, 32))
+
+    for f in futures:
+        f.result()
+    assert panel_image(display).tobytes() == expected[-1].tobytes()
+
+    # sync draws wait for the queued ones
+    display.frame_buf.paste(0x80, box=(0, 16, 64, 32))
+    display.draw_partial_async(DisplayModes.GC16)
+    display.frame_buf.paste(0x00, box=(0, 16, 64, 32))
+    display.draw_partial(DisplayModes.GC16)
+    assert panel_image(display).tobytes() == quantized(display.frame_buf).tobytes()
+    display.close()
+
+def test_read_img_area():
+    display = make_display()
+    img = Image.frombytes('L', DIMS, bytes(range(256))*(DIMS[0]*DIMS[1]//256))
+    display.frame_buf.paste(img)
+    display.draw_full(DisplayModes.GC16)
+
+    # an odd area, and full rows
+    for box in [(3, 5, 28, 9), (0, 4, 64, 12)]:
+        dims = (box[2]-box[0], box[3]-box[1])
+        data = display.epd.read_img_area(box[:2], dims)
+        assert bytes(data) == quantized(img).crop(box).tobytes()
+
+def test_restore_prev_frame():
+    display = make_display(restore_frame=True)
+    # nothing to restore on a fresh controller
+    assert display.prev_frame is None
+
+    display.frame_buf.paste(0x80, box=(0, 0, 64, 32))
+    display.draw_full(DisplayModes.GC16)
+    # sent at 1bpp
+    display.frame_buf.paste(0x00, box=(16, 0, 32, 16))
+    display.draw_partial(DisplayModes.DU)
+    display.frame_buf.paste(0x40, box=(40, 20, 44, 24))
+    display.draw_partial(DisplayModes.GC16)
+
+    # as if the process had restarted
+    restarted = AutoEPDDisplay(epd=EPD(vcom=-2.0, spi=display.epd.spi), restore_frame=True)
+    assert restarted.prev_frame.tobytes() == panel_image(display).tobytes()
+    assert restarted.frame_buf.tobytes() == panel_image(display).tobytes()
+
+    # only what changed since is sent
+    n = len(refreshes(restarted))
+    restarted.frame_buf.paste(0x00, box=(40, 20, 44, 24))
+    restarted.draw_partial(DisplayModes.GC16)
+    assert refreshes(restarted)[n:] == [(40, 20, 4, 4, DisplayModes.GC16)]
+
+    # after showing a preloaded frame, the image buffer doesn't match the panel
+    restarted.preload('blank', Image.new('L', DIMS, 0xFF))
+    restarted.display_preloaded('blank')
+    assert not restarted.restore_prev_frame()
+
+def refreshes(display):
+    '''
+    (x, y, width, height, mode) of each area the panel was told to refresh
+    '''
+    return [args[:5] for cmd, args in display.epd.spi.commands
+            if cmd in (Commands.DPY_AREA, Commands.DPY_BUF_AREA)]
+
+def test_gray_debt_is_per_tile():
+    display = make_display(track_gray=True, gray_tile_size=16)
+    display.draw_full(DisplayModes.GC16)
+
+    # black/white intermediates in two opposite corners
+    display.frame_buf.paste(0x80, box=(0, 0, 4, 4))
+    display.draw_partial(DisplayModes.DU)
+    assert display.epd.spi.panel[0] == 0x00
+    display.frame_buf.paste(0x00, box=(52, 20, 56, 24))
+    display.draw_partial(DisplayModes.DU)
+    assert list(display.gray_debt) == [1, 0, 0, 0,
+                                       0, 0, 0, 1]
+
+    # a grayscale update cleans up only those two tiles, not everything between
+    n = len(refreshes(display))
+    display.frame_buf.paste(0x80, box=(20, 4, 24, 8))
+    display.draw_partial(DisplayModes.GC16)
+    assert refreshes(display)[n:] == [
+        (20, 4, 4, 4, DisplayModes.GC16),
+        (0, 0, 16, 16, DisplayModes.GC16),
+        (48, 16, 16, 16, DisplayModes.GC16),
+    ]
+    assert not any(display.gray_debt)
+    assert panel_image(display).tobytes() == quantized(display.frame_buf).tobytes()
+
+def test_ghosting_threshold():
+    display = make_display(track_gray=True, gray_tile_size=16, ghosting_threshold=2)
+    display.draw_full(DisplayModes.GC16)
+
+    display.frame_buf.paste(0x80, box=(20, 4, 24, 8))
+    display.draw_partial(DisplayModes.DU)
+    n = len(refreshes(display))
+
+    display.frame_buf.paste(0x00, box=(24, 4, 28, 8))
+    display.draw_partial(DisplayModes.DU)
+    assert refreshes(display)[n:] == [
+        (16, 0, 16, 16, DisplayModes.DU),
+        (16, 0, 16, 16, DisplayModes.GC16),
+    ]
+    assert not any(display.gray_debt)
+    assert panel_image(display).tobytes() == quantized(display.frame_buf).tobytes()
+
+def main():
+    test_draw_full()
+    test_preload()
+    test_preload_rotated()
+    test_bw_update_uses_1bpp()
+    test_gray_update_uses_4bpp()
+    test_invisible_changes_are_not_sent()
+    test_partial_box()
+    test_async_draws()
+    test_read_img_area()
+    test_restore_prev_frame()
+    test_gray_debt_is_per_tile()
+    test_ghosting_threshold()
+    print('All tests passed')
+
+if __name__ == '__main__':
+    main()
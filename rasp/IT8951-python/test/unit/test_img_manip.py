@@ -1,7 +1,8 @@
 
-from IT8951.img_manip import make_changes_bw
+from IT8951.img_manip import make_changes_bw, pack_4bpp, unpack_4bpp, diff_box_4bpp, pack_pixels
 
-from PIL import Image
+import pytest
+from PIL import Image, ImageOps
 
 DIMS = (1200, 400)
 
@@ -20,6 +21,86 @@ def draw_gradient(img):
         )
         img.paste(color, box=box)
 
+def test_pack_4bpp():
+    # odd width, so rows end in half a byte
+    width = 5
+    pixels = bytes([0x00, 0x1F, 0x2E, 0x3D, 0xFF,
+                    0x80, 0x81, 0x90, 0xA0, 0x0F])
+    packed = pack_4bpp(pixels, width)
+    assert bytes(packed) == bytes([0x01, 0x23, 0xF0, 0x88, 0x9A, 0x00])
+
+    quantized = bytes(x & 0xF0 for x in pixels)
+    assert bytes(unpack_4bpp(packed, width, (0, 0, 5, 2))) == quantized
+    assert bytes(unpack_4bpp(packed, width, (1, 1, 4, 2))) == quantized[6:9]
+
+def test_diff_box_4bpp():
+    img1 = Image.new('L', (37, 20), 0x80)
+    img2 = img1.copy()
+    # only the low 4 bits change, which the display doesn't show
+    img2.paste(0x8F, (0, 0, 37, 20))
+    a = pack_4bpp(img1.tobytes(), 37)
+    assert diff_box_4bpp(a, pack_4bpp(img2.tobytes(), 37), 37, (0, 0, 37, 20)) is None
+
+    img2.paste(0x00, (3, 4, 8, 9))
+    img2.paste(0xF0, (36, 12, 37, 13))
+    b = pack_4bpp(img2.tobytes(), 37)
+    assert diff_box_4bpp(a, b, 37, (0, 0, 37, 20)) == (3, 4, 37, 13)
+    assert diff_box_4bpp(a, b, 37, (0, 0, 10, 10)) == (3, 4, 8, 9)
+    assert diff_box_4bpp(a, b, 37, (8, 0, 36, 20)) is None
+
+def unpack_pixels(packed, bpp, n):
+    '''
+    The pixels packed by pack_pixels, as the display stores them
+    '''
+    pix_per_byte = 8 // bpp
+    mask = (1 << bpp) - 1
+    return bytes(((packed[i // pix_per_byte] >> (8 - bpp*(i % pix_per_byte + 1))) & mask) << (8-bpp)
+                 for i in range(n))
+
+def quantized(img, bpp):
+    return img.point(lambda x: (x >> (8-bpp)) << (8-bpp)).tobytes()
+
+def test_pack_pixels():
+    pixels = bytes([0x00, 0x1F, 0x2E, 0x3D, 0xFF])
+    # padded to a full word
+    assert bytes(pack_pixels(pixels, 4)) == bytes([0x01, 0x23, 0xF0, 0x00])
+    assert bytes(pack_pixels(pixels, 8)) == pixels + bytes(1)
+    assert bytes(pack_pixels(pixels, 2)) == bytes([0x00, 0xC0])
+
+@pytest.mark.parametrize('bpp', [2, 4, 8])
+def test_pack_pixels_transforms(bpp):
+    # odd width, so that mirrored rows don't line up with bytes or words
+    img = Image.new('L', (37, 11))
+    img.putdata([(x*7 + y*13) % 256 for y in range(11) for x in range(37)])
+    buf = img.tobytes()
+    n = len(buf)
+
+    def packed(**kwargs):
+        return unpack_pixels(pack_pixels(buf, bpp, **kwargs), bpp, n)
+
+    assert packed() == quantized(img, bpp)
+
+    gamma = bytes(round(255 * (x/255)**2.2) for x in range(256))
+    assert packed(lut=gamma) == quantized(img.point(list(gamma)), bpp)
+
+    inverted = bytes(255-x for x in range(256))
+    assert packed(lut=inverted) == quantized(ImageOps.invert(img), bpp)
+
+    contrast = bytes(min(255, max(0, 2*(x-64))) for x in range(256))
+    assert packed(lut=contrast) == quantized(img.point(list(contrast)), bpp)
+
+    mirrored = img.transpose(Image.FLIP_LEFT_RIGHT)
+    assert packed(width=img.width, mirror=True) == quantized(mirrored, bpp)
+    assert packed(lut=gamma, width=img.width, mirror=True) == quantized(mirrored.point(list(gamma)), bpp)
+
+def test_pack_pixels_bad_transforms():
+    with pytest.raises(ValueError):
+        pack_pixels(bytes(8), 4, lut=bytes(255))
+    with pytest.raises(ValueError):
+        pack_pixels(bytes(8), 4, mirror=True)
+    with pytest.raises(ValueError):
+        pack_pixels(bytes(8), 4, width=3, mirror=True)
+
 def main():
     img1 = Image.new('L', DIMS)
     draw_gradient(img1)
@@ -0,0 +1,101 @@
+
+from array import array
+
+from PIL import Image, ImageOps
+
+from IT8951.constants import Commands, Registers
+from IT8951.emulator import EmulatedSPI
+from IT8951.interface import EPD
+
+def make_epd():
+    spi = EmulatedSPI(width=64, height=32, img_buf_address=0x1000, frames=1)
+    return EPD(vcom=-2.0, spi=spi)
+
+def register_reads(epd):
+    return [args for cmd, args in epd.spi.commands if cmd == Commands.REG_RD]
+
+def test_written_registers_are_cached():
+    epd = make_epd()
+    assert epd.read_register(Registers.I80CPCR) == 0x1
+    assert epd.read_register(Registers.LISAR) == 0x1000
+    assert register_reads(epd) == []
+
+    # unless asked not to
+    assert epd.read_register(Registers.LISAR, cached=False) == 0x1000
+    assert register_reads(epd) == [(Registers.LISAR,)]
+
+def test_volatile_registers_are_not_cached():
+    epd = make_epd()
+    epd.read_register(Registers.LUTAFSR)
+    epd.read_register(Registers.LUTAFSR)
+    assert len(register_reads(epd)) == 2
+
+def test_read_registers():
+    epd = make_epd()
+    epd.spi.registers[Registers.UP1SR] = 0x1234
+    out = array('H', [0, 0, 0])
+    epd.read_registers([Registers.LISAR+2, Registers.LISAR, Registers.UP1SR], out)
+    assert out.tolist() == [0x0000, 0x1000, 0x1234]
+    assert register_reads(epd) == [(Registers.UP1SR,)]
+
+def test_vcom_is_cached():
+    epd = make_epd()
+    assert epd.get_vcom() == -2.0
+    assert epd.get_vcom(cached=False) == -2.0
+    reads = [args for cmd, args in epd.spi.commands if cmd == Commands.VCOM and args == (0,)]
+    assert len(reads) == 1
+
+def test_load_transformed():
+    epd = make_epd()
+    img = Image.new('L', (24, 8))
+    img.putdata([(x*11 + y*3) % 256 for y in range(8) for x in range(24)])
+    inverted = bytes(255-x for x in range(256))
+
+    epd.load_img_area(img.tobytes(), xy=(8, 4), dims=img.size, lut=inverted, mirror=True)
+    expected = ImageOps.invert(img.transpose(Image.FLIP_LEFT_RIGHT)).point(lambda x: x & 0xF0)
+    assert epd.read_img_area((8, 4), img.size) == expected.tobytes()
+
+    # the whole display, rows as wide as the panel
+    full = Image.new('L', (64, 32))
+    full.putdata([(x*5) % 256 for y in range(32) for x in range(64)])
+    epd.load_img_area(full.tobytes(), mirror=True)
+    expected = full.transpose(Image.FLIP_LEFT_RIGHT).point(lambda x: x & 0xF0)
+    assert epd.read_img_area((0, 0), full.size) == expected.tobytes()
+
+def test_load_restores_image_buffer():
+    epd = make_epd()
+    slot = epd.frame_slot_address(0)
+
+    # a bad pixel format is caught before anything is sent
+    n = len(epd.spi.commands)
+    try:
+        epd.load_img_area(bytes(16), xy=(0, 0), dims=(4, 4), pixel_format=7, address=slot)
+    except ValueError:
+        pass
+    else:
+        assert False, 'expected ValueError'
+    assert len(epd.spi.commands) == n
+
+    # an error while loading leaves the loads going to the image buffer
+    def broken_write(*args, **kwargs):
+        raise OSError('SPI error')
+    epd.spi.pack_and_write_pixels = broken_write
+    try:
+        epd.load_img_area(bytes(16), xy=(0, 0), dims=(4, 4), address=slot)
+    except OSError:
+        pass
+    else:
+        assert False, 'expected OSError'
+    assert epd.read_register(Registers.LISAR, cached=False) == 0x1000
+
+def main():
+    test_written_registers_are_cached()
+    test_volatile_registers_are_not_cached()
+    test_read_registers()
+    test_vcom_is_cached()
+    test_load_transformed()
+    test_load_restores_image_buffer()
+    print('All tests passed')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+from PIL import Image
+
+from IT8951.display import AutoEPDDisplay
+from IT8951.emulator import EmulatedSPI
+from IT8951.interface import EPD
+from IT8951.multi import MultiDisplay
+
+DIMS = (64, 32)
+
+def make_display():
+    spi = EmulatedSPI(width=DIMS[0], height=DIMS[1], img_buf_address=0x1000, frames=8)
+    return AutoEPDDisplay(epd=EPD(vcom=-2.0, spi=spi))
+
+def panel_image(display):
+    return Image.frombytes('L', DIMS, bytes(display.epd.spi.panel))
+
+def test_draw_full():
+    images = {
+        'left': Image.new('L', DIMS, 0x00),
+        'right': Image.new('L', DIMS, 0x80),
+    }
+    with MultiDisplay({name: make_display() for name in images}) as multi:
+        # images can also be produced in the worker threads
+        timings = multi.draw_full({'left': images['left'], 'right': lambda: images['right']})
+
+        assert set(timings) == {'left', 'right'}
+        for name, img in images.items():
+            assert panel_image(multi.displays[name]).tobytes() == img.tobytes()
+
+def test_failing_panel():
+    with MultiDisplay({'left': make_display(), 'right': make_display()}) as multi:
+        def fail():
+            raise IOError('no image')
+
+        try:
+            multi.draw_partial({'left': Image.new('L', DIMS, 0x00), 'right': fail})
+        except RuntimeError as e:
+            assert 'right' in str(e)
+        else:
+            assert False, 'expected an error'
+
+        # the other panel was still updated
+        assert all(x == 0x00 for x in multi.displays['left'].epd.spi.panel)
+
+def main():
+    test_draw_full()
+    test_failing_panel()
+    print('All tests passed')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+
+from time import sleep
+
+from IT8951.constants import Commands, DisplayModes, PowerStates, Registers
+from IT8951.display import AutoEPDDisplay
+from IT8951.emulator import EmulatedSPI
+from IT8951.interface import EPD
+from IT8951.power import PowerManager
+
+DIMS = (64, 32)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def make_epd(**kwargs):
+    spi = EmulatedSPI(width=DIMS[0], height=DIMS[1], img_buf_address=0x1000, frames=8)
+    return EPD(vcom=-2.0, spi=spi, **kwargs)
+
+def power_commands(epd):
+    return [cmd for cmd, _ in epd.spi.commands
+            if cmd in (Commands.SYS_RUN, Commands.STANDBY, Commands.SLEEP)]
+
+def test_wakes_up_before_commands():
+    epd = make_epd()
+    epd.sleep()
+    assert epd.spi.power_state == Commands.SLEEP
+
+    # the emulator raises if a command arrives while asleep
+    epd.load_img_area(bytes([0x00]*16), xy=(0, 0), dims=(4, 4))
+    epd.display_area((0, 0), (4, 4), DisplayModes.GC16)
+    assert epd.spi.power_state == Commands.SYS_RUN
+    assert power_commands(epd) == [Commands.SLEEP, Commands.SYS_RUN]
+    assert epd.spi.panel[0] == 0x00
+
+    stats = epd.power.stats()
+    assert stats['state'] == 'run'
+    assert stats['entered'] == {'run': 1, 'standby': 0, 'sleep': 1}
+
+def test_idle_timeout():
+    clock = FakeClock()
+    epd = make_epd()
+    # without a background thread, check_idle is called by hand
+    epd.power = PowerManager(epd, clock=clock)
+    epd.power.idle_timeout = 10
+
+    clock.now = 4
+    assert epd.power.check_idle() == 6
+    epd.display_area((0, 0), (4, 4), DisplayModes.GC16)
+    clock.now = 13
+    assert epd.power.check_idle() == 1
+    assert epd.power.state == PowerStates.RUN
+
+    clock.now = 14
+    assert epd.power.check_idle() is None
+    assert epd.power.state == PowerStates.STANDBY
+
+    clock.now = 20
+    epd.display_area((0, 0), (4, 4), DisplayModes.GC16)
+    clock.now = 25
+    stats = epd.power.stats()
+    assert stats['seconds']['standby'] == 6
+    assert stats['seconds']['run'] == 19
+    assert stats['entered']['standby'] == 1
+
+def test_no_standby_during_operations():
+    clock = FakeClock()
+    epd = make_epd()
+    epd.power = PowerManager(epd, clock=clock)
+    epd.power.idle_timeout = 10
+
+    load_pixels = epd.spi.pack_and_write_pixels
+    def slow_pixels(*args, **kwargs):
+        # the idle thread gets to run in the middle of the transfer
+        clock.now += 100
+        assert epd.power.check_idle() is None
+        load_pixels(*args, **kwargs)
+    epd.spi.pack_and_write_pixels = slow_pixels
+
+    epd.load_img_area(bytes([0x00]*16), xy=(0, 0), dims=(4, 4))
+    assert power_commands(epd) == []
+    assert epd.power.state == PowerStates.RUN
+
+    # counted from the end of the operation
+    clock.now += 9
+    assert epd.power.check_idle() == 1
+    clock.now += 1
+    assert epd.power.check_idle() is None
+    assert power_commands(epd) == [Commands.STANDBY]
+
+    # cached reads don't wake the controller up
+    epd.read_register(Registers.I80CPCR)
+    assert epd.power.state == PowerStates.STANDBY
+
+def test_idle_thread():
+    display = AutoEPDDisplay(epd=make_epd(idle_timeout=0.05, idle_state=PowerStates.SLEEP))
+    display.frame_buf.paste(0x00, box=(0, 0, 16, 16))
+    display.draw_full(DisplayModes.GC16)
+
+    for _ in range(100):
+        if display.epd.spi.power_state == Commands.SLEEP:
+            break
+        sleep(0.01)
+    assert display.epd.spi.power_state == Commands.SLEEP
+
+    display.frame_buf.paste(0xFF, box=(0, 0, 16, 16))
+    display.draw_partial(DisplayModes.DU)
+    assert display.epd.spi.panel[0] == 0xF0
+    assert display.epd.power.stats()['entered']['run'] >= 1
+    display.close()
+
+def main():
+    test_wakes_up_before_commands()
+    test_idle_timeout()
+    test_no_standby_during_operations()
+    test_idle_thread()
+    print('All tests passed')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+
+import os
+import tempfile
+
+from PIL import Image
+
+from IT8951.constants import Commands, DisplayModes
+from IT8951.display import AutoEPDDisplay
+from IT8951.emulator import EmulatedSPI
+from IT8951.interface import EPD
+from IT8951.shared import SharedFrame
+
+DIMS = (64, 32)
+
+def make_display(path):
+    spi = EmulatedSPI(width=DIMS[0], height=DIMS[1], img_buf_address=0x1000, frames=8)
+    # pixel loads are easier to follow at 4bpp
+    return AutoEPDDisplay(epd=EPD(vcom=-2.0, spi=spi), shared_frame=path, allow_1bpp=False)
+
+def panel_image(display):
+    return Image.frombytes('L', DIMS, bytes(display.epd.spi.panel))
+
+def loads(display):
+    rtn = [args[1:5] for cmd, args in display.epd.spi.commands if cmd == Commands.LD_IMG_AREA]
+    display.epd.spi.commands.clear()
+    return rtn
+
+def test_commits():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'frame')
+        display = make_display(path)
+        display.draw_full(DisplayModes.INIT)
+        loads(display)
+
+        producer = SharedFrame(path)
+        assert (producer.width, producer.height) == DIMS
+
+        # nothing to draw until a commit
+        assert display.draw_commits(timeout=0) == 0
+
+        producer.image.paste(0x00, (8, 8, 16, 16))
+        producer.commit((8, 8, 16, 16))
+        assert display.draw_commits(timeout=1) == 1
+        assert loads(display) == [(8, 8, 8, 8)]
+        assert panel_image(display).getpixel((8, 8)) == 0x00
+
+        # changes out of the committed box are not looked at
+        producer.pixels[2*DIMS[0] + 40] = 0x00
+        producer.image.paste(0x00, (16, 24, 20, 28))
+        producer.commit((16, 24, 20, 28), mode=DisplayModes.DU)
+        assert display.draw_commits(timeout=1) == 1
+        assert panel_image(display).getpixel((40, 2)) == 0xF0
+        assert panel_image(display).getpixel((16, 24)) == 0x00
+
+        # until a commit without a box
+        producer.commit()
+        assert display.draw_commits(timeout=1) == 1
+        assert panel_image(display).getpixel((40, 2)) == 0x00
+        assert panel_image(display).tobytes() == display.frame_buf.point(lambda x: x & 0xF0).tobytes()
+
+        producer.close()
+        display.close()
+
+def test_commits_are_merged():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'frame')
+        display = make_display(path)
+        display.draw_full(DisplayModes.INIT)
+        loads(display)
+
+        producer = SharedFrame(path)
+        producer.image.paste(0x00, (0, 0, 8, 8))
+        producer.commit((0, 0, 8, 8))
+        producer.image.paste(0x00, (24, 8, 32, 16))
+        producer.commit((24, 8, 32, 16))
+        assert display.draw_commits(timeout=1) == 2
+        assert loads(display) == [(0, 0, 32, 16)]
+
+        producer.close()
+        display.close()
+
+def test_reused_after_restart():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'frame')
+        display = make_display(path)
+        producer = SharedFrame(path)
+        producer.image.paste(0x80, (0, 0, 8, 8))
+        display.close()
+
+        display = make_display(path)
+        assert display.frame_buf.getpixel((0, 0)) == 0x80
+        producer.commit()
+        assert display.draw_commits(timeout=1) == 1
+        assert panel_image(display).getpixel((0, 0)) == 0x80
+
+        producer.close()
+        display.close()
+
+def main():
+    test_commits()
+    test_commits_are_merged()
+    test_reused_after_restart()
+    print('All tests passed')
+
+if __name__ == '__main__':
+    main()
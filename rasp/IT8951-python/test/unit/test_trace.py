@@ -0,0 +1,87 @@
+
+import os
+import tempfile
+import warnings
+
+from PIL import Image
+
+from IT8951.constants import DisplayModes
+from IT8951.display import AutoEPDDisplay
+from IT8951.emulator import EmulatedSPI
+from IT8951.interface import EPD
+from IT8951.trace import Trace, TraceRecorder, replay
+
+DIMS = (64, 32)
+
+def make_display(**kwargs):
+    spi = EmulatedSPI(width=DIMS[0], height=DIMS[1], img_buf_address=0x1000, frames=8)
+    return AutoEPDDisplay(epd=EPD(vcom=-2.0, spi=spi), **kwargs)
+
+def panel_image(display):
+    return Image.frombytes('L', DIMS, bytes(display.epd.spi.panel))
+
+def record_updates(path):
+    display = make_display(trace=path)
+    display.draw_full(DisplayModes.GC16)
+    display.frame_buf.paste(0x00, box=(20, 4, 28, 12))
+    display.draw_partial(DisplayModes.DU)
+    display.frame_buf.paste(0x80, box=(0, 16, 8, 24))
+    display.draw_partial(DisplayModes.GC16)
+    display.trace.close()
+    return display
+
+def test_record_and_replay():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'updates.trace')
+        recorded = record_updates(path)
+
+        trace = Trace(path)
+        assert trace.display_dims == DIMS
+        events = list(trace)
+        assert [(e.xy, e.dims, e.mode) for e in events] == [
+            ((0, 0), DIMS, DisplayModes.GC16),
+            ((16, 0), (16, 16), DisplayModes.DU),
+            ((0, 16), (8, 8), DisplayModes.GC16),
+        ]
+        assert all(e.duration >= 0 for e in events)
+
+        replayed = make_display()
+        stats = replay(trace, replayed)
+        assert stats['updates'] == 3
+        assert panel_image(replayed).tobytes() == panel_image(recorded).tobytes()
+
+        # recording more appends to the trace
+        record_updates(path)
+        assert len(list(Trace(path))) == 6
+
+def test_incomplete_record():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'updates.trace')
+        record_updates(path)
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 3)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            assert len(list(Trace(path))) == 2
+        assert len(caught) == 1
+
+def test_dimensions_must_match():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'updates.trace')
+        TraceRecorder(path, DIMS).close()
+        try:
+            TraceRecorder(path, (32, 32))
+        except ValueError:
+            pass
+        else:
+            assert False, 'expected a ValueError'
+
+def main():
+    test_record_and_replay()
+    test_incomplete_record()
+    test_dimensions_must_match()
+    print('All tests passed')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,384 @@
+#!/usr/bin/python3
+
+# Battery analytics from the local status.log files, without network access.
+#
+# Charge level, voltage, temperature and current are logged on every wake. The
+# values are parsed into columns (time, value) that are cached next to an index
+# of how far each log file has been read, so consecutive runs only parse the
+# lines that were added since. Log files are identified by inode, so rotated
+# copies (status.log.1 etc.) are not parsed again after a rename.
+#
+# Log timestamps are in the local time of the Pi, and are read in the local
+# time zone of this machine (set TZ=Europe/Helsinki when analyzing elsewhere).
+#
+#     python battery_stats.py
+#     python battery_stats.py --png graph.png
+
+import os
+import re
+import glob
+import json
+import time
+import bisect
+import argparse
+from array import array
+from datetime import datetime
+
+LOG_PATHS = '/home/pi/status.log*'
+CACHE_DIR = '/home/pi/.battery-stats'
+# How many days back the charge level is fitted to predict when it reaches 0%
+PREDICTION_DAYS = 14
+SHOW_DAYS = 30
+# Caches written with another version are parsed again from the logs
+CACHE_VERSION = 2
+
+LOG_LINE_RE = re.compile(rb'^(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d) \w+\t(.*)$')
+METRIC_RES = {
+    'charge': re.compile(rb"^Charge level: .*'data': (-?\d+)"),
+    'voltage': re.compile(rb"^GetBatteryVoltage: .*'data': (-?\d+)"),
+    'temperature': re.compile(rb"^GetBatteryTemperature: .*'data': (-?\d+)"),
+    'current': re.compile(rb"^GetBatteryCurrent: .*'data': (-?\d+)"),
+}
+# Lines that mark events rather than measurements, recorded as value 1.0 or 0.0
+EVENT_PREFIXES = {
+    'wake': [(b'Running main_wrapper', 1.0)],
+    'on_battery': [(b'Raspberry PI runs on battery power', 1.0),
+                   (b'Raspberry PI is on cable-connected power', 0.0)],
+}
+COLUMNS = list(METRIC_RES) + list(EVENT_PREFIXES)
+
+
+class Column:
+    '''
+    Timestamps (seconds since epoch, UTC) and values of one metric
+    '''
+
+    def __init__(self, times=None, values=None):
+        self.times = times if times is not None else array('d')
+        self.values = values if values is not None else array('d')
+
+    def __len__(self):
+        return len(self.times)
+
+    def append(self, t, value):
+        self.times.append(t)
+        self.values.append(value)
+
+    def sorted(self):
+        order = sorted(range(len(self.times)), key=self.times.__getitem__)
+        return Column(array('d', (self.times[i] for i in order)),
+                      array('d', (self.values[i] for i in order)))
+
+    def since(self, t):
+        i = bisect.bisect_left(self.times, t)
+        return Column(self.times[i:], self.values[i:])
+
+
+class LogStore:
+    '''
+    Columns parsed from the logs, and how far each log file has been read
+    '''
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.offsets = {}
+        self.columns = {name: Column() for name in COLUMNS}
+        self._saved_lengths = {name: 0 for name in COLUMNS}
+
+    def _path(self, name, kind):
+        return os.path.join(self.cache_dir, '{}.{}'.format(name, kind))
+
+    def load(self):
+        try:
+            with open(os.path.join(self.cache_dir, 'index.json')) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        if index.get('version') != CACHE_VERSION:
+            return
+
+        for name in COLUMNS:
+            # The columns may have more items than the index says, if a
+            # previous run was interrupted after appending to them
+            length = index['lengths'].get(name, 0)
+            column = Column()
+            try:
+                with open(self._path(name, 'times'), 'rb') as f:
+                    column.times.fromfile(f, length)
+                with open(self._path(name, 'values'), 'rb') as f:
+                    column.values.fromfile(f, length)
+            except (OSError, EOFError):
+                # Cache is unusable, start over
+                self.__init__(self.cache_dir)
+                return
+            self.columns[name] = column
+            self._saved_lengths[name] = length
+
+        self.offsets = index['offsets']
+
+    def save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for name, column in self.columns.items():
+            saved = self._saved_lengths[name]
+            for kind, ary in (('times', column.times), ('values', column.values)):
+                path = self._path(name, kind)
+                with open(path, 'ab') as f:
+                    f.truncate(saved * ary.itemsize)
+                    ary[saved:].tofile(f)
+            self._saved_lengths[name] = len(column)
+
+        index = {
+            'version': CACHE_VERSION,
+            'offsets': self.offsets,
+            'lengths': self._saved_lengths,
+        }
+        tmp_path = os.path.join(self.cache_dir, 'index.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, os.path.join(self.cache_dir, 'index.json'))
+
+    def update(self, path):
+        '''
+        Parse the lines added to a log file since the previous update.
+        Returns how many lines were parsed.
+        '''
+        stat = os.stat(path)
+        key = '{}:{}'.format(stat.st_dev, stat.st_ino)
+        offset = self.offsets.get(key, 0)
+        if stat.st_size < offset:
+            # Truncated (e.g. logrotate copytruncate), everything is new
+            offset = 0
+
+        count = 0
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # The line is still being written, read it next time
+                    break
+                offset += len(line)
+                count += 1
+                self._parse_line(line.rstrip(b'\n'))
+
+        self.offsets[key] = offset
+        return count
+
+    def _parse_line(self, line):
+        match = LOG_LINE_RE.match(line)
+        if not match:
+            return
+        message = match.group(7)
+
+        for name, regex in METRIC_RES.items():
+            value_match = regex.match(message)
+            if value_match:
+                self.columns[name].append(_timestamp(match), float(value_match.group(1)))
+                return
+
+        for name, prefixes in EVENT_PREFIXES.items():
+            for prefix, value in prefixes:
+                if message.startswith(prefix):
+                    self.columns[name].append(_timestamp(match), value)
+                    return
+
+
+def _timestamp(match):
+    # Faster than strptime, which matters for the first run over large logs.
+    # Local time, DST is looked up (-1) as the logs don't tell it.
+    fields = tuple(int(match.group(i)) for i in range(1, 7))
+    return time.mktime(fields + (0, 0, -1))
+
+
+def linear_fit(xs, ys):
+    '''
+    Least squares fit of y = a*x + b. Returns (a, b, stddev of residuals).
+    '''
+    n = len(xs)
+    if n < 2:
+        raise ValueError('At least two points are needed for a fit')
+
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    if sxx == 0:
+        raise ValueError('All points are at the same time')
+
+    a = sxy / sxx
+    b = mean_y - a * mean_x
+    residuals = sum((y - (a * x + b)) ** 2 for x, y in zip(xs, ys))
+    stddev = (residuals / max(n - 2, 1)) ** 0.5
+    return a, b, stddev
+
+
+def discharge_per_wake(charge, on_battery):
+    '''
+    Average charge drop between consecutive charge readings, when both wakes
+    ran on battery. Returns (average drop in percent, number of wake pairs).
+    '''
+    def battery_at(t):
+        # The power source is logged right after the charge level
+        i = bisect.bisect_left(on_battery.times, t)
+        if i < len(on_battery) and on_battery.times[i] - t < 60:
+            return on_battery.values[i] == 1.0
+        return False
+
+    on = [battery_at(t) for t in charge.times]
+    drops = [charge.values[i] - charge.values[i+1] for i in range(len(charge) - 1)
+             if on[i] and on[i+1] and charge.values[i] >= charge.values[i+1]]
+    if not drops:
+        return None, 0
+    return sum(drops) / len(drops), len(drops)
+
+
+def analyze(columns, now=None, prediction_days=PREDICTION_DAYS):
+    now = now if now is not None else time.time()
+    charge = columns['charge']
+    result = {'latest': {}}
+    for name in METRIC_RES:
+        if len(columns[name]):
+            result['latest'][name] = (columns[name].times[-1], columns[name].values[-1])
+
+    recent = charge.since(now - prediction_days * 24 * 3600)
+    try:
+        a, b, stddev = linear_fit(recent.times, recent.values)
+        result['fit'] = {
+            'a': a,
+            'b': b,
+            'stddev': stddev,
+            'per_day': a * 24 * 3600,
+            'empty_time': -b / a if a < 0 else None,
+        }
+    except ValueError:
+        result['fit'] = None
+
+    result['discharge_per_wake'], result['wake_pairs'] = discharge_per_wake(
+        charge, columns['on_battery'])
+
+    wakes = columns['wake'].since(now - prediction_days * 24 * 3600)
+    result['wakes_per_day'] = len(wakes) / prediction_days
+    return result
+
+
+def format_time(t):
+    return datetime.utcfromtimestamp(t).strftime('%Y-%m-%d %H:%M UTC')
+
+
+def print_summary(result, now):
+    units = {'charge': '%', 'voltage': 'mV', 'temperature': 'C', 'current': 'mA'}
+    for name, (t, value) in result['latest'].items():
+        print('{:>12}: {:g} {} at {}'.format(name, value, units[name], format_time(t)))
+
+    fit = result['fit']
+    if fit is None:
+        print('Not enough charge readings in the last {} days for a prediction'.format(PREDICTION_DAYS))
+    else:
+        print('Charge change: {:.2f}% per day (stddev {:.2f}%)'.format(fit['per_day'], fit['stddev']))
+        if fit['empty_time'] is not None:
+            print('Predicted empty at {}, {:.1f} days ahead'.format(
+                format_time(fit['empty_time']), (fit['empty_time'] - now) / 3600 / 24))
+
+    if result['discharge_per_wake'] is not None:
+        print('Discharge per wake on battery: {:.2f}% (from {} wakes)'.format(
+            result['discharge_per_wake'], result['wake_pairs']))
+    print('Wakes per day: {:.1f}'.format(result['wakes_per_day']))
+
+
+def plot(columns, result, path, now, show_days=SHOW_DAYS):
+    '''
+    Draw charge level (with prediction), voltage and temperature into a PNG
+    '''
+    from PIL import Image, ImageDraw
+
+    width, height = 2000, 1400
+    margin = 100
+    img = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(img)
+
+    start = now - show_days * 24 * 3600
+    end = now
+    fit = result['fit']
+    if fit is not None and fit['empty_time'] is not None:
+        end = max(end, min(fit['empty_time'], now + 365 * 24 * 3600) + 24 * 3600)
+
+    plots = [
+        ('Battery level (%)', columns['charge'].since(start), (0, 100), '#00AA00'),
+        ('Voltage (mV)', columns['voltage'].since(start), None, '#9900FF'),
+        ('Temperature (C)', columns['temperature'].since(start), (0, 80), '#FF0000'),
+    ]
+    plot_height = (height - margin) // len(plots)
+
+    for i, (title, column, y_range, color) in enumerate(plots):
+        top = margin // 2 + i * plot_height
+        box = (margin, top + 30, width - margin, top + plot_height - 30)
+        if y_range is None:
+            values = column.values or [0]
+            y_range = (min(values) - 1, max(values) + 1)
+
+        def to_xy(t, y):
+            x = box[0] + (t - start) / (end - start) * (box[2] - box[0])
+            y = box[3] - (y - y_range[0]) / (y_range[1] - y_range[0]) * (box[3] - box[1])
+            return (x, y)
+
+        draw.rectangle(box, outline='black')
+        draw.text((box[0], top + 10), title, fill='black')
+        for j in range(5):
+            y = y_range[0] + j * (y_range[1] - y_range[0]) / 4
+            draw.text((10, to_xy(start, y)[1] - 5), '{:g}'.format(round(y, 1)), fill='black')
+        day = 24 * 3600
+        for t in range(int(start // day + 1) * day, int(end), 7 * day):
+            x = to_xy(t, 0)[0]
+            draw.line([(x, box[1]), (x, box[3])], fill='#DDDDDD')
+            draw.text((x - 20, box[3] + 5), datetime.utcfromtimestamp(t).strftime('%d.%m.'), fill='black')
+
+        points = [to_xy(t, y) for t, y in zip(column.times, column.values)]
+        if len(points) > 1:
+            draw.line(points, fill=color, width=2)
+
+        if i == 0 and fit is not None:
+            t_from, t_to = now - PREDICTION_DAYS * 24 * 3600, end
+            if fit['a'] != 0:
+                # Keep the prediction line inside the plot
+                t_min, t_max = sorted((y - fit['b']) / fit['a'] for y in y_range)
+                t_from, t_to = max(t_from, t_min), min(t_to, t_max)
+            if t_from < t_to:
+                line = [to_xy(t, fit['a'] * t + fit['b']) for t in (t_from, t_to)]
+                draw.line(line, fill='black', width=1)
+
+    img.save(path)
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='eink-weather-display battery_stats.py')
+    p.add_argument('logs', nargs='*', help='Log files, by default {}'.format(LOG_PATHS))
+    p.add_argument('--cache-dir', default=CACHE_DIR,
+                   help='Where parsed values and the log file index are kept')
+    p.add_argument('--png', help='Also draw a graph into this file')
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    paths = args.logs or sorted(glob.glob(LOG_PATHS))
+
+    store = LogStore(args.cache_dir)
+    store.load()
+    for path in paths:
+        if path.endswith('.gz'):
+            print('Skipping {}, compressed logs are not supported'.format(path))
+            continue
+        count = store.update(path)
+        print('Parsed {} new lines from {}'.format(count, path))
+    store.save()
+
+    now = time.time()
+    columns = {name: column.sorted() for name, column in store.columns.items()}
+    result = analyze(columns, now)
+    print_summary(result, now)
+    if args.png:
+        plot(columns, result, args.png, now)
+        print('Wrote {}'.format(args.png))
+
+
+if __name__ == '__main__':
+    main()
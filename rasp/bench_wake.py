@@ -0,0 +1,422 @@
+#!/usr/bin/python3
+
+# Runs whole wake cycles (main.main_wrapper) on any machine, with stand-ins for
+# what only exists on the Pi: a fake PiJuice, a local HTTP server in place of
+# the render API, a fake it8951 binary driving a pretend display, and a
+# shutdown that only takes note of when it happened. Reports how long after
+# power on the weather image was on the display, and how long the Pi was awake
+# in total and per phase (as recorded by spans.py), so that changes to main.py
+# can be compared by what they cost in battery:
+#
+#     python bench_wake.py --wakes 3 --latency 2 --charge 80 79 78
+#
+# The stand-ins take time like the devices do, see the options. Their defaults
+# are rough guesses, tune them with "python spans.py summary" from the Pi.
+# Everything is written into a temporary directory.
+
+import io
+import os
+import json
+import hashlib
+import time
+import shlex
+import getopt
+import logging
+import argparse
+import tempfile
+import threading
+import subprocess
+from unittest import mock
+from contextlib import ExitStack, contextmanager
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PIL import Image, ImageDraw, ImageOps
+from stand_ins import FakePiJuice, import_main
+
+# Seconds from power on until main.py starts
+BOOT_SECS = 25
+# One PiJuice request over I2C
+I2C_CALL_SECS = 0.01
+# The render API, from request to the first byte, and then its download speed
+RENDER_LATENCY_SECS = 3
+DOWNLOAD_BYTES_PER_SEC = 1024 * 1024
+# Pixels to the display controller over USB, and how long refreshes take
+USB_BYTES_PER_SEC = 4 * 1024 * 1024
+FULL_REFRESH_SECS = 1.5
+PARTIAL_REFRESH_SECS = 0.5
+CLEAR_SECS = 1.5
+
+SERVE_CHUNK_BYTES = 16 * 1024
+
+
+class RenderServer:
+    '''
+    Stands in for the render API on a local port. Pings are answered at once,
+    image requests with the next of images (PNG files as bytes, in turn) after
+    latency seconds, sent at bytes_per_sec (None for as fast as possible).
+    Images have an ETag, and are answered with 304 Not Modified if the request
+    has it in If-None-Match.
+    '''
+
+    def __init__(self, images, latency=RENDER_LATENCY_SECS, bytes_per_sec=DOWNLOAD_BYTES_PER_SEC):
+        self.images = images
+        self.latency = latency
+        self.bytes_per_sec = bytes_per_sec
+        self.image_requests = 0
+        self.not_modified = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.respond(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = 'http://127.0.0.1:{}/'.format(self.httpd.server_address[1])
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def respond(self, request):
+        if 'ping' in parse_qs(urlparse(request.path).query):
+            body, content_type = b'ok', 'text/plain'
+        else:
+            time.sleep(self.latency)
+            body = self.images[self.image_requests % len(self.images)]
+            self.image_requests += 1
+            content_type = 'image/png'
+            etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+            if request.headers.get('If-None-Match') == etag:
+                self.not_modified += 1
+                request.send_response(304)
+                request.send_header('ETag', etag)
+                request.end_headers()
+                return
+
+        request.send_response(200)
+        request.send_header('Content-Type', content_type)
+        if content_type == 'image/png':
+            request.send_header('ETag', etag)
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        for i in range(0, len(body), SERVE_CHUNK_BYTES):
+            chunk = body[i:i + SERVE_CHUNK_BYTES]
+            request.wfile.write(chunk)
+            if self.bytes_per_sec:
+                time.sleep(len(chunk) / self.bytes_per_sec)
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeDisplay:
+    '''
+    Stands in for the subprocess module in main.py. Runs the it8951 binary (and
+    the ImageMagick commands that prepare its input) against a pretend display
+    of dims, and any other command as if it succeeded without output. Pixels
+    take bytes_per_sec to reach the controller, and refreshes take
+    full_secs, partial_secs, or clear_secs in mode 0. Each refresh is noted in
+    refreshes as (time.monotonic() at its end, 'full' | 'partial' | 'clear'),
+    and the area it covered in areas as (x, y, w, h).
+    '''
+
+    PIPE = subprocess.PIPE
+    DEVNULL = subprocess.DEVNULL
+
+    def __init__(self, binary_path, dims, bytes_per_sec=USB_BYTES_PER_SEC,
+                 full_secs=FULL_REFRESH_SECS, partial_secs=PARTIAL_REFRESH_SECS, clear_secs=CLEAR_SECS):
+        self.binary_path = binary_path
+        self.dims = dims
+        self.bytes_per_sec = bytes_per_sec
+        self.full_secs = full_secs
+        self.partial_secs = partial_secs
+        self.clear_secs = clear_secs
+        self.refreshes = []
+        self.areas = []
+
+    def run(self, cmd, shell=False, capture_output=False):
+        args = shlex.split(cmd)
+        stdin_path = None
+        if '<' in args:
+            stdin_path = args[args.index('<') + 1]
+            args = args[:args.index('<')]
+
+        if self.binary_path in args:
+            self.it8951(args[args.index(self.binary_path) + 1:], stdin_path)
+        elif args[0] == 'stream':
+            # stream -map r -storage-type char input.png output.raw
+            with open(args[-1], 'wb') as f:
+                f.write(Image.open(args[-2]).convert('L').tobytes())
+        elif args[0] == 'convert':
+            # Fits the image to the display, see display_render_image
+            ImageOps.fit(Image.open(args[1]).convert('L'), self.dims).save(args[-1])
+        return subprocess.CompletedProcess(cmd, 0, b'', b'')
+
+    def Popen(self, cmd, stdin=None, stdout=None, stderr=None):
+        return _FakeProcess(self, cmd[cmd.index(self.binary_path) + 1:])
+
+    def it8951(self, args, stdin_path=None, loaded=False):
+        opts, rest = getopt.getopt(args, 'v:m:dcnrs')
+        flags = dict(opts)
+        x, y, w, h = map(int, rest[1:5])
+        if '-s' in flags:
+            return
+
+        if '-r' not in flags and not loaded:
+            if '-c' in flags or stdin_path is None or not os.path.exists(stdin_path):
+                self.transfer(w * h)
+            else:
+                self.transfer(min(os.path.getsize(stdin_path), w * h))
+
+        if '-n' not in flags:
+            mode = int(flags.get('-m', 2))
+            if mode == 0:
+                kind, secs = 'clear', self.clear_secs
+            elif (w, h) == self.dims:
+                kind, secs = 'full', self.full_secs
+            else:
+                kind, secs = 'partial', self.partial_secs
+            time.sleep(secs)
+            self.refreshes.append((time.monotonic(), kind))
+            self.areas.append((x, y, w, h))
+
+    def transfer(self, nbytes):
+        if self.bytes_per_sec:
+            time.sleep(nbytes / self.bytes_per_sec)
+
+
+class _FakeProcess:
+    '''
+    The it8951 binary reading pixels from a pipe, see main.stream_frame
+    '''
+
+    def __init__(self, display, args):
+        self.display = display
+        self.args = args
+        self.stdin = self
+        self.returncode = None
+
+    def write(self, data):
+        self.display.transfer(len(data))
+        return len(data)
+
+    def communicate(self):
+        self.display.it8951(self.args, loaded=True)
+        self.returncode = 0
+        return None, b''
+
+
+def make_fixture(dims, seed=0):
+    '''
+    A PNG that looks enough like a weather image to compress like one: text,
+    lines and flat areas on white. Different seeds give different images.
+    '''
+    img = Image.new('L', dims, 0xFF)
+    draw = ImageDraw.Draw(img)
+    width, height = dims
+    for i in range(8):
+        x = 60 + i * (width - 120) // 8
+        draw.text((x + 20, 120), '{} C'.format((seed * 7 + i * 3) % 30), fill=0)
+        draw.ellipse((x + 20, 200, x + 140, 320), outline=0, width=4)
+        draw.rectangle((x + 20, 400, x + 140, 400 + (seed * 13 + i * 37) % 300), fill=0x80)
+    points = [(60 + i * 20, height - 200 - ((seed + i) * 17) % 150) for i in range((width - 120) // 20)]
+    draw.line(points, fill=0, width=3)
+
+    f = io.BytesIO()
+    img.save(f, 'PNG')
+    return f.getvalue()
+
+
+@contextmanager
+def working_directory(path):
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+class Bench:
+    '''
+    Runs wakes of main.py against the stand-ins, keeping what a wake leaves for
+    the next one (last frame, wake history) in workdir
+    '''
+
+    def __init__(self, workdir, pj, server, display, boot_secs=BOOT_SECS):
+        self.main = import_main()
+        self.workdir = workdir
+        self.pj = pj
+        self.server = server
+        self.display = display
+        self.boot_secs = boot_secs
+        self.shutdowns = []
+        self.recorder = self.main.spans.SpanRecorder(os.path.join(workdir, 'wake-spans.bin'))
+
+    @contextmanager
+    def stand_ins(self):
+        main = self.main
+        scheduler = main.scheduler
+        spans = main.spans
+        history_path = os.path.join(self.workdir, 'wake-history.json')
+        load_history, save_history = scheduler.load_history, scheduler.save_history
+        i2c_device = os.path.join(self.workdir, 'i2c-1')
+        open(i2c_device, 'w').close()
+
+        with ExitStack() as stack:
+            def patch(obj, name, value):
+                stack.enter_context(mock.patch.object(obj, name, value))
+
+            patch(main, 'config', {
+                'RENDER_URL': self.server.url,
+                'RENDER_API_KEY': 'bench',
+                'RENDER_LATITUDE': '60.222',
+                'RENDER_LONGITUDE': '24.83',
+                'RENDER_LOCATION_NAME': 'Espoo',
+                'RENDER_TIMEZONE': 'Europe/Helsinki',
+            })
+            patch(main, 'I2C_DEVICE', i2c_device)
+            patch(main, 'PiJuice', lambda bus, address: self.pj)
+            patch(main, 'subprocess', self.display)
+            patch(main, 'shutdown', lambda pj: self.shutdowns.append(time.monotonic()))
+            patch(main, 'LAST_FRAME_PATH', os.path.join(self.workdir, 'last-frame.png'))
+            patch(main, 'LAST_FRAME_STATE_PATH', os.path.join(self.workdir, 'last-frame.json'))
+            patch(main.display_client, 'is_daemon_running', lambda *args: False)
+            patch(scheduler, 'load_history', lambda: load_history(history_path))
+            patch(scheduler, 'save_history', lambda history: save_history(history, history_path))
+            patch(main.run_budget, 'get_uptime', lambda: self.boot_secs)
+            patch(spans, '_recorder', self.recorder)
+            stack.enter_context(working_directory(self.workdir))
+            yield
+
+    def run_wake(self, argv=()):
+        '''
+        Run main.main_wrapper once. Returns a dict of seconds from power on to
+        the first refresh that isn't a clear ('display', None if there was
+        none), seconds awake until the shutdown or the end of main_wrapper
+        ('awake'), seconds per phase ('phases'), PiJuice calls ('i2c_calls') and
+        the exception main_wrapper raised, if any ('error')
+        '''
+        refreshes = len(self.display.refreshes)
+        shutdowns = len(self.shutdowns)
+        i2c_calls = len(self.pj.calls)
+        error = None
+
+        with self.stand_ins():
+            start = time.monotonic()
+            try:
+                self.main.main_wrapper(list(argv))
+            except Exception as e:
+                error = repr(e)
+            end = time.monotonic()
+
+        if len(self.shutdowns) > shutdowns:
+            end = self.shutdowns[shutdowns]
+        shown = [t for t, kind in self.display.refreshes[refreshes:] if kind != 'clear']
+
+        phases = {}
+        for wake_id, _, duration, name in self.recorder.records():
+            if wake_id == self.recorder.wake_id:
+                phases[name] = phases.get(name, 0) + duration
+
+        return {
+            'display': self.boot_secs + shown[0] - start if shown else None,
+            'awake': self.boot_secs + end - start,
+            'phases': phases,
+            'i2c_calls': len(self.pj.calls) - i2c_calls,
+            'shutdown': len(self.shutdowns) > shutdowns,
+            'error': error,
+        }
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='eink-weather-display bench_wake.py')
+    p.add_argument('--wakes', type=int, default=3, help='How many wakes to run in a row')
+    p.add_argument('--image', action='append', default=[],
+                   help='PNG to serve as the rendered image, in turn if given several times. '
+                        'Defaults to a generated image')
+    p.add_argument('--changing', action='store_true',
+                   help='Serve a different generated image on every wake')
+    p.add_argument('--charge', type=int, nargs='+', default=[80],
+                   help='Charge level per wake, the last one is repeated')
+    p.add_argument('--on-cable', action='store_true', help='Run as if connected to power')
+    p.add_argument('--boot', type=float, default=BOOT_SECS, help='Seconds from power on to main.py')
+    p.add_argument('--i2c', type=float, default=I2C_CALL_SECS, help='Seconds per PiJuice call')
+    p.add_argument('--pijuice-not-ready', type=int, default=0,
+                   help='How many status requests fail on each wake before the PiJuice answers')
+    p.add_argument('--latency', type=float, default=RENDER_LATENCY_SECS,
+                   help='Seconds before the render API responds')
+    p.add_argument('--download', type=float, default=DOWNLOAD_BYTES_PER_SEC,
+                   help='Download speed in bytes per second, 0 for unlimited')
+    p.add_argument('--usb', type=float, default=USB_BYTES_PER_SEC,
+                   help='Transfer speed to the display in bytes per second, 0 for unlimited')
+    p.add_argument('--refresh', type=float, nargs=3, default=[FULL_REFRESH_SECS, PARTIAL_REFRESH_SECS, CLEAR_SECS],
+                   metavar=('FULL', 'PARTIAL', 'CLEAR'), help='Seconds per display refresh')
+    p.add_argument('--json', action='store_true', help='Print the results as JSON')
+    p.add_argument('-v', '--verbose', action='store_true', help='Show the logs of main.py')
+    return p.parse_args()
+
+
+def print_report(results):
+    print('{:<6} {:>9} {:>9} {:>6}  {}'.format('wake', 'display s', 'awake s', 'i2c', 'result'))
+    for i, r in enumerate(results):
+        display = '-' if r['display'] is None else '{:.2f}'.format(r['display'])
+        result = r['error'] or ('shutdown' if r['shutdown'] else 'kept on')
+        print('{:<6} {:>9} {:>9.2f} {:>6}  {}'.format(i + 1, display, r['awake'], r['i2c_calls'], result))
+
+    print()
+    print('{:<16} {:>6} {:>9} {:>9}'.format('phase', 'wakes', 'mean s', 'max s'))
+    names = []
+    for r in results:
+        names += [name for name in r['phases'] if name not in names]
+    for name in names:
+        values = [r['phases'][name] for r in results if name in r['phases']]
+        print('{:<16} {:>6} {:>9.2f} {:>9.2f}'.format(name, len(values), sum(values) / len(values),
+                                                        max(values)))
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(relativeCreated)8.0fms %(levelname)s\t%(message)s')
+
+    main_module = import_main()
+    dims = (main_module.DISPLAY_WIDTH, main_module.DISPLAY_HEIGHT)
+    if args.image:
+        images = []
+        for path in args.image:
+            with open(path, 'rb') as f:
+                images.append(f.read())
+    elif args.changing:
+        images = [make_fixture(dims, seed) for seed in range(args.wakes)]
+    else:
+        images = [make_fixture(dims)]
+
+    pj = FakePiJuice(on_battery=not args.on_cable, call_secs=args.i2c)
+    server = RenderServer(images, latency=args.latency, bytes_per_sec=args.download)
+    full_secs, partial_secs, clear_secs = args.refresh
+    display = FakeDisplay(main_module.BINARY_PATH, dims, bytes_per_sec=args.usb, full_secs=full_secs,
+                          partial_secs=partial_secs, clear_secs=clear_secs)
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            bench = Bench(workdir, pj, server, display, boot_secs=args.boot)
+            for i in range(args.wakes):
+                pj.charge_level = args.charge[min(i, len(args.charge) - 1)]
+                pj.not_ready = args.pijuice_not_ready
+                results.append(bench.run_wake())
+    finally:
+        server.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+
+if __name__ == '__main__':
+    main()
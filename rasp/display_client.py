@@ -0,0 +1,100 @@
+import os
+import json
+import socket
+
+# Where display_daemon.py listens
+SOCKET_PATH = '/tmp/eink-weather-display.sock'
+# Screens that the daemon uploads to the display controller at startup, so that
+# they can be shown without sending the image
+SCREENS = {
+    'error': 'images/error.png',
+    'battery-empty': 'images/battery-empty.png',
+}
+
+
+def is_daemon_running(socket_path=None, timeout=1):
+    '''
+    Whether display_daemon.py is listening. The socket file is left behind if
+    the daemon was killed, so it's not enough that it exists.
+    '''
+    socket_path = socket_path or SOCKET_PATH
+    if not os.path.exists(socket_path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        try:
+            s.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def request(header, payload=b'', socket_path=None, timeout=120):
+    '''
+    Send one request to display_daemon.py and return its response as a dict.
+
+    A request is a single line of JSON, followed by header['length'] bytes of payload.
+    The response is a single line of JSON.
+    '''
+    socket_path = socket_path or SOCKET_PATH
+    header = dict(header, length=len(payload))
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        s.connect(socket_path)
+        s.sendall(json.dumps(header).encode('utf-8') + b'\n' + payload)
+        with s.makefile('rb') as f:
+            response = json.loads(f.readline())
+
+    if not response.get('ok'):
+        raise Exception('Display daemon error: {}'.format(response.get('error')))
+    return response
+
+
+def send_image(file_path, fit=False, mode=2):
+    '''
+    Display an image file. Only the pixels that differ from what is on the
+    display are sent to the panel.
+    '''
+    with open(file_path, 'rb') as f:
+        return request({'cmd': 'image', 'fit': fit, 'mode': mode}, f.read())
+
+
+def send_update(data, xy, dims, mode=2):
+    '''
+    Draw raw 8-bit grayscale pixels (dims[0] * dims[1] bytes) at xy
+    '''
+    return request({
+        'cmd': 'update',
+        'x': xy[0],
+        'y': xy[1],
+        'width': dims[0],
+        'height': dims[1],
+        'mode': mode,
+    }, bytes(data))
+
+
+def show_screen(name, mode=2):
+    '''
+    Display one of the screens the daemon uploaded to the controller at startup,
+    e.g. 'error' or 'battery-empty'
+    '''
+    return request({'cmd': 'show', 'name': name, 'mode': mode})
+
+
+def clear():
+    return request({'cmd': 'clear'})
+
+
+def get_metrics():
+    '''
+    Return request latency statistics, per command, since the daemon started
+    '''
+    return request({'cmd': 'metrics'})['metrics']
+
+
+def get_power_stats():
+    '''
+    Return the time the display controller has spent running, in standby and
+    asleep, and how long waking it up has taken (see IT8951/power.py)
+    '''
+    return request({'cmd': 'power'})['power']
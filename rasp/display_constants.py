@@ -0,0 +1,4 @@
+# Settings of the display panel, shared by main.py and display_daemon.py
+
+# Millivoltages as positive integer. E.g. 2500 => -2500 mV = -2.5V
+VCOM = 1150
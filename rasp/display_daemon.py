@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+
+# Keeps the e-ink display initialized between updates, for when the Raspberry PI
+# runs on cable-connected power. Every update done by a fresh process resets the
+# controller, re-reads its info, sets VCOM again and forgets what's on the
+# screen, so it has to redraw everything. The daemon instead keeps an
+# AutoEPDDisplay open and only sends the pixels that changed.
+#
+# Note: this drives the display through the IT8951 library, i.e. with the panel
+# connected via the GPIO header (SPI), not via USB.
+#
+# Between updates the controller is put into standby (or sleep, with
+# --idle-sleep), and woken up again for the next update.
+#
+# Clients talk to it over a Unix socket, see display_client.py.
+
+import io
+import os
+import json
+import time
+import logging
+import argparse
+import socketserver
+from collections import deque
+from PIL import Image, ImageOps
+from IT8951.constants import DisplayModes, PowerStates
+from IT8951.display import AutoEPDDisplay
+from display_constants import VCOM
+from spans import percentile
+import display_client
+
+# How many latency samples are kept per command for the metrics
+METRICS_SAMPLES = 1000
+# Seconds without updates before the display controller is put into standby
+IDLE_TIMEOUT_SECS = 10
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='eink-weather-display display_daemon.py')
+    p.add_argument('--socket', default=display_client.SOCKET_PATH,
+                   help='Path of the Unix socket to listen on')
+    p.add_argument('--idle-timeout', type=float, default=IDLE_TIMEOUT_SECS,
+                   help='Seconds without updates before the display controller is put into standby')
+    p.add_argument('--idle-sleep', action='store_true',
+                   help='Put the display controller to sleep instead of standby when idle')
+    return p.parse_args()
+
+
+class DisplayHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        start = time.time()
+        cmd = None
+        line = self.rfile.readline()
+        if not line:
+            # Connected and closed without a request, see is_daemon_running
+            return
+        try:
+            header = json.loads(line)
+            cmd = header['cmd']
+            payload = self.rfile.read(header.get('length', 0))
+            response = self.server.handle_command(cmd, header, payload)
+            response['ok'] = True
+        except Exception as e:
+            logging.error('Display daemon: {} request failed: {}'.format(cmd, e))
+            response = {'ok': False, 'error': str(e)}
+
+        self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+        self.server.record_latency(cmd, time.time() - start)
+
+
+class DisplayServer(socketserver.UnixStreamServer):
+    '''
+    Handles one request at a time, so display updates never interleave
+    '''
+
+    def __init__(self, socket_path, display):
+        self.display = display
+        self.latencies = {}
+        socketserver.UnixStreamServer.__init__(self, socket_path, DisplayHandler)
+
+    def handle_command(self, cmd, header, payload):
+        mode = header.get('mode', DisplayModes.GC16)
+
+        if cmd == 'image':
+            img = to_grayscale(Image.open(io.BytesIO(payload)))
+            if header.get('fit'):
+                img = ImageOps.fit(img, self.display.frame_buf.size)
+            self.display.frame_buf.paste(img, (0, 0))
+            self.display.draw_partial(mode)
+        elif cmd == 'update':
+            dims = (header['width'], header['height'])
+            img = Image.frombytes('L', dims, payload)
+            xy = (header['x'], header['y'])
+            self.display.frame_buf.paste(img, xy)
+            # the rest of the frame is unchanged, only the pasted area is compared
+            self.display.draw_partial(mode, box=xy + (xy[0]+dims[0], xy[1]+dims[1]))
+        elif cmd == 'show':
+            self.display.display_preloaded(header['name'], mode)
+        elif cmd == 'clear':
+            self.display.clear()
+        elif cmd == 'metrics':
+            return {'metrics': self.get_metrics()}
+        elif cmd == 'power':
+            return {'power': self.display.epd.power.stats()}
+        else:
+            raise ValueError('Unknown command: {}'.format(cmd))
+
+        return {}
+
+    def record_latency(self, cmd, secs):
+        if cmd not in self.latencies:
+            self.latencies[cmd] = deque(maxlen=METRICS_SAMPLES)
+        self.latencies[cmd].append(secs)
+        logging.debug('Display daemon: {} took {:.3f}s'.format(cmd, secs))
+
+    def get_metrics(self):
+        metrics = {}
+        for cmd, samples in self.latencies.items():
+            ordered = sorted(samples)
+            metrics[str(cmd)] = {
+                'count': len(ordered),
+                'p50_ms': percentile(ordered, 50) * 1000,
+                'p90_ms': percentile(ordered, 90) * 1000,
+                'max_ms': ordered[-1] * 1000,
+            }
+        return metrics
+
+
+def to_grayscale(img):
+    if img.mode in ('RGBA', 'LA', 'P'):
+        img = img.convert('RGBA')
+        background = Image.new('RGBA', img.size, 'white')
+        img = Image.alpha_composite(background, img)
+    return img.convert('L')
+
+
+def open_display(idle_timeout, idle_state, epd=None):
+    '''
+    Initialize the display, and upload the screens. epd is the EPD to use
+    instead of the one connected to the GPIO header, e.g. with an emulator.
+    '''
+    logging.info('Initializing display ...')
+    # VCOM is in positive millivolts, e.g. 1150 => -1.15V
+    display = AutoEPDDisplay(epd=epd, vcom=-VCOM / 1000, idle_timeout=idle_timeout,
+                             idle_state=idle_state)
+    display.clear()
+
+    for name, file_path in display_client.SCREENS.items():
+        logging.info('Uploading {} screen to the display controller ...'.format(name))
+        img = ImageOps.fit(to_grayscale(Image.open(file_path)), display.frame_buf.size)
+        display.preload(name, img)
+
+    return display
+
+
+def main():
+    args = parse_args()
+    logging.info('Running display_daemon.py')
+
+    if os.path.exists(args.socket):
+        os.remove(args.socket)
+
+    idle_state = PowerStates.SLEEP if args.idle_sleep else PowerStates.STANDBY
+    server = DisplayServer(args.socket, open_display(args.idle_timeout, idle_state))
+    logging.info('Display daemon listening on {}'.format(args.socket))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.remove(args.socket)
+
+
+if __name__ == '__main__':
+    main()
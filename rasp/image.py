@@ -2,7 +2,7 @@
 
 import logging
 import argparse
-from main import edp_display, display_render_image
+import display_client
 
 
 def parse_args():
@@ -16,6 +16,13 @@ def main():
     logging.info('Running image.py')
     args = parse_args()
 
+    if display_client.is_daemon_running():
+        logging.info('Sending {} to display daemon ...'.format(args.image))
+        display_client.send_image(args.image, fit=True)
+        return
+
+    # Without the daemon, initialize and drive the display from this process
+    from main import edp_display, display_render_image
     with edp_display():
         logging.info('Rendering {} ...'.format(args.image))
         display_render_image(args.image, fit=True)
@@ -1,10 +1,12 @@
 #!/usr/bin/python3
 
 import os
+import json
 import logging
 import pytz
 from datetime import datetime, date
 import time
+import threading
 import subprocess
 import argparse
 from time import sleep
@@ -13,116 +15,235 @@ from config import config
 from contextlib import contextmanager
 import requests
 import shutil
+import display_client
+import scheduler
+import spans
+import overlay
+import tile_delta
+import png_stream
+import run_budget
+import power_status
+from display_constants import VCOM
+from PIL import Image
 
 
 BINARY_PATH = '/home/pi/eink-weather-display/rasp/usb-it8951/build/it8951'
-# Millivoltages as positive integer. E.g. 2500 => -2500 mV = -2.5V
-VCOM = 1150
+# The PiJuice is on this I2C bus
+I2C_DEVICE = '/dev/i2c-1'
 
 
-def parse_args():
+def parse_args(argv=None):
     p = argparse.ArgumentParser(description='eink-weather-display main.py')
     p.add_argument('--no-shutdown', action='store_true',
                    help='No shutdown after run')
-    return p.parse_args()
+    p.add_argument('--status-only', action='store_true',
+                   help='Only update the battery status on the display, no weather fetch')
+    return p.parse_args(argv)
 
 
 DISPLAY_WIDTH = 1872
 DISPLAY_HEIGHT = 1404
 MIN_BATTERY_LEVEL = 10
 WAKEUP_ON_CHARGE_BATTERY_LEVEL = 0
-
-
-def main_wrapper():
-    args = parse_args()
+# The rendered image is mirrored (see "flop" in fetch_image)
+DISPLAY_MIRRORED = True
+# If there's no new image within this many seconds from the start of main, the
+# last displayed image is shown with an "offline" notice instead
+FETCH_BUDGET_SECS = 120
+# Requests and network checks can end this much after their deadline
+FETCH_OVERRUN_SECS = 2
+# A wake, from power on to shutdown, takes at most this long (see run_budget.py).
+# The last SHUTDOWN_RESERVE_SECS of it are kept for shutting down.
+WAKE_BUDGET_SECS = 240
+SHUTDOWN_RESERVE_SECS = 15
+# Time for the logs to be sent before shutting down
+SHUTDOWN_FLUSH_SECS = 5
+PIJUICE_TIMEOUT_SECS = 30
+# How long display updates take, including starting it8951
+FULL_REFRESH_SECS = 20
+STATUS_BAR_SECS = 5
+MORNING_TASKS_SECS = 60
+# Fast black/white waveform used for the status bar
+STATUS_BAR_MODE = 1
+LAST_FRAME_PATH = '/home/pi/last-frame.png'
+# If a tile delta changes more than this share of the display, it's fully refreshed
+MAX_PARTIAL_UPDATE_AREA = 0.5
+LAST_FRAME_STATE_PATH = '/home/pi/last-frame.json'
+# A full image is decoded and sent to the display controller while it downloads,
+# in bands of this many rows (see png_stream.py)
+STREAM_BAND_ROWS = 64
+STREAM_CHUNK_BYTES = 16 * 1024
+
+
+def main_wrapper(argv=None):
+    args = parse_args(argv)
 
     # Note logging isn't sent to GCP before internet is available
     logging.info('Running main_wrapper')
+    uptime = run_budget.get_uptime()
+    spans.record_boot(uptime)
 
-    pj = get_pijuice()
+    if uptime > WAKE_BUDGET_SECS:
+        # Not started at boot, e.g. by hand
+        logging.info('Budget: uptime {:.0f}s, counting the wake from now'.format(uptime))
+        uptime = 0
+    budget = run_budget.RunBudget(WAKE_BUDGET_SECS, SHUTDOWN_RESERVE_SECS, elapsed_secs=uptime)
+
+    with spans.span('get_pijuice'):
+        pj = get_pijuice(deadline=budget.phase_deadline('get_pijuice', PIJUICE_TIMEOUT_SECS))
     # Enable as early as possible in case an exception is raised during processing
     enable_wakeups(pj)
 
+    # Whichever comes first, the end of main or the watchdog, decides about the
+    # shutdown. The other one waits until that's done, the process must not
+    # exit in the middle of a shutdown started by the watchdog thread.
+    finish_lock = threading.Lock()
+    finished = []
+
+    def finish():
+        with finish_lock:
+            if not finished:
+                finished.append(True)
+                finish_wake(pj, args)
+
+    budget.start_watchdog('shutdown', finish)
+
     with edp_display():
         shutdown_already_handled = False
         try:
-            shutdown_already_handled = main(pj)
+            shutdown_already_handled = main(pj, budget, status_only=args.status_only)
         except Exception as e:
             logging.error('Error during main:')
             logging.error(e)
-            logging.info('Attempting to display error image...')
-            display_render_image('images/error.png', fit=True)
+            if budget.allows('error image', FULL_REFRESH_SECS):
+                logging.info('Attempting to display error image...')
+                display_screen('error')
             raise e
         finally:
+            budget.cancel_watchdog()
             if shutdown_already_handled:
                 logging.info('main_wrapper: shutdown already handled')
-            elif is_pijuice_on_battery(pj):
-                ssh_active = is_ssh_active()
-                if ssh_active:
-                    logging.info(
-                        'Raspberry PI is on battery, but ssh session is active, keeping power on')
-                elif args.no_shutdown:
-                    logging.info(
-                        'Raspberry PI is on battery, but --no-shutdown set, keeping power on')
-                else:
-                    logging.info(
-                        'Raspberry PI is on battery, shutting down ...')
-                    shutdown(pj)
-
+                # Unless the watchdog is handling it right now
+                with finish_lock:
+                    pass
             else:
-                logging.info('Raspberry PI is on charging, keeping power on!')
+                finish()
 
 
-def main(pj):
-    wait_until_internet_connection()
+def finish_wake(pj, args):
+    # The cable may have been connected during the wake
+    if is_pijuice_on_battery(pj, max_age=0):
+        ssh_active = is_ssh_active()
+        if ssh_active:
+            logging.info(
+                'Raspberry PI is on battery, but ssh session is active, keeping power on')
+        elif args.no_shutdown:
+            logging.info(
+                'Raspberry PI is on battery, but --no-shutdown set, keeping power on')
+        else:
+            logging.info(
+                'Raspberry PI is on battery, shutting down ...')
+            shutdown(pj)
+
+    else:
+        logging.info('Raspberry PI is on charging, keeping power on!')
+
+
+def main(pj, budget, status_only=False):
+    if status_only:
+        if budget.allows('status bar', STATUS_BAR_SECS):
+            update_status_bar(pj)
+        return
+
+    # Leave time for showing the image, or the previous one if there's no new one
+    deadline = budget.phase_deadline('fetch_image', FETCH_BUDGET_SECS,
+                                     keep_secs=FULL_REFRESH_SECS + FETCH_OVERRUN_SECS)
+    try:
+        with spans.span('wait_internet'):
+            wait_until_internet_connection(deadline)
+    except Exception as e:
+        logging.error('No internet connection: {}'.format(e))
+        display_offline_fallback(pj, e, budget)
+        return
 
     logging.info('Running main')
     run_cmd("git log --pretty=format:'%H %ad %s' -n 1")
 
-    charge_level = pj.status.GetChargeLevel()
+    power = power_status.get(pj).snapshot()
+    charge_level = power['charge_level']
     logging.info('Charge level: {}'.format(charge_level))
-    logging.debug('GetBatteryVoltage: {}'.format(
-        pj.status.GetBatteryVoltage()))
-    logging.debug('GetBatteryTemperature: {}'.format(
-        pj.status.GetBatteryTemperature()))
-    logging.debug('GetBatteryCurrent: {}'.format(
-        pj.status.GetBatteryCurrent()))
+    logging.debug('GetBatteryVoltage: {}'.format(power['voltage']))
+    logging.debug('GetBatteryTemperature: {}'.format(power['temperature']))
+    logging.debug('GetBatteryCurrent: {}'.format(power['current']))
 
     is_on_battery = is_pijuice_on_battery(pj)
     if is_on_battery:
         logging.info('Raspberry PI runs on battery power')
         if charge_level['data'] < MIN_BATTERY_LEVEL:
-            logging.info(
-                'Detected low battery! Displaying empty battery image...')
-            display_render_image('images/battery-empty.png')
+            if budget.allows('empty battery image', FULL_REFRESH_SECS):
+                logging.info(
+                    'Detected low battery! Displaying empty battery image...')
+                display_screen('battery-empty')
 
             logging.info('Disable RTC wakeup alarm')
             pj.rtcAlarm.SetWakeupEnabled(False)
             return
     else:
         logging.info('Raspberry PI is on cable-connected power')
-        display_clear()
 
-    res = fetch_image(is_on_battery, charge_level["data"])
-    logging.info('Image request done')
-    logging.info('Saving image to disk...')
-    file_path = 'render_api_image.png'
-    with open(file_path, 'wb') as f:
-        res.raw.decode_content = True
-        shutil.copyfileobj(res.raw, f)
+    loaded_text = None
+    try:
+        with spans.span('fetch_image'):
+            base_hash = last_frame_hash()
+            res = fetch_image(deadline=deadline, base_hash=base_hash, etag=last_frame_etag())
+            logging.info('Image request done')
+            if is_unchanged(res, base_hash):
+                logging.info('Image is the one displayed last, not downloading it')
+                res.close()
+                frame, changed_box, image_hash = None, None, base_hash
+            elif can_stream(res):
+                loaded_text = overlay.status_text(datetime.now(), charge_level['data'],
+                                                  not is_on_battery)
+                with spans.span('stream_image'):
+                    image_hash = stream_frame(res, loaded_text, charge_level['data'], deadline)
+                frame, changed_box = None, None
+            else:
+                frame, changed_box = read_frame(res)
+                image_hash = tile_delta.frame_hash(frame)
+    except Exception as e:
+        logging.error('Fetching image failed: {}'.format(e))
+        display_offline_fallback(pj, e, budget)
+        return
+
+    record_wake(charge_level['data'], is_on_battery, image_hash)
 
     logging.info('Render image returned by the API...')
-    display_render_image(file_path)
+    display_frame(frame, image_hash, charge_level['data'], is_on_battery, budget, changed_box,
+                  loaded_text, etag=res.headers.get('ETag'))
 
-    if should_run_morning_tasks():
+    if should_run_morning_tasks() and budget.allows('git pull', MORNING_TASKS_SECS):
         git_pull()
 
     # Enable again just in case time syncronisation has unset the alarm
     enable_wakeups(pj)
 
 
-def fetch_image(is_on_battery, battery_level, retries=2):
+def fetch_image(retries=2, deadline=None, base_hash=None, etag=None):
+    '''
+    Request the image from the render API. If base_hash is given, the API may
+    respond with only the tiles that changed since that frame (see tile_delta.py),
+    an empty base_hash tells that tiles are understood but there's no frame yet.
+    If etag is given and the image hasn't changed, the response is 304 Not
+    Modified.
+    '''
     for i in range(retries + 1):
+        timeout = 60
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout < 1:
+                logging.warn('Out of time for fetching the image')
+                break
+
         try:
             logging.info(
                 'Getting image from API (attempt {})...'.format(i))
@@ -132,10 +253,9 @@ def fetch_image(is_on_battery, battery_level, retries=2):
                 'bottom': 20,
                 'left': 10,
             }
-            res = requests.get(config['RENDER_URL'], stream=True, params={
-                "batteryLevel": battery_level,
-                "batteryCharging": 'false' if is_on_battery else 'true',
-                "showBatteryPercentage": 'true',
+            params = {
+                # Refresh time and battery are drawn locally, see overlay.py
+                "showSystemInfo": 'false',
                 "lat": config['RENDER_LATITUDE'],
                 "lon": config['RENDER_LONGITUDE'],
                 "locationName": config['RENDER_LOCATION_NAME'],
@@ -150,7 +270,12 @@ def fetch_image(is_on_battery, battery_level, retries=2):
                 "paddingRight": paddings['right'],
                 "paddingBottom": paddings['bottom'],
                 "paddingLeft": paddings['left'],
-            }, timeout=60)
+            }
+            if base_hash is not None:
+                params["baseHash"] = base_hash
+            headers = {'If-None-Match': etag} if etag else {}
+            res = requests.get(config['RENDER_URL'], stream=True, params=params, headers=headers,
+                               timeout=timeout)
             res.raise_for_status()
             return res
         except Exception as e:
@@ -161,6 +286,303 @@ def fetch_image(is_on_battery, battery_level, retries=2):
     raise Exception('Failed to request image API even after retries')
 
 
+def read_frame(res):
+    '''
+    Return (frame, changed box) from a render API response, the frame quantized
+    to the gray levels of the display. For a tile delta, the box bounds the
+    changed tiles. For a full image it's None.
+    '''
+    if res.headers.get('content-type') == tile_delta.CONTENT_TYPE:
+        _, _, expected_hash, tiles = tile_delta.decode_delta(res.content)
+        logging.info('Received {} changed tiles ({} bytes)'.format(len(tiles), len(res.content)))
+        frame = Image.open(LAST_FRAME_PATH).convert('L')
+        changed_box = tile_delta.apply_delta(frame, tiles)
+        if tile_delta.frame_hash(frame) != expected_hash:
+            raise Exception('Frame with changed tiles applied does not match the rendered frame')
+        return frame, changed_box
+
+    logging.info('Saving image to disk...')
+    file_path = 'render_api_image.png'
+    with open(file_path, 'wb') as f:
+        res.raw.decode_content = True
+        shutil.copyfileobj(res.raw, f)
+    return tile_delta.quantize(Image.open(file_path).convert('L')), None
+
+
+def is_unchanged(res, base_hash):
+    '''
+    Whether the response tells that the image is the frame with base_hash,
+    before its body is read
+    '''
+    if res.status_code == 304:
+        return True
+    return bool(base_hash) and res.headers.get('X-Frame-Hash') == base_hash
+
+
+def can_stream(res):
+    # The daemon takes whole images, and tile deltas are small anyway
+    return (res.headers.get('content-type') == 'image/png' and
+            not display_client.is_daemon_running())
+
+
+def stream_frame(res, text, charge_level, deadline=None):
+    '''
+    Decode the PNG in res while it downloads, and load it band by band into the
+    display controller's memory with the status bar drawn in. The display isn't
+    refreshed, see refresh_loaded_image. The frame, quantized to the gray levels
+    of the display and without the status bar, is written to
+    streamed_frame_path() as it goes, and its hash is returned. Raises if the
+    download isn't done by deadline (a time.monotonic() value).
+    '''
+    x, y, _, _ = overlay.STATUS_BAR_BOX
+    bar = overlay.status_bar(text, charge_level)
+    bar, bar_xy = overlay.place(bar, (x, y), DISPLAY_WIDTH, DISPLAY_MIRRORED)
+    if deadline is not None and time.monotonic() > deadline:
+        raise Exception('Out of time for downloading the image')
+
+    # The binary sends each chunk of rows as soon as it has read it from stdin,
+    # so the transfer runs at the same time as the download
+    cmd = ['sudo', BINARY_PATH, '-v', str(VCOM), '-n', '/dev/sda', '0', '0',
+           str(DISPLAY_WIDTH), str(DISPLAY_HEIGHT)]
+    logging.info('Running "{}"'.format(' '.join(cmd)))
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE)
+    rows = 0
+    # Only a few bands are in memory at a time, not the whole frame
+    hasher = tile_delta.frame_hasher()
+    try:
+        with open(streamed_frame_path(), 'wb') as f:
+            png = png_stream.PngWriter(f, DISPLAY_WIDTH, DISPLAY_HEIGHT)
+            chunks = until_deadline(res.iter_content(STREAM_CHUNK_BYTES), deadline)
+            bands = png_stream.iter_bands(chunks, STREAM_BAND_ROWS)
+            for y, band in bands:
+                if band.width != DISPLAY_WIDTH or y + band.height > DISPLAY_HEIGHT:
+                    raise Exception('Image size does not match the display')
+                band = tile_delta.quantize(band.convert('L'))
+                hasher.update(band.tobytes())
+                png.write(band)
+                band.paste(bar, (bar_xy[0], bar_xy[1] - y))
+                proc.stdin.write(band.tobytes())
+                rows = y + band.height
+            if rows == DISPLAY_HEIGHT:
+                png.close()
+    finally:
+        # Closes stdin, the binary exits if the image is incomplete
+        _, stderr = proc.communicate()
+        logging.info('stderr:')
+        logging.info(stderr)
+
+    if rows != DISPLAY_HEIGHT:
+        raise Exception('Image size does not match the display')
+    if proc.returncode != 0:
+        raise Exception('Loading the image to the display failed')
+    logging.info('Image loaded to the display controller')
+    return hasher.hexdigest()
+
+
+def streamed_frame_path():
+    # Next to the last frame, so that it can be renamed to it
+    return LAST_FRAME_PATH + '.streamed'
+
+
+def until_deadline(chunks, deadline):
+    '''
+    The chunks, raising once deadline has passed. The request timeout applies
+    to each read, so a slow download could otherwise take any time.
+    '''
+    for chunk in chunks:
+        if deadline is not None and time.monotonic() > deadline:
+            raise Exception('Out of time for downloading the image')
+        yield chunk
+
+
+def last_frame_hash():
+    state = load_last_frame_state()
+    if state is None or not os.path.exists(LAST_FRAME_PATH):
+        return ''
+    return state.get('image_hash', '')
+
+
+def last_frame_etag():
+    '''
+    The ETag of the response the last frame came in, if the render API sent one
+    '''
+    state = load_last_frame_state()
+    if state is None or not os.path.exists(LAST_FRAME_PATH):
+        return None
+    return state.get('etag')
+
+
+def display_frame(frame, image_hash, charge_level, is_on_battery, budget, changed_box=None,
+                  loaded_text=None, etag=None):
+    '''
+    Display the weather image with the status bar. If the previous weather image
+    is on the display, only what changed is updated: the status bar, and the
+    changed tiles if the image came as a tile delta. If the frame was already
+    loaded into the display controller by stream_frame, loaded_text is the
+    status text that was drawn in with it, and frame is None. frame is also
+    None if the render API said that the image is the last frame. etag is kept
+    for asking the render API whether the image has changed next time.
+
+    If the update doesn't fit in the budget, the display is left as it is, and
+    the next wake updates it.
+    '''
+    state = load_last_frame_state()
+    now = time.time()
+    text = overlay.status_text(datetime.fromtimestamp(now), charge_level, not is_on_battery)
+    on_screen = state is not None and state['on_screen']
+
+    if on_screen and state.get('image_hash') == image_hash:
+        logging.info('Weather image is unchanged, updating the status bar only')
+        if state.get('status') != text:
+            if not budget.allows('status bar', STATUS_BAR_SECS):
+                return
+            display_status_bar(text, charge_level)
+    elif on_screen and changed_box is not None and is_small_area(changed_box):
+        if not budget.allows('changed tiles', 2 * STATUS_BAR_SECS):
+            return
+        logging.info('Updating changed tiles in {} ...'.format(changed_box))
+        display_region(frame.crop(changed_box), changed_box[:2])
+        # The tiles may have covered the status bar
+        display_status_bar(text, charge_level)
+        frame.save(LAST_FRAME_PATH)
+    elif not budget.allows('full refresh', FULL_REFRESH_SECS):
+        return
+    elif loaded_text is not None:
+        refresh_loaded_image()
+        if loaded_text != text:
+            display_status_bar(text, charge_level)
+        os.replace(streamed_frame_path(), LAST_FRAME_PATH)
+    else:
+        if frame is None:
+            frame = Image.open(LAST_FRAME_PATH).convert('L')
+        display_with_status_bar(frame, text, charge_level)
+        frame.save(LAST_FRAME_PATH)
+
+    save_last_frame_state({
+        'updated_at': now,
+        'on_screen': True,
+        'image_hash': image_hash,
+        'status': text,
+        'etag': etag,
+    })
+
+
+def update_status_bar(pj):
+    '''
+    Update the battery status in the status bar, if the weather image is on the display
+    '''
+    state = load_last_frame_state()
+    if state is None or not state['on_screen']:
+        logging.info('Weather image is not on the display, not updating the status bar')
+        return
+
+    charge_level = power_status.get(pj).charge_level()
+    text = overlay.status_text(datetime.fromtimestamp(state['updated_at']), charge_level,
+                               not is_pijuice_on_battery(pj))
+    if text == state.get('status'):
+        logging.info('Status bar is up to date')
+        return
+
+    display_status_bar(text, charge_level)
+    state['status'] = text
+    save_last_frame_state(state)
+
+
+def display_status_bar(text, charge_level):
+    x, y, _, _ = overlay.STATUS_BAR_BOX
+    bar = overlay.status_bar(text, charge_level)
+    bar, xy = overlay.place(bar, (x, y), DISPLAY_WIDTH, DISPLAY_MIRRORED)
+    logging.info('Drawing status bar: {}'.format(text))
+    display_region(bar, xy, mode=STATUS_BAR_MODE)
+
+
+def is_small_area(box):
+    area = (box[2] - box[0]) * (box[3] - box[1])
+    return area <= MAX_PARTIAL_UPDATE_AREA * DISPLAY_WIDTH * DISPLAY_HEIGHT
+
+
+def display_with_status_bar(frame, text, charge_level):
+    x, y, _, _ = overlay.STATUS_BAR_BOX
+    bar = overlay.status_bar(text, charge_level)
+    bar, xy = overlay.place(bar, (x, y), DISPLAY_WIDTH, DISPLAY_MIRRORED)
+
+    frame = frame.copy()
+    frame.paste(bar, xy)
+    frame.save('display.png')
+    display_render_image('display.png')
+
+
+def load_last_frame_state():
+    try:
+        with open(LAST_FRAME_STATE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_last_frame_state(state):
+    with open(LAST_FRAME_STATE_PATH, 'w') as f:
+        json.dump(state, f)
+
+
+def mark_last_frame_off_screen():
+    state = load_last_frame_state()
+    if state is not None and state['on_screen']:
+        state['on_screen'] = False
+        save_last_frame_state(state)
+
+
+def display_offline_fallback(pj, error, budget):
+    '''
+    Show the last successfully displayed image with a status bar telling when
+    it was updated. If it's still on the display, only the status bar is drawn.
+    Raises error if there's no previous image. Nothing is drawn if there's no
+    time for it.
+    '''
+    state = load_last_frame_state()
+    if state is None or not os.path.exists(LAST_FRAME_PATH):
+        logging.info('No previous image to fall back to')
+        raise error
+
+    try:
+        charge_level = power_status.get(pj).charge_level()
+        is_on_battery = is_pijuice_on_battery(pj)
+    except Exception as e:
+        logging.warn('Reading battery status failed: {}'.format(e))
+        charge_level, is_on_battery = None, True
+
+    text = overlay.status_text(datetime.fromtimestamp(state['updated_at']), charge_level,
+                               not is_on_battery, offline=True)
+
+    if state['on_screen']:
+        if not budget.allows('offline status bar', STATUS_BAR_SECS):
+            return
+        logging.info('Previous image is on the display, drawing offline status ...')
+        display_status_bar(text, charge_level)
+    else:
+        if not budget.allows('previous image', FULL_REFRESH_SECS):
+            return
+        logging.info('Displaying previous image with offline status ...')
+        display_with_status_bar(Image.open(LAST_FRAME_PATH).convert('L'), text, charge_level)
+
+    state['on_screen'] = True
+    state['status'] = text
+    save_last_frame_state(state)
+
+
+def record_wake(charge_level, is_on_battery, image_hash):
+    # The scheduler simulator reads this from the logs
+    logging.info('Image hash: {}'.format(image_hash))
+
+    local_hour = datetime.now(pytz.timezone('Europe/Helsinki')).hour
+    history = scheduler.load_history()
+    changed = scheduler.record_wake(
+        history, local_hour, charge_level, is_on_battery, image_hash)
+    scheduler.save_history(history)
+    logging.info('Image changed since last wake: {}'.format(changed))
+
+
 def should_run_morning_tasks():
     now = datetime.utcnow()
     # This should return True at least once in the morning
@@ -178,8 +600,10 @@ def get_local_hour_as_utc(hour):
 
 
 def enable_wakeups(pj):
-    # Wakeup at 6:00, 9, 12, 15, 18, and 21 at Europe/Helsinki time
-    local_hours = [6, 9, 12, 15, 18, 21]
+    # Wakeup hours at Europe/Helsinki time, depending on battery level and how
+    # often the image has changed at each hour. See scheduler.py
+    local_hours = scheduler.compute_wakeup_hours(scheduler.load_history())
+    logging.info('Wakeup hours (local time): {}'.format(local_hours))
     utc_hours = [get_local_hour_as_utc(h) for h in local_hours]
     alarm_config = {
         'second': 0,
@@ -202,7 +626,9 @@ def enable_wakeups(pj):
 def shutdown(pj):
     logging.info('Flushing logs ...')
     logging.shutdown()
-    time.sleep(5)
+    with spans.span('shutdown_sleep'):
+        time.sleep(SHUTDOWN_FLUSH_SECS)
+    spans.flush()
     logging.info('Shutting down ...')
     # Make sure power to the Raspberry PI is stopped to not discharge the battery
     pj.power.SetSystemPowerSwitch(0)
@@ -221,20 +647,23 @@ def is_ssh_active():
     return len(lines) > 0
 
 
-def is_pijuice_on_battery(pj):
-    stat = pj.status.GetStatus()
-    data = stat['data']
-    return data['powerInput'] == "NOT_PRESENT" and data['powerInput5vIo'] == 'NOT_PRESENT'
+def is_pijuice_on_battery(pj, max_age=None):
+    '''
+    max_age is how old the status may be, see power_status.py
+    '''
+    return power_status.get(pj).on_battery(max_age)
 
 
-def wait_until_internet_connection():
+def wait_until_internet_connection(deadline=None):
     logging.info('Waiting for internet connection ...')
 
     # Try to check for internet connection
-    connection_found = loop_until_internet()
+    connection_found = loop_until_internet(deadline=deadline)
 
     if connection_found:
         return
+    elif deadline is not None and deadline - time.monotonic() < 20:
+        raise Exception('Timeout waiting for internet connection, no time to restart networking')
     else:
         logging.info(
             'Internet connection not yet found, restarting networking...')
@@ -246,17 +675,23 @@ def wait_until_internet_connection():
 
     logging.info('Checking for internet again...')
     # Check for internet again
-    if loop_until_internet():
+    if loop_until_internet(deadline=deadline):
         return
 
     raise Exception('Timeout waiting for internet connection')
 
 
-def loop_until_internet(times=3):
+def loop_until_internet(times=3, deadline=None):
     for i in range(times):
+        timeout = 8
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout < 1:
+                return False
+
         try:
             res = requests.get(config['RENDER_URL'], params={
-                'ping': 'true'}, timeout=8)
+                'ping': 'true'}, timeout=timeout)
             if res.status_code == 200:
                 logging.info('Internet connection found!')
                 return True
@@ -266,19 +701,29 @@ def loop_until_internet(times=3):
     return False
 
 
-def get_pijuice():
+def get_pijuice(deadline=None):
+    '''
+    Wait until the PiJuice answers, until deadline (a time.monotonic() value) or
+    for PIJUICE_TIMEOUT_SECS
+    '''
+    if deadline is None:
+        deadline = time.monotonic() + PIJUICE_TIMEOUT_SECS
+
     # Since the start is very early in the boot sequence we wait for the i2c-1 device
-    while not os.path.exists('/dev/i2c-1'):
+    while not os.path.exists(I2C_DEVICE):
+        if time.monotonic() > deadline:
+            raise Exception('Timeout waiting for {}'.format(I2C_DEVICE))
         time.sleep(0.1)
 
     pj = PiJuice(1, 0x14)
-    start = time.time()
     while True:
-        if time.time() - start > 30:
+        if time.monotonic() > deadline:
             raise Exception('Timeout waiting for PIJuice to be ok')
 
         stat = pj.status.GetStatus()
         if stat['error'] == 'NO_ERROR':
+            # The first status of the wake, kept for whatever needs it next
+            power_status.start(pj, stat)
             return pj
         else:
             sleep(0.1)
@@ -295,22 +740,77 @@ def run_cmd(cmd):
     return result
 
 
+def display_screen(name):
+    mark_last_frame_off_screen()
+    if display_client.is_daemon_running():
+        try:
+            display_client.show_screen(name)
+            return
+        except Exception as e:
+            logging.warn('Display daemon failed: {}'.format(e))
+
+    display_render_image(display_client.SCREENS[name], fit=True)
+
+
 def display_render_image(file_path, fit=False):
+    if display_client.is_daemon_running():
+        # The daemon keeps the display initialized and only sends changed pixels
+        try:
+            display_client.send_image(file_path, fit=fit)
+            return
+        except Exception as e:
+            logging.warn('Display daemon failed: {}'.format(e))
+
     display_clear()
 
-    if fit:
-        run_cmd('convert {} -resize {}x{}^ -background white -gravity center -extent {}x{} fitted.png'.format(
-            file_path, DISPLAY_WIDTH, DISPLAY_HEIGHT, DISPLAY_WIDTH, DISPLAY_HEIGHT))
-        file_path = 'fitted.png'
+    with spans.span('convert'):
+        if fit:
+            run_cmd('convert {} -resize {}x{}^ -background white -gravity center -extent {}x{} fitted.png'.format(
+                file_path, DISPLAY_WIDTH, DISPLAY_HEIGHT, DISPLAY_WIDTH, DISPLAY_HEIGHT))
+            file_path = 'fitted.png'
 
-    # Convert image to 8bit raw image
-    run_cmd('stream -map r -storage-type char {} image.raw'.format(file_path))
+        # Convert image to 8bit raw image
+        run_cmd('stream -map r -storage-type char {} image.raw'.format(file_path))
 
     # Run process to update the image
     # The default mode is -m 2 (= Mode 2 GC16)
     # more here https://www.waveshare.com/wiki/10.3inch_e-Paper_HAT and https://www.waveshare.com/w/upload/c/c4/E-paper-mode-declaration.pdf
-    run_cmd('sudo {} -v {} -d /dev/sda 0 0 {} {} < image.raw'.format(BINARY_PATH, VCOM,
-                                                                     DISPLAY_WIDTH, DISPLAY_HEIGHT))
+    with spans.span('it8951'):
+        run_cmd('sudo {} -v {} -d /dev/sda 0 0 {} {} < image.raw'.format(BINARY_PATH, VCOM,
+                                                                         DISPLAY_WIDTH, DISPLAY_HEIGHT))
+
+
+def display_region(img, xy, mode=2):
+    '''
+    Draw a grayscale image at xy with a partial update
+    '''
+    if display_client.is_daemon_running():
+        try:
+            display_client.send_update(img.tobytes(), xy, img.size, mode=mode)
+            return
+        except Exception as e:
+            logging.warn('Display daemon failed: {}'.format(e))
+
+    with open('region.raw', 'wb') as f:
+        f.write(img.tobytes())
+
+    with spans.span('it8951'):
+        run_cmd('sudo {} -v {} -m {} /dev/sda {} {} {} {} < region.raw'.format(
+            BINARY_PATH, VCOM, mode, xy[0], xy[1], img.width, img.height))
+
+
+def refresh_loaded_image():
+    '''
+    Refresh the whole display from the image loaded by stream_frame, after
+    clearing it like display_clear. The INIT waveform drives every pixel to white
+    whatever the loaded image is, so the image doesn't need to be loaded again.
+    '''
+    mark_last_frame_off_screen()
+    with spans.span('it8951'):
+        run_cmd('sudo {} -v {} -r -m 0 /dev/sda 0 0 {} {}'.format(BINARY_PATH, VCOM,
+                                                                 DISPLAY_WIDTH, DISPLAY_HEIGHT))
+        run_cmd('sudo {} -v {} -r /dev/sda 0 0 {} {}'.format(BINARY_PATH, VCOM,
+                                                            DISPLAY_WIDTH, DISPLAY_HEIGHT))
 
 
 def display_clear():
@@ -320,8 +820,10 @@ def display_clear():
     #   updating several times."
     #
     # In the command, -m 0 refers to the INIT mode (Mode 0).
-    run_cmd('sudo {} -v {} -d -c -m 0 /dev/sda 0 0 {} {} < image.raw'.format(BINARY_PATH, VCOM,
-                                                                             DISPLAY_WIDTH, DISPLAY_HEIGHT))
+    mark_last_frame_off_screen()
+    with spans.span('it8951'):
+        run_cmd('sudo {} -v {} -d -c -m 0 /dev/sda 0 0 {} {} < image.raw'.format(BINARY_PATH, VCOM,
+                                                                                 DISPLAY_WIDTH, DISPLAY_HEIGHT))
 
 
 @contextmanager
@@ -334,8 +836,18 @@ def edp_display():
 
 
 def after_display_usage():
-    logging.info('TODO: Setting EPD back to sleep...')
-    # TODO: How to set display into sleep?
+    if display_client.is_daemon_running():
+        # The daemon puts the controller into standby itself when it's idle
+        try:
+            logging.info('Display controller power: {}'.format(display_client.get_power_stats()))
+        except Exception as e:
+            logging.warn('Display daemon failed: {}'.format(e))
+        return
+
+    # The binary turns the power back on with the next image
+    with spans.span('it8951'):
+        run_cmd('sudo {} -v {} -s /dev/sda 0 0 {} {}'.format(BINARY_PATH, VCOM,
+                                                            DISPLAY_WIDTH, DISPLAY_HEIGHT))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,77 @@
+# The status bar (refresh time and battery) drawn locally with Pillow into the
+# top padding of the rendered weather image. Battery or time changes then only
+# need a partial update of the bar, not a new server render and a full refresh.
+
+from datetime import datetime
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+# Available in Raspberry PI OS. If missing, Pillow's small bitmap font is used
+FONT_PATH = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+FONT_SIZE = 28
+
+# (x, y, width, height) of the status bar as seen on the display (i.e. before
+# mirroring), at the right edge of the top padding. Multiples of 16, so that
+# the bar can be sent at 1bpp mirrored or not.
+STATUS_BAR_BOX = (1216, 0, 640, 64)
+
+
+def load_font(size=FONT_SIZE):
+    try:
+        return ImageFont.truetype(FONT_PATH, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def place(img, xy, display_width, mirror):
+    '''
+    Return (img, xy) as they should be sent to the display. The display shows
+    the image mirrored, so anything drawn locally has to be mirrored too.
+    '''
+    if not mirror:
+        return img, xy
+    return ImageOps.mirror(img), (display_width - xy[0] - img.width, xy[1])
+
+
+def status_text(updated_at, charge_level, is_charging, offline=False, now=None):
+    '''
+    The text of the status bar. Also used to tell whether the bar has changed.
+    '''
+    text = '{} {}'.format('Offline, updated' if offline else 'Updated',
+                          format_time(updated_at, now))
+    if charge_level is not None:
+        text += '  {}%{}'.format(charge_level, ' +' if is_charging else '')
+    return text
+
+
+def status_bar(text, charge_level, box=STATUS_BAR_BOX):
+    '''
+    Draw the status bar, text aligned to the right followed by a battery icon.
+    Only black and white are used, so that the bar can be updated with the fast
+    DU waveform. Returns an 'L' image of box's size.
+    '''
+    _, _, width, height = box
+    img = Image.new('L', (width, height), 0xFF)
+    draw = ImageDraw.Draw(img)
+    draw.fontmode = '1'  # no antialiasing
+
+    icon_width, icon_height = 44, 24
+    icon_x = width - icon_width - 8
+    icon_y = (height - icon_height) // 2
+    draw.rectangle((icon_x, icon_y, icon_x + icon_width - 5, icon_y + icon_height), outline=0x00, width=3)
+    draw.rectangle((icon_x + icon_width - 5, icon_y + 7, icon_x + icon_width, icon_y + icon_height - 7), fill=0x00)
+    if charge_level is not None:
+        fill_width = round((icon_width - 13) * max(min(charge_level, 100), 0) / 100)
+        if fill_width > 0:
+            draw.rectangle((icon_x + 4, icon_y + 4, icon_x + 4 + fill_width, icon_y + icon_height - 4), fill=0x00)
+
+    font = load_font()
+    _, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    draw.text((icon_x - 16 - right, (height - bottom - top) // 2), text, font=font, fill=0x00)
+    return img
+
+
+def format_time(time, now=None):
+    now = now or datetime.now()
+    if time.date() == now.date():
+        return time.strftime('%H:%M')
+    return time.strftime('%d.%m. %H:%M')
@@ -0,0 +1,216 @@
+# Decode a PNG while it downloads, a band of rows at a time, so that the bands
+# can be sent to the display while later bytes are still arriving.
+#
+# The compressed image data is inflated incrementally. Each band's scanlines are
+# then decoded by Pillow, as a small PNG of their own that starts with the
+# previous band's last row (unfiltered), because PNG filters refer to the row
+# above. Only a couple of bands are held in memory at a time.
+#
+# Only non-interlaced 8-bit PNGs are supported, which is what the render API
+# produces.
+#
+# PngWriter does the opposite, writing a grayscale PNG a band at a time.
+
+import io
+import zlib
+import struct
+from PIL import Image
+
+SIGNATURE = b'\x89PNG\r\n\x1a\n'
+BAND_ROWS = 64
+
+# color type -> channels
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+IHDR = struct.Struct('>IIBBBBB')
+
+
+class _Reader:
+    '''
+    Reads exact amounts of bytes from an iterable of byte strings
+    '''
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.buf = bytearray()
+
+    def read(self, n):
+        while len(self.buf) < n:
+            try:
+                self.buf += next(self.chunks)
+            except StopIteration:
+                raise ValueError('PNG data ended unexpectedly') from None
+        data = bytes(self.buf[:n])
+        del self.buf[:n]
+        return data
+
+    def read_some(self, n):
+        '''
+        Read up to n bytes, without waiting for more than what is available or
+        the next byte string
+        '''
+        if not self.buf:
+            try:
+                self.buf += next(self.chunks)
+            except StopIteration:
+                raise ValueError('PNG data ended unexpectedly') from None
+        data = bytes(self.buf[:n])
+        del self.buf[:n]
+        return data
+
+
+def _chunk(chunk_type, data):
+    return (struct.pack('>I', len(data)) + chunk_type + data +
+            struct.pack('>I', zlib.crc32(chunk_type + data)))
+
+
+def iter_bands(chunks, band_rows=BAND_ROWS):
+    '''
+    Decode a PNG from an iterable of byte strings (e.g. a requests response's
+    iter_content()), yielding (y, band) as soon as each band of rows is complete.
+    Bands are images in the PNG's own mode, band_rows high except the last one.
+    '''
+    reader = _Reader(chunks)
+    if reader.read(len(SIGNATURE)) != SIGNATURE:
+        raise ValueError('Not a PNG')
+
+    header = None
+    # chunks needed to decode the bands, e.g. the palette
+    extra_chunks = []
+    decompressor = zlib.decompressobj()
+    pending = bytearray()
+    prev_row = None
+    y = 0
+
+    while True:
+        length, chunk_type = struct.unpack('>I4s', reader.read(8))
+
+        if chunk_type == b'IDAT':
+            if header is None:
+                raise ValueError('PNG image data before the header')
+            # image data may be in one large chunk, so it's decoded as it arrives
+            # and its checksum is only verified at the end
+            crc = zlib.crc32(chunk_type)
+            while length:
+                data = reader.read_some(length)
+                length -= len(data)
+                crc = zlib.crc32(data, crc)
+                # inflate at most a band at a time, white areas compress very well
+                while data:
+                    pending += decompressor.decompress(data, band_bytes)
+                    data = decompressor.unconsumed_tail
+                    while len(pending) >= band_bytes and y < height:
+                        band, prev_row = _take_band(header, extra_chunks, prev_row, pending, band_rows)
+                        yield y, band
+                        y += band.height
+            if struct.unpack('>I', reader.read(4))[0] != crc:
+                raise ValueError('PNG chunk {} is corrupted'.format(chunk_type))
+            continue
+
+        data = reader.read(length)
+        if struct.unpack('>I', reader.read(4))[0] != zlib.crc32(chunk_type + data):
+            raise ValueError('PNG chunk {} is corrupted'.format(chunk_type))
+
+        if chunk_type == b'IHDR':
+            width, height, bit_depth, color_type, _, _, interlace = IHDR.unpack(data)
+            if bit_depth != 8 or color_type not in CHANNELS or interlace:
+                raise ValueError('Only non-interlaced 8-bit PNGs can be streamed')
+            header = data
+            stride = 1 + width * CHANNELS[color_type]
+            band_bytes = band_rows * stride
+
+        elif chunk_type in (b'PLTE', b'tRNS'):
+            extra_chunks.append(_chunk(chunk_type, data))
+
+        elif chunk_type == b'IEND':
+            break
+
+    if header is None:
+        raise ValueError('PNG has no header')
+
+    pending += decompressor.flush()
+    while y < height:
+        rows = min(band_rows, height - y)
+        if len(pending) < rows * stride:
+            raise ValueError('PNG image data ended unexpectedly')
+        band, prev_row = _take_band(header, extra_chunks, prev_row, pending, rows)
+        yield y, band
+        y += rows
+
+
+def _take_band(header, extra_chunks, prev_row, pending, rows):
+    '''
+    Decode the first rows scanlines of pending and remove them from it. Returns
+    the band and its last row, unfiltered.
+    '''
+    width, _, _, color_type = struct.unpack('>IIBB', header[:10])
+    stride = 1 + width * CHANNELS[color_type]
+    band = _decode_band(header, extra_chunks, prev_row, pending[:rows * stride], rows)
+    del pending[:rows * stride]
+    return band, band.crop((0, rows - 1, width, rows)).tobytes()
+
+
+def _decode_band(header, extra_chunks, prev_row, scanlines, rows):
+    '''
+    Decode filtered scanlines with Pillow. prev_row is the unfiltered row above
+    the band, or None for the first band.
+    '''
+    if prev_row is not None:
+        # filter type 0 (none) for the row above
+        scanlines = b'\0' + prev_row + scanlines
+        rows += 1
+
+    png = b''.join([
+        SIGNATURE,
+        _chunk(b'IHDR', header[:4] + struct.pack('>I', rows) + header[8:]),
+        b''.join(extra_chunks),
+        # stored without compression, it's only passed to Pillow
+        _chunk(b'IDAT', zlib.compress(bytes(scanlines), 0)),
+        _chunk(b'IEND', b''),
+    ])
+    band = Image.open(io.BytesIO(png))
+    band.load()
+
+    if prev_row is not None:
+        band = band.crop((0, 1, band.width, rows))
+    return band
+
+
+class PngWriter:
+    '''
+    Writes an 8-bit grayscale PNG of width x height into the file f, a band of
+    rows at a time, so that the whole image is never in memory. Call close()
+    after the last band.
+    '''
+
+    def __init__(self, f, width, height):
+        self.f = f
+        self.width = width
+        self.height = height
+        self.rows = 0
+        self.compressor = zlib.compressobj()
+        f.write(SIGNATURE)
+        f.write(_chunk(b'IHDR', IHDR.pack(width, height, 8, 0, 0, 0, 0)))
+
+    def write(self, band):
+        '''
+        Append the rows of band, an 'L' image as wide as the PNG
+        '''
+        if band.mode != 'L' or band.width != self.width or self.rows + band.height > self.height:
+            raise ValueError('Band does not fit the PNG')
+        data = band.tobytes()
+        scanlines = bytearray()
+        for y in range(band.height):
+            # filter type 0 (none)
+            scanlines += b'\0' + data[y * self.width:(y + 1) * self.width]
+        self._write_data(self.compressor.compress(bytes(scanlines)))
+        self.rows += band.height
+
+    def close(self):
+        if self.rows != self.height:
+            raise ValueError('PNG has {} rows, expected {}'.format(self.rows, self.height))
+        self._write_data(self.compressor.flush())
+        self.f.write(_chunk(b'IEND', b''))
+
+    def _write_data(self, data):
+        if data:
+            self.f.write(_chunk(b'IDAT', data))
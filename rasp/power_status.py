@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+
+# What the PiJuice tells about the battery and the power input, read once and
+# shared by everything in a wake. Every value is an I2C round trip, which is
+# slow early in the boot, so values are kept for SNAPSHOT_TTL_SECS and the ones
+# that are needed together are read together. Decisions that must see the
+# current state, like whether to shut down, ask for a fresh value.
+#
+#     power = power_status.get(pj)
+#     power.snapshot()['charge_level']['data']
+#     power.on_battery(max_age=0)
+
+import time
+import logging
+
+SNAPSHOT_TTL_SECS = 30
+
+# PiJuice responses by name, each a dict of 'data' and 'error'
+READERS = {
+    'status': lambda pj: pj.status.GetStatus(),
+    'charge_level': lambda pj: pj.status.GetChargeLevel(),
+    'voltage': lambda pj: pj.status.GetBatteryVoltage(),
+    'temperature': lambda pj: pj.status.GetBatteryTemperature(),
+    'current': lambda pj: pj.status.GetBatteryCurrent(),
+}
+
+
+class PowerStatus:
+    '''
+    Caches PiJuice responses for ttl seconds. Responses with an error are
+    returned but not kept, so they are read again on the next use.
+    '''
+
+    def __init__(self, pj, ttl=SNAPSHOT_TTL_SECS, clock=time.monotonic):
+        self.pj = pj
+        self.ttl = ttl
+        self.clock = clock
+        # name: (clock() when read, response)
+        self.values = {}
+
+    def put(self, name, response):
+        '''
+        Keep a response that was read elsewhere, e.g. while waiting for the
+        PiJuice to answer
+        '''
+        if response.get('error') == 'NO_ERROR':
+            self.values[name] = (self.clock(), response)
+
+    def read(self, names, max_age=None):
+        '''
+        Return {name: response} for names, reading in one go those that are
+        missing or older than max_age (ttl by default)
+        '''
+        if max_age is None:
+            max_age = self.ttl
+        now = self.clock()
+        stale = [name for name in names
+                 if name not in self.values or now - self.values[name][0] > max_age]
+
+        fresh = {}
+        if stale:
+            start = time.monotonic()
+            for name in stale:
+                fresh[name] = READERS[name](self.pj)
+                self.put(name, fresh[name])
+            logging.debug('Power status: read {} in {:.3f}s'.format(
+                ', '.join(stale), time.monotonic() - start))
+
+        return {name: fresh[name] if name in fresh else self.values[name][1] for name in names}
+
+    def get(self, name, max_age=None):
+        return self.read([name], max_age)[name]
+
+    def snapshot(self, max_age=None):
+        '''
+        All values, see READERS
+        '''
+        return self.read(list(READERS), max_age)
+
+    def on_battery(self, max_age=None):
+        data = self.get('status', max_age)['data']
+        return data['powerInput'] == 'NOT_PRESENT' and data['powerInput5vIo'] == 'NOT_PRESENT'
+
+    def charge_level(self, max_age=None):
+        return self.get('charge_level', max_age)['data']
+
+
+_power_status = None
+
+
+def start(pj, status=None):
+    '''
+    Start over with nothing cached for pj, e.g. on a new wake. status is a
+    GetStatus response that was just read.
+    '''
+    global _power_status
+    _power_status = PowerStatus(pj)
+    if status is not None:
+        _power_status.put('status', status)
+    return _power_status
+
+
+def get(pj):
+    '''
+    The PowerStatus shared by everything using pj
+    '''
+    if _power_status is None or _power_status.pj is not pj:
+        return start(pj)
+    return _power_status
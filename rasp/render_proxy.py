@@ -0,0 +1,319 @@
+#!/usr/bin/python3
+
+# A caching proxy for the render API, for sites with several displays. Point the
+# displays' RENDER_URL at the proxy, e.g. http://192.168.1.10:8080/render, and
+# displays that ask for the same image get it from one upstream render:
+#
+#   * query parameters are canonicalized (order, number and boolean formats), so
+#     equivalent requests share a cache entry
+#   * concurrent identical requests wait for the same upstream request
+#   * rendered images are cached for --ttl seconds, least recently used ones
+#     are evicted first
+#   * responses have an ETag, and If-None-Match requests get 304 Not Modified
+#   * responses tell the hash of the frame (X-Frame-Hash), so a display can
+#     tell that it already shows the image before downloading it
+#   * requests with the hash of the frame the display has (baseHash) get only
+#     the changed tiles of the new frame, see tile_delta.py
+#
+#     python render_proxy.py --upstream https://.../render --port 8080
+
+import io
+import time
+import hashlib
+import logging
+import argparse
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qsl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PIL import Image
+import requests
+import tile_delta
+
+DEFAULT_TTL_SECS = 10 * 60
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# How many frames sent to displays are kept for computing deltas against
+MAX_DELTA_BASES = 16
+UPSTREAM_TIMEOUT_SECS = 60
+
+# How the render API parses its parameters, see render/src/entrypoints/cloudFunction.ts
+NUMBER_PARAMS = {
+    'lat', 'lon', 'batteryLevel', 'width', 'height', 'resizeToWidth', 'resizeToHeight',
+    'rotate', 'paddingTop', 'paddingRight', 'paddingBottom', 'paddingLeft',
+}
+BOOLEAN_PARAMS = {'batteryCharging', 'showBatteryPercentage', 'showSystemInfo', 'flip', 'flop'}
+
+
+class UpstreamError(Exception):
+    def __init__(self, status, body):
+        Exception.__init__(self, 'Upstream responded with status {}'.format(status))
+        self.status = status
+        self.body = body
+
+
+class CacheEntry:
+    def __init__(self, body, content_type, fetched_at):
+        self.body = body
+        self.content_type = content_type
+        self.fetched_at = fetched_at
+        self.etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        self._frame = None
+        self._frame_hash = None
+
+    def frame(self):
+        '''
+        The image decoded and quantized, as the display will show it
+        '''
+        if self._frame is None:
+            self._frame = tile_delta.quantize(Image.open(io.BytesIO(self.body)).convert('L'))
+        return self._frame
+
+    def frame_hash(self):
+        if self._frame_hash is None:
+            self._frame_hash = tile_delta.frame_hash(self.frame())
+        return self._frame_hash
+
+
+def canonicalize(params):
+    '''
+    Return the parameters as a sorted tuple of (name, value), formatted the way
+    the render API reads them. Parameters the API would ignore (empty values)
+    are dropped.
+    '''
+    rtn = {}
+    for name, value in params:
+        value = value.strip()
+        if value == '':
+            continue
+
+        if name in NUMBER_PARAMS:
+            try:
+                number = float(value)
+                value = str(int(number)) if number.is_integer() else repr(number)
+            except ValueError:
+                # Let the API respond with its error
+                pass
+        elif name in BOOLEAN_PARAMS:
+            value = 'true' if value == 'true' else 'false'
+
+        rtn[name] = value
+    return tuple(sorted(rtn.items()))
+
+
+class RenderCache:
+    '''
+    Cache of rendered images by canonical parameters.
+
+    fetch(params) is called for misses, and should return (body, content_type)
+    or raise UpstreamError.
+    '''
+
+    def __init__(self, fetch, ttl=DEFAULT_TTL_SECS, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_bytes=DEFAULT_MAX_BYTES, clock=time.monotonic):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+
+        self.entries = OrderedDict()
+        self.size = 0
+        self.in_flight = {}
+        self.stats = {'hits': 0, 'misses': 0, 'shared': 0}
+        self.lock = threading.Lock()
+
+    def get(self, params):
+        key = canonicalize(params)
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and self.clock() - entry.fetched_at < self.ttl:
+                self.entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return entry
+
+            waiting = self.in_flight.get(key)
+            if waiting is None:
+                waiting = self.in_flight[key] = {'done': threading.Event()}
+                leader = True
+                self.stats['misses'] += 1
+            else:
+                leader = False
+                self.stats['shared'] += 1
+
+        if not leader:
+            # An identical request is already being rendered, wait for its result
+            waiting['done'].wait()
+            if 'error' in waiting:
+                raise waiting['error']
+            return waiting['entry']
+
+        try:
+            body, content_type = self.fetch(key)
+            entry = CacheEntry(body, content_type, self.clock())
+            waiting['entry'] = entry
+            with self.lock:
+                self._store(key, entry)
+            return entry
+        except Exception as e:
+            waiting['error'] = e
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+            waiting['done'].set()
+
+    def _store(self, key, entry):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old.body)
+
+        self.entries[key] = entry
+        self.size += len(entry.body)
+
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted.body)
+
+
+def fetch_upstream(url, params):
+    res = requests.get(url, params=list(params), timeout=UPSTREAM_TIMEOUT_SECS)
+    if res.status_code != 200:
+        raise UpstreamError(res.status_code, res.content)
+    return res.content, res.headers.get('content-type', 'image/png')
+
+
+class ProxyHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        params = parse_qsl(urlsplit(self.path).query, keep_blank_values=True)
+        base_hash = dict(params).get('baseHash')
+        params = [(name, value) for name, value in params if name != 'baseHash']
+
+        if dict(params).get('ping') == 'true':
+            # Devices use this to check for internet connection, so ask upstream
+            try:
+                status = requests.get(self.server.upstream_url, params={'ping': 'true'},
+                                      timeout=UPSTREAM_TIMEOUT_SECS).status_code
+            except requests.RequestException:
+                status = 502
+            self.send_response(status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        try:
+            entry = self.server.cache.get(params)
+        except UpstreamError as e:
+            self.send_body(e.status, e.body, 'text/plain')
+            return
+        except Exception as e:
+            logging.error('Render proxy: upstream request failed: {}'.format(e))
+            self.send_body(502, str(e).encode('utf-8'), 'text/plain')
+            return
+
+        if base_hash is not None:
+            try:
+                if self.send_delta(entry, base_hash):
+                    return
+            except Exception as e:
+                logging.error('Render proxy: computing delta failed: {}'.format(e))
+
+        max_age = max(int(self.server.cache.ttl - (self.server.cache.clock() - entry.fetched_at)), 0)
+        headers = {
+            'ETag': entry.etag,
+            'Cache-Control': 'max-age={}'.format(max_age),
+        }
+        if entry.content_type == 'image/png':
+            try:
+                headers['X-Frame-Hash'] = entry.frame_hash()
+            except Exception as e:
+                logging.error('Render proxy: decoding image failed: {}'.format(e))
+        if self.headers.get('If-None-Match') == entry.etag:
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+
+        self.send_body(200, entry.body, entry.content_type, headers)
+
+    def send_delta(self, entry, base_hash):
+        '''
+        Send the tiles that changed since the frame with base_hash, if that frame
+        is known and the delta is smaller than the image. Returns whether sent.
+        '''
+        frame = entry.frame()
+        frame_hash = entry.frame_hash()
+        self.server.remember_frame(frame_hash, frame)
+
+        base = self.server.get_frame(base_hash)
+        if base is None or base.size != frame.size:
+            return False
+
+        delta = tile_delta.encode_delta(base, frame)
+        if len(delta) >= len(entry.body):
+            return False
+
+        self.send_body(200, delta, tile_delta.CONTENT_TYPE, {'X-Frame-Hash': frame_hash})
+        return True
+
+    def send_body(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.info('Render proxy: ' + format % args)
+
+
+class ProxyServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, upstream_url, cache=None):
+        self.upstream_url = upstream_url
+        self.cache = cache or RenderCache(lambda params: fetch_upstream(upstream_url, params))
+        self.frames = OrderedDict()
+        self.frames_lock = threading.Lock()
+        ThreadingHTTPServer.__init__(self, address, ProxyHandler)
+
+    def remember_frame(self, frame_hash, frame):
+        with self.frames_lock:
+            self.frames[frame_hash] = frame
+            self.frames.move_to_end(frame_hash)
+            while len(self.frames) > MAX_DELTA_BASES:
+                self.frames.popitem(last=False)
+
+    def get_frame(self, frame_hash):
+        with self.frames_lock:
+            return self.frames.get(frame_hash)
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='eink-weather-display render_proxy.py')
+    p.add_argument('--upstream', required=True, help='The render API URL')
+    p.add_argument('--host', default='0.0.0.0')
+    p.add_argument('--port', type=int, default=8080)
+    p.add_argument('--ttl', type=int, default=DEFAULT_TTL_SECS,
+                   help='How many seconds rendered images are reused')
+    p.add_argument('--max-entries', type=int, default=DEFAULT_MAX_ENTRIES)
+    return p.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s\t%(message)s')
+    args = parse_args()
+
+    cache = RenderCache(lambda params: fetch_upstream(args.upstream, params),
+                        ttl=args.ttl, max_entries=args.max_entries)
+    server = ProxyServer((args.host, args.port), args.upstream, cache)
+    logging.info('Render proxy listening on {}:{}, upstream {}'.format(args.host, args.port, args.upstream))
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
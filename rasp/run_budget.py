@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+
+# Splits one deadline for the whole wake cycle into time budgets for its phases,
+# so that on battery the Raspberry PI is awake for a bounded time, however slow
+# the network or the devices are. The time is counted from power on, and a
+# reserve is kept at the end for what must always happen, i.e. the shutdown. A
+# watchdog thread starts that at the reserve even if a phase hangs.
+#
+# Every decision is logged with a "Budget:" prefix, for tuning the budgets.
+
+import time
+import logging
+import threading
+
+
+def get_uptime():
+    with open('/proc/uptime') as f:
+        return float(f.readline().split()[0])
+
+
+class RunBudget:
+    '''
+    total_secs is the length of the wake, of which elapsed_secs have passed
+    already. The last reserve_secs are not given to any phase. Deadlines are
+    time.monotonic() values.
+    '''
+
+    def __init__(self, total_secs, reserve_secs, elapsed_secs=0, clock=time.monotonic):
+        self.clock = clock
+        self.deadline = clock() + total_secs - elapsed_secs
+        self.reserve_secs = reserve_secs
+        self.watchdog = None
+        logging.info('Budget: {:.1f}s of {}s left for the wake, {}s reserved'.format(
+            total_secs - elapsed_secs, total_secs, reserve_secs))
+
+    def left(self, keep_secs=0):
+        '''
+        Seconds left for phases, keeping keep_secs for later ones
+        '''
+        return self.deadline - self.reserve_secs - keep_secs - self.clock()
+
+    def phase_deadline(self, name, max_secs=None, keep_secs=0):
+        '''
+        Return the deadline for phase name: after at most max_secs, and early
+        enough to leave keep_secs for later phases
+        '''
+        secs = max(self.left(keep_secs), 0)
+        if max_secs is not None:
+            secs = min(secs, max_secs)
+        logging.info('Budget: {} gets {:.1f}s, {:.1f}s left'.format(name, secs, self.left()))
+        return self.clock() + secs
+
+    def allows(self, name, needed_secs, keep_secs=0):
+        '''
+        Whether phase name, which takes needed_secs, fits in the time left
+        '''
+        left = self.left(keep_secs)
+        if left < needed_secs:
+            logging.info('Budget: skipping {}, it needs {}s but {:.1f}s are left'.format(
+                name, needed_secs, left))
+            return False
+        logging.info('Budget: running {}, it needs {}s and {:.1f}s are left'.format(
+            name, needed_secs, left))
+        return True
+
+    def start_watchdog(self, name, callback):
+        '''
+        Call callback from a background thread when the reserve starts, unless
+        cancel_watchdog is called before that
+        '''
+        def expired():
+            logging.warn('Budget: out of time, running {} now'.format(name))
+            callback()
+
+        delay = max(self.left(), 0)
+        logging.info('Budget: {} in {:.1f}s at the latest'.format(name, delay))
+        self.watchdog = threading.Timer(delay, expired)
+        self.watchdog.daemon = True
+        self.watchdog.start()
+
+    def cancel_watchdog(self):
+        if self.watchdog is not None:
+            self.watchdog.cancel()
+            self.watchdog = None
@@ -0,0 +1,290 @@
+#!/usr/bin/python3
+
+# Decides at which hours the RTC alarm wakes the Raspberry PI.
+#
+# Every wake costs a boot, network join, download and a full refresh. Instead of
+# always waking up at the same hours, the schedule adapts to:
+#
+#   * battery charge: the lower the charge, the fewer wakes per day
+#   * time of day: hours where the fetched image rarely differed from the
+#     previous one are dropped first, the morning wake is always kept
+#
+# To know whether images differed, each wake is recorded into a small history
+# file. The same information is logged, so that the schedule can be evaluated
+# against historical logs with the simulator:
+#
+#     python scheduler.py simulate /home/pi/status.log
+
+import os
+import re
+import json
+import argparse
+import statistics
+from datetime import datetime, timedelta, time as dtime
+
+import pytz
+
+HISTORY_PATH = '/home/pi/wake-history.json'
+# The hours below are in this time zone
+LOCAL_TIMEZONE = 'Europe/Helsinki'
+MAX_HISTORY_LENGTH = 24 * 7
+# The wakeups used when there's nothing better to go by, in local time
+DEFAULT_LOCAL_HOURS = [6, 9, 12, 15, 18, 21]
+MORNING_LOCAL_HOUR = 6
+# (minimum charge level, wakes per day), the first matching row wins
+WAKES_PER_DAY_BY_CHARGE = [
+    (50, 6),
+    (30, 4),
+    (15, 3),
+    (0, 2),
+]
+# How many recent wakes per hour are needed before their change rate is trusted
+MIN_SAMPLES_PER_HOUR = 3
+RECENT_WAKES_PER_HOUR = 7
+
+
+def load_history(path=HISTORY_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_history(history, path=HISTORY_PATH):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(history[-MAX_HISTORY_LENGTH:], f)
+    os.replace(tmp_path, path)
+
+
+def record_wake(history, local_hour, charge_level, is_on_battery, image_hash):
+    '''
+    Append a wake to history. Returns whether the image differed from the
+    image of the previous wake (None if there's nothing to compare to).
+    '''
+    previous_hash = next(
+        (w['image_hash'] for w in reversed(history) if w.get('image_hash')), None)
+    changed = None if previous_hash is None else previous_hash != image_hash
+    history.append({
+        'time': datetime.utcnow().isoformat(),
+        'local_hour': local_hour,
+        'charge': charge_level,
+        'on_battery': is_on_battery,
+        'image_hash': image_hash,
+        'changed': changed,
+    })
+    return changed
+
+
+def wakes_per_day(charge_level):
+    for min_level, wakes in WAKES_PER_DAY_BY_CHARGE:
+        if charge_level >= min_level:
+            return wakes
+    return WAKES_PER_DAY_BY_CHARGE[-1][1]
+
+
+def change_rate(history, local_hour):
+    '''
+    How often the image of recent wakes at local_hour differed from the
+    previous one. Hours without enough data count as always changing.
+    '''
+    samples = [w['changed'] for w in history
+               if w['local_hour'] == local_hour and w['changed'] is not None]
+    samples = samples[-RECENT_WAKES_PER_HOUR:]
+    if len(samples) < MIN_SAMPLES_PER_HOUR:
+        return 1.0
+    return sum(samples) / len(samples)
+
+
+def compute_wakeup_hours(history):
+    '''
+    Return the local hours at which to wake up, based on the wake history
+    '''
+    if not history or not history[-1]['on_battery']:
+        return DEFAULT_LOCAL_HOURS
+
+    budget = wakes_per_day(history[-1]['charge'])
+    others = [h for h in DEFAULT_LOCAL_HOURS if h != MORNING_LOCAL_HOUR]
+    # Most useful first. Sorting is stable, so ties keep the earlier hours
+    others.sort(key=lambda h: -change_rate(history, h))
+    return sorted([MORNING_LOCAL_HOUR] + others[:budget - 1])
+
+
+#
+# Simulator
+#
+
+LOG_LINE_RE = re.compile(r'^(\S+) (\w+)\t(.*)$')
+CHARGE_RE = re.compile(r"Charge level: .*'data': (\d+)")
+HASH_RE = re.compile(r'Image hash: (\w+)')
+
+
+def parse_log_wakes(lines):
+    '''
+    Extract wakes from status.log lines as dicts with keys time, charge,
+    on_battery and image_hash
+    '''
+    wakes = []
+    for line in lines:
+        match = LOG_LINE_RE.match(line)
+        if not match:
+            continue
+        timestamp, _, message = match.groups()
+
+        if message.startswith('Running main_wrapper'):
+            wakes.append({
+                'time': datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%S'),
+                'charge': None,
+                'on_battery': True,
+                'image_hash': None,
+            })
+        elif not wakes:
+            continue
+        elif CHARGE_RE.search(message):
+            wakes[-1]['charge'] = int(CHARGE_RE.search(message).group(1))
+        elif HASH_RE.search(message):
+            wakes[-1]['image_hash'] = HASH_RE.search(message).group(1)
+        elif 'cable-connected power' in message:
+            wakes[-1]['on_battery'] = False
+
+    return [w for w in wakes if w['charge'] is not None]
+
+
+def estimate_cost_per_wake(wakes):
+    '''
+    Average charge drop between consecutive wakes on battery, in percent.
+    Charge levels are whole percents, so single drops are mostly 0 or 1.
+    '''
+    drops = [a['charge'] - b['charge'] for a, b in zip(wakes, wakes[1:])
+             if a['on_battery'] and b['on_battery'] and a['charge'] >= b['charge']]
+    if not drops or sum(drops) == 0:
+        return 1.0
+    return statistics.mean(drops)
+
+
+def to_local_time(time, timezone):
+    '''
+    Convert a naive datetime in timezone to a naive datetime in LOCAL_TIMEZONE
+    '''
+    if timezone == LOCAL_TIMEZONE:
+        return time
+    aware = pytz.timezone(timezone).localize(time)
+    return aware.astimezone(pytz.timezone(LOCAL_TIMEZONE)).replace(tzinfo=None)
+
+
+def simulate(wakes, log_timezone=LOCAL_TIMEZONE):
+    '''
+    Replay logged wakes with the fixed and the adaptive schedule. The image a
+    simulated wake would get is the one of the latest logged wake before it.
+    Times in wakes are in log_timezone, the time zone of the Pi that wrote the
+    logs. Returns a dict of results per schedule.
+    '''
+    if not wakes:
+        raise ValueError('No wakes found in the logs')
+
+    # Wall clock time, like the wakeup hours. Days with a DST change are 23 or
+    # 25 hours long, which is what the wakeups follow too.
+    wakes = [dict(w, time=to_local_time(w['time'], log_timezone)) for w in wakes]
+    cost = estimate_cost_per_wake(wakes)
+    has_hashes = any(w['image_hash'] for w in wakes)
+    start = wakes[0]['time'].date()
+    days = (wakes[-1]['time'].date() - start).days + 1
+
+    def image_at(time):
+        latest = None
+        for w in wakes:
+            if w['time'] > time:
+                break
+            latest = w
+        if latest is None:
+            return None
+        # Without hashes in the logs, every wake counts as a new image
+        return latest['image_hash'] if has_hashes else latest['time']
+
+    def on_battery_at(time):
+        latest = next((w for w in reversed(wakes) if w['time'] <= time), wakes[0])
+        return latest['on_battery'], latest['charge']
+
+    results = {}
+    for name in ('fixed', 'adaptive'):
+        charge = wakes[0]['charge']
+        history = []
+        wake_count = 0
+        useful = 0
+        displayed = None
+
+        for day in range(days):
+            if name == 'fixed':
+                hours = DEFAULT_LOCAL_HOURS
+            else:
+                hours = compute_wakeup_hours(history)
+
+            for local_hour in hours:
+                time = datetime.combine(start + timedelta(days=day), dtime(local_hour))
+                image = image_at(time)
+                if image is None or time > wakes[-1]['time']:
+                    continue
+
+                on_battery, logged_charge = on_battery_at(time)
+                if not on_battery:
+                    # Charging, the battery is back to whatever the logs say
+                    charge = logged_charge
+                else:
+                    charge = max(charge - cost, 0)
+
+                wake_count += 1
+                changed = None if displayed is None else image != displayed
+                if changed is not False:
+                    useful += 1
+                displayed = image
+                history.append({
+                    'local_hour': local_hour,
+                    'charge': charge,
+                    'on_battery': on_battery,
+                    'image_hash': str(image),
+                    'changed': changed,
+                })
+
+        results[name] = {
+            'wakes': wake_count,
+            'useful_updates': useful,
+            'charge_used': wake_count * cost,
+            'charge_per_useful_update': wake_count * cost / max(useful, 1),
+        }
+
+    results['cost_per_wake'] = cost
+    results['has_image_hashes'] = has_hashes
+    return results
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='eink-weather-display scheduler.py')
+    sub = p.add_subparsers(dest='command', required=True)
+    sim = sub.add_parser('simulate', help='Compare schedules against historical logs')
+    sim.add_argument('logs', nargs='+', help='status.log files, oldest first')
+    sim.add_argument('--log-timezone', default=LOCAL_TIMEZONE,
+                     help='Time zone of the timestamps in logs, i.e. of the Pi')
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    lines = []
+    for path in args.logs:
+        with open(path, errors='replace') as f:
+            lines.extend(f)
+
+    results = simulate(parse_log_wakes(lines), log_timezone=args.log_timezone)
+    print('Estimated battery use per wake: {:.2f}%'.format(results['cost_per_wake']))
+    if not results['has_image_hashes']:
+        print('Note: logs have no image hashes, every wake counts as a useful update')
+    for name in ('fixed', 'adaptive'):
+        r = results[name]
+        print('{:>9}: {} wakes, {} useful updates, {:.1f}% battery used, {:.2f}% per useful update'.format(
+            name, r['wakes'], r['useful_updates'], r['charge_used'], r['charge_per_useful_update']))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,24 +2,19 @@
 
 import logging
 from main import shutdown, get_pijuice, is_pijuice_on_battery, enable_wakeups, is_ssh_active
+from run_budget import get_uptime
 
 MIN_UPTIME_SECONDS = 60 * 2
 MAX_SSH_UPTIME_SECONDS = 60 * 60
 
 
-def get_uptime():
-    with open('/proc/uptime', 'r') as f:
-        uptime_seconds = float(f.readline().split()[0])
-
-    return uptime_seconds
-
-
 if __name__ == '__main__':
     uptime_secs = get_uptime()
     logging.info(
         'Running shutdown_if_on_battery.py, uptime {}s'.format(uptime_secs))
 
     pj = get_pijuice()
+    # Uses the status read while waiting for the PiJuice, it's just as fresh
     is_on_battery = is_pijuice_on_battery(pj)
     if uptime_secs < MIN_UPTIME_SECONDS:
         logging.info('Min uptime not exceeded yet ({}s), keeping power on'.format(
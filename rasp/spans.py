@@ -0,0 +1,204 @@
+#!/usr/bin/python3
+
+# Records how long each phase of a wake cycle takes, e.g. waiting for the
+# network or running it8951, into a ring buffer file. Records are fixed-size
+# and written through mmap, so recording costs about a struct.pack and nothing
+# depends on the network. The file survives shutdowns, so timings of the last
+# wakes can be summarized afterwards:
+#
+#     python spans.py summary --last 20
+
+import os
+import mmap
+import time
+import struct
+import logging
+import argparse
+from contextlib import contextmanager
+
+SPANS_PATH = '/home/pi/wake-spans.bin'
+CAPACITY = 4096
+
+MAGIC = b'SPAN'
+VERSION = 1
+# magic, version, record size, capacity, number of records ever written
+HEADER = struct.Struct('<4sHHII')
+# wake id (wall clock at the start of the wake), start offset from the start of
+# the wake in seconds, duration in seconds, phase name
+RECORD = struct.Struct('<dff16s')
+
+
+class SpanRecorder:
+    def __init__(self, path=SPANS_PATH, capacity=None):
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if capacity is None:
+                # Keep the capacity of an existing file
+                header = os.pread(fd, HEADER.size, 0)
+                if len(header) == HEADER.size and header[:4] == MAGIC:
+                    capacity = HEADER.unpack(header)[3]
+                else:
+                    capacity = CAPACITY
+            size = HEADER.size + capacity * RECORD.size
+            if os.fstat(fd).st_size != size:
+                os.ftruncate(fd, size)
+            self.mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        magic, version, record_size, file_capacity, count = HEADER.unpack_from(self.mmap, 0)
+        if (magic, version, record_size, file_capacity) != (MAGIC, VERSION, RECORD.size, capacity):
+            # New or incompatible file, start over
+            count = 0
+            HEADER.pack_into(self.mmap, 0, MAGIC, VERSION, RECORD.size, capacity, count)
+
+        self.capacity = capacity
+        self.count = count
+        self.start_wake()
+
+    def start_wake(self):
+        self.wake_id = time.time()
+        self.wake_start = time.monotonic()
+
+    def record(self, name, start, duration):
+        '''
+        Record a span. start is a time.monotonic() value.
+        '''
+        offset = HEADER.size + (self.count % self.capacity) * RECORD.size
+        RECORD.pack_into(self.mmap, offset, self.wake_id, start - self.wake_start,
+                         duration, name.encode('ascii')[:16])
+        self.count += 1
+        HEADER.pack_into(self.mmap, 0, MAGIC, VERSION, RECORD.size, self.capacity, self.count)
+
+    @contextmanager
+    def span(self, name):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.monotonic() - start)
+
+    def flush(self):
+        self.mmap.flush()
+
+    def records(self):
+        '''
+        Return all records in the buffer, oldest first, as tuples of
+        (wake id, start offset, duration, name)
+        '''
+        first = max(self.count - self.capacity, 0)
+        rtn = []
+        for i in range(first, self.count):
+            offset = HEADER.size + (i % self.capacity) * RECORD.size
+            wake_id, start, duration, name = RECORD.unpack_from(self.mmap, offset)
+            rtn.append((wake_id, start, duration, name.rstrip(b'\0').decode('ascii')))
+        return rtn
+
+
+class NullRecorder:
+    '''
+    Used if the ring file can't be opened, recording must never break a wake
+    '''
+
+    def start_wake(self):
+        pass
+
+    def record(self, name, start, duration):
+        pass
+
+    @contextmanager
+    def span(self, name):
+        yield
+
+    def flush(self):
+        pass
+
+
+_recorder = None
+
+
+def get_recorder():
+    global _recorder
+    if _recorder is None:
+        try:
+            _recorder = SpanRecorder(SPANS_PATH)
+        except Exception as e:
+            logging.warn('Could not open {}, not recording spans: {}'.format(SPANS_PATH, e))
+            _recorder = NullRecorder()
+    return _recorder
+
+
+def span(name):
+    '''
+    Context manager that records how long its body took, as phase name
+    '''
+    return get_recorder().span(name)
+
+
+def record_boot(uptime):
+    '''
+    Record the time from power on until now, uptime seconds (see
+    run_budget.get_uptime), as the boot phase
+    '''
+    recorder = get_recorder()
+    recorder.start_wake()
+    recorder.record('boot', time.monotonic() - uptime, uptime)
+
+
+def flush():
+    get_recorder().flush()
+
+
+def percentile(ordered, p):
+    index = int(round((len(ordered) - 1) * p / 100))
+    return ordered[index]
+
+
+def summarize(records, last=20):
+    '''
+    Return {phase: (count, p50, p90, max)} over the last wakes. Spans of the
+    same phase within one wake are added together.
+    '''
+    wakes = {}
+    for wake_id, _, duration, name in records:
+        phases = wakes.setdefault(wake_id, {})
+        phases[name] = phases.get(name, 0) + duration
+
+    durations = {}
+    for wake_id in sorted(wakes)[-last:]:
+        for name, duration in wakes[wake_id].items():
+            durations.setdefault(name, []).append(duration)
+
+    summary = {}
+    for name, values in durations.items():
+        values.sort()
+        summary[name] = (len(values), percentile(values, 50), percentile(values, 90), values[-1])
+    return summary
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='eink-weather-display spans.py')
+    sub = p.add_subparsers(dest='command', required=True)
+    summary = sub.add_parser('summary', help='Print percentiles per phase')
+    summary.add_argument('--last', type=int, default=20, help='How many wakes to include')
+    summary.add_argument('--path', default=SPANS_PATH)
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    records = SpanRecorder(args.path).records()
+    summary = summarize(records, last=args.last)
+
+    print('{:<16} {:>6} {:>9} {:>9} {:>9}'.format('phase', 'wakes', 'p50 s', 'p90 s', 'max s'))
+    # Phases in the order they usually happen
+    first_start = {}
+    for _, start, _, name in records:
+        first_start.setdefault(name, start)
+    for name in sorted(summary, key=lambda n: first_start[n]):
+        count, p50, p90, max_ = summary[name]
+        print('{:<16} {:>6} {:>9.2f} {:>9.2f} {:>9.2f}'.format(name, count, p50, p90, max_))
+
+
+if __name__ == '__main__':
+    main()
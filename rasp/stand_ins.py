@@ -0,0 +1,102 @@
+# Stand-ins for the hardware that only exists on the Pi, for bench_wake.py and
+# the tests
+
+import sys
+import time
+import types
+
+
+class FakePiJuice:
+    '''
+    Answers like pijuice.PiJuice, with each call taking call_secs like an I2C
+    round trip. GetStatus fails for the first not_ready calls, as it does while
+    the PiJuice is starting up. on_battery and charge_level can be changed
+    between wakes. Calls are counted in calls.
+    '''
+
+    def __init__(self, on_battery=True, charge_level=80, call_secs=0, not_ready=0):
+        self.on_battery = on_battery
+        self.charge_level = charge_level
+        self.call_secs = call_secs
+        self.not_ready = not_ready
+        self.calls = []
+        self.alarm = None
+        self.status = _FakeStatus(self)
+        self.rtcAlarm = _FakeRtcAlarm(self)
+        self.power = _FakePower(self)
+
+    def call(self, name, data=None, error='NO_ERROR'):
+        self.calls.append(name)
+        time.sleep(self.call_secs)
+        return {'data': data, 'error': error}
+
+
+class _FakeStatus:
+    def __init__(self, pj):
+        self.pj = pj
+
+    def GetStatus(self):
+        if self.pj.not_ready > 0:
+            self.pj.not_ready -= 1
+            return self.pj.call('GetStatus', error='COMMUNICATION_ERROR')
+        power_input = 'NOT_PRESENT' if self.pj.on_battery else 'PRESENT'
+        return self.pj.call('GetStatus', {
+            'isFault': False,
+            'isButton': False,
+            'battery': 'NORMAL',
+            'powerInput': power_input,
+            'powerInput5vIo': 'NOT_PRESENT',
+        })
+
+    def GetChargeLevel(self):
+        return self.pj.call('GetChargeLevel', self.pj.charge_level)
+
+    def GetBatteryVoltage(self):
+        return self.pj.call('GetBatteryVoltage', 3900)
+
+    def GetBatteryTemperature(self):
+        return self.pj.call('GetBatteryTemperature', 20)
+
+    def GetBatteryCurrent(self):
+        return self.pj.call('GetBatteryCurrent', -200 if self.pj.on_battery else 300)
+
+
+class _FakeRtcAlarm:
+    def __init__(self, pj):
+        self.pj = pj
+
+    def SetAlarm(self, alarm):
+        self.pj.alarm = alarm
+        return self.pj.call('SetAlarm')
+
+    def GetAlarm(self):
+        return self.pj.call('GetAlarm', self.pj.alarm)
+
+    def SetWakeupEnabled(self, enabled):
+        return self.pj.call('SetWakeupEnabled')
+
+
+class _FakePower:
+    def __init__(self, pj):
+        self.pj = pj
+
+    def SetWakeUpOnCharge(self, level):
+        return self.pj.call('SetWakeUpOnCharge')
+
+    def SetSystemPowerSwitch(self, state):
+        return self.pj.call('SetSystemPowerSwitch')
+
+    def SetPowerOff(self, delay):
+        return self.pj.call('SetPowerOff')
+
+
+def import_main():
+    '''
+    Import main.py with stand-ins for the modules that only work on the Pi:
+    pijuice, and config (reads .env and sends the logs to the cloud)
+    '''
+    if 'main' not in sys.modules:
+        sys.modules['config'] = types.SimpleNamespace(config={})
+        sys.modules.setdefault('pijuice', types.SimpleNamespace(PiJuice=None))
+    import main
+    return main
@@ -0,0 +1,13 @@
+# Helpers shared by the tests
+
+
+class FakeClock:
+    '''
+    A clock that only moves when the test moves it, for time.monotonic
+    '''
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
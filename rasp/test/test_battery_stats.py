@@ -0,0 +1,214 @@
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import battery_stats
+from battery_stats import Column, LogStore
+
+
+@pytest.fixture(autouse=True)
+def helsinki_time():
+    old = os.environ.get('TZ')
+    os.environ['TZ'] = 'Europe/Helsinki'
+    time.tzset()
+    yield
+    if old is None:
+        del os.environ['TZ']
+    else:
+        os.environ['TZ'] = old
+    time.tzset()
+
+
+def wake_lines(t, charge, on_battery=True):
+    '''
+    What main.py logs on a wake at local time t
+    '''
+    stamp = t.strftime('%Y-%m-%dT%H:%M:%S')
+    power = 'runs on battery power' if on_battery else 'is on cable-connected power'
+    return [
+        "{} INFO\tRunning main_wrapper\n".format(stamp),
+        "{} INFO\tCharge level: {{'data': {}, 'error': 'NO_ERROR'}}\n".format(stamp, charge),
+        "{} DEBUG\tGetBatteryVoltage: {{'data': 3900, 'error': 'NO_ERROR'}}\n".format(stamp),
+        "{} DEBUG\tGetBatteryTemperature: {{'data': 21, 'error': 'NO_ERROR'}}\n".format(stamp),
+        "{} INFO\tRaspberry PI {}\n".format(stamp, power),
+        "{} INFO\tUnrelated line\n".format(stamp),
+    ]
+
+
+def write_log(path, lines, mode='w'):
+    with open(path, mode) as f:
+        f.writelines(lines)
+
+
+def test_timestamps_are_local_time(tmp_path):
+    path = str(tmp_path / 'status.log')
+    # Winter (UTC+2) and summer (UTC+3)
+    write_log(path, wake_lines(datetime(2023, 1, 10, 6), 80) + wake_lines(datetime(2023, 7, 10, 6), 70))
+    store = LogStore(str(tmp_path / 'cache'))
+    store.update(path)
+
+    times = list(store.columns['charge'].times)
+    # 04:00 and 03:00 UTC
+    assert times == [1673323200.0, 1688958000.0]
+    assert battery_stats.format_time(times[1]) == '2023-07-10 03:00 UTC'
+
+
+def test_incremental_update(tmp_path):
+    path = str(tmp_path / 'status.log')
+    cache_dir = str(tmp_path / 'cache')
+    start = datetime(2023, 1, 10, 6)
+    write_log(path, wake_lines(start, 80))
+
+    store = LogStore(cache_dir)
+    store.load()
+    assert store.update(path) == 6
+    assert list(store.columns['charge'].values) == [80]
+    assert list(store.columns['voltage'].values) == [3900]
+    assert list(store.columns['wake'].values) == [1.0]
+    assert list(store.columns['on_battery'].values) == [1.0]
+    store.save()
+
+    # A new run only parses what was added, and not a partly written line
+    write_log(path, wake_lines(start + timedelta(hours=3), 79, on_battery=False), mode='a')
+    write_log(path, ['2023-01-10T10:00:00 INFO\tCharge level: {'], mode='a')
+    store = LogStore(cache_dir)
+    store.load()
+    assert len(store.columns['charge']) == 1
+    assert store.update(path) == 6
+    assert list(store.columns['charge'].values) == [80, 79]
+    assert list(store.columns['on_battery'].values) == [1.0, 0.0]
+    assert store.update(path) == 0
+
+    write_log(path, [" 'data': 78, 'error': 'NO_ERROR'}\n"], mode='a')
+    assert store.update(path) == 1
+    assert list(store.columns['charge'].values) == [80, 79, 78]
+    store.save()
+
+    # The cached columns are what was parsed
+    store = LogStore(cache_dir)
+    store.load()
+    assert list(store.columns['charge'].values) == [80, 79, 78]
+    assert list(store.columns['wake'].times) == [start.timestamp(), (start + timedelta(hours=3)).timestamp()]
+    assert store.update(path) == 0
+
+
+def test_rotation(tmp_path):
+    path = str(tmp_path / 'status.log')
+    cache_dir = str(tmp_path / 'cache')
+    start = datetime(2023, 1, 10, 6)
+    write_log(path, wake_lines(start, 80))
+    store = LogStore(cache_dir)
+    store.update(path)
+    store.save()
+
+    # Renamed to status.log.1, a new status.log is started
+    os.rename(path, path + '.1')
+    write_log(path, wake_lines(start + timedelta(hours=3), 79))
+    store = LogStore(cache_dir)
+    store.load()
+    assert store.update(path + '.1') == 0
+    assert store.update(path) == 6
+    assert list(store.columns['charge'].values) == [80, 79]
+
+    # Truncated in place (and shorter than what was read), everything in it is new
+    write_log(path, wake_lines(start + timedelta(hours=6), 78)[:2])
+    assert store.update(path) == 2
+    assert list(store.columns['charge'].values) == [80, 79, 78]
+
+
+def test_interrupted_save(tmp_path):
+    path = str(tmp_path / 'status.log')
+    cache_dir = str(tmp_path / 'cache')
+    write_log(path, wake_lines(datetime(2023, 1, 10, 6), 80))
+    store = LogStore(cache_dir)
+    store.update(path)
+    store.save()
+
+    # The columns were appended to but the index wasn't written
+    write_log(path, wake_lines(datetime(2023, 1, 10, 9), 79), mode='a')
+    store.update(path)
+    index = open(os.path.join(cache_dir, 'index.json')).read()
+    store.save()
+    write_log(os.path.join(cache_dir, 'index.json'), [index])
+
+    store = LogStore(cache_dir)
+    store.load()
+    assert list(store.columns['charge'].values) == [80]
+    assert store.update(path) == 6
+    store.save()
+    store = LogStore(cache_dir)
+    store.load()
+    assert list(store.columns['charge'].values) == [80, 79]
+
+
+def test_old_cache_is_parsed_again(tmp_path):
+    path = str(tmp_path / 'status.log')
+    cache_dir = str(tmp_path / 'cache')
+    write_log(path, wake_lines(datetime(2023, 1, 10, 6), 80))
+    store = LogStore(cache_dir)
+    store.update(path)
+    store.save()
+
+    write_log(os.path.join(cache_dir, 'index.json'), ['{"offsets": {}, "lengths": {}}'])
+    store = LogStore(cache_dir)
+    store.load()
+    assert store.offsets == {}
+    assert store.update(path) == 6
+
+
+def test_linear_fit():
+    a, b, stddev = battery_stats.linear_fit([0, 1, 2, 3], [10, 8, 6, 4])
+    assert a == pytest.approx(-2)
+    assert b == pytest.approx(10)
+    assert stddev == pytest.approx(0)
+
+    a, b, stddev = battery_stats.linear_fit([0, 1, 2, 3], [1, 3, 3, 5])
+    assert a == pytest.approx(1.2)
+    assert b == pytest.approx(1.2)
+    assert stddev == pytest.approx(0.4 ** 0.5)
+
+    with pytest.raises(ValueError):
+        battery_stats.linear_fit([1], [1])
+    with pytest.raises(ValueError):
+        battery_stats.linear_fit([1, 1], [1, 2])
+
+
+def test_discharge_per_wake():
+    hour = 3600
+    charge = Column()
+    on_battery = Column()
+    for i, (level, battery) in enumerate([(80, True), (79, True), (77, True), (78, False),
+                                          (90, False), (90, True), (89, True)]):
+        charge.append(i * hour, level)
+        on_battery.append(i * hour + 1, 1.0 if battery else 0.0)
+
+    # 80->79, 79->77, 90->89. The charging in between doesn't count
+    assert battery_stats.discharge_per_wake(charge, on_battery) == (4 / 3, 3)
+
+    # Without a power source logged near a reading, it isn't known to be on battery
+    assert battery_stats.discharge_per_wake(charge, Column()) == (None, 0)
+
+
+def test_analyze():
+    day = 24 * 3600
+    charge = Column()
+    on_battery = Column()
+    wake = Column()
+    for i in range(10):
+        charge.append(i * day, 100 - 2 * i)
+        on_battery.append(i * day + 1, 1.0)
+        wake.append(i * day, 1.0)
+    columns = {name: Column() for name in battery_stats.COLUMNS}
+    columns.update(charge=charge, on_battery=on_battery, wake=wake)
+
+    result = battery_stats.analyze(columns, now=10 * day, prediction_days=10)
+    assert result['fit']['per_day'] == pytest.approx(-2)
+    assert result['fit']['empty_time'] == pytest.approx(50 * day)
+    assert result['discharge_per_wake'] == 2.0
+    assert result['wake_pairs'] == 9
+    assert result['wakes_per_day'] == 1.0
+    assert result['latest']['charge'] == (9 * day, 82)
@@ -0,0 +1,159 @@
+import os
+import sys
+import json
+import time
+import socket
+import tempfile
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from bench_wake import Bench, FakeDisplay, FakePiJuice, RenderServer, import_main, make_fixture
+
+
+def run_wakes(charges, on_battery=True, not_ready=0):
+    main = import_main()
+    dims = (main.DISPLAY_WIDTH, main.DISPLAY_HEIGHT)
+    pj = FakePiJuice(on_battery=on_battery, call_secs=0)
+    server = RenderServer([make_fixture(dims)], latency=0, bytes_per_sec=None)
+    display = FakeDisplay(main.BINARY_PATH, dims, bytes_per_sec=None, full_secs=0.05,
+                          partial_secs=0.01, clear_secs=0.05)
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            bench = Bench(workdir, pj, server, display, boot_secs=20)
+            for charge in charges:
+                pj.charge_level = charge
+                pj.not_ready = not_ready
+                results.append(bench.run_wake())
+    finally:
+        server.close()
+    return results, server, display
+
+
+def test_wakes_on_battery():
+    results, server, display = run_wakes([80, 79], not_ready=2)
+    assert server.image_requests == 2
+    first, second = results
+
+    assert first['error'] is None and first['shutdown']
+    # The image was streamed, then the display cleared and refreshed
+    assert [kind for _, kind in display.refreshes[:2]] == ['clear', 'full']
+    assert 20 < first['display'] <= first['awake']
+    assert first['phases']['boot'] == 20
+    assert 'stream_image' in first['phases']
+    assert first['i2c_calls'] > 2
+
+    # Same image, not downloaded again, only the status bar changed
+    assert second['shutdown']
+    assert server.not_modified == 1
+    assert 'stream_image' not in second['phases']
+    assert [kind for _, kind in display.refreshes[2:]] == ['partial']
+
+
+def test_wake_on_cable():
+    results, _, _ = run_wakes([80], on_battery=False)
+    assert results[0]['error'] is None
+    assert not results[0]['shutdown']
+    assert results[0]['display'] is not None
+
+
+class SilentServer:
+    '''
+    A render server that accepts connections but never answers
+    '''
+
+    def __init__(self):
+        self.socket = socket.socket()
+        self.socket.bind(('127.0.0.1', 0))
+        self.socket.listen(16)
+        self.url = 'http://127.0.0.1:{}/'.format(self.socket.getsockname()[1])
+
+    def close(self):
+        self.socket.close()
+
+
+def test_offline_fallback():
+    main = import_main()
+    dims = (main.DISPLAY_WIDTH, main.DISPLAY_HEIGHT)
+    pj = FakePiJuice(call_secs=0)
+    server = RenderServer([make_fixture(dims)], latency=0, bytes_per_sec=None)
+    silent = SilentServer()
+    display = FakeDisplay(main.BINARY_PATH, dims, bytes_per_sec=None, full_secs=0.05,
+                          partial_secs=0.01, clear_secs=0.05)
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            bench = Bench(workdir, pj, server, display, boot_secs=20)
+            assert bench.run_wake()['error'] is None
+            last_frame_path = os.path.join(workdir, 'last-frame.png')
+            last_frame = Image.open(last_frame_path).convert('L')
+            mtime = os.path.getmtime(last_frame_path)
+
+            # Leave about 3s for waiting for the network
+            bench.server = silent
+            bench.boot_secs = (main.WAKE_BUDGET_SECS - main.SHUTDOWN_RESERVE_SECS
+                               - main.FULL_REFRESH_SECS - main.FETCH_OVERRUN_SECS - 3)
+            refreshes = len(display.refreshes)
+            result = bench.run_wake()
+
+            assert result['error'] is None and result['shutdown']
+            assert result['awake'] < main.WAKE_BUDGET_SECS - main.SHUTDOWN_RESERVE_SECS
+            assert 2 < result['phases']['wait_internet'] < 5
+            # The previous image is still on the display, only the status bar is drawn
+            x, y, w, h = main.overlay.STATUS_BAR_BOX
+            bar, xy = main.overlay.place(Image.new('L', (w, h)), (x, y), dims[0],
+                                         main.DISPLAY_MIRRORED)
+            assert [kind for _, kind in display.refreshes[refreshes:]] == ['partial']
+            assert display.areas[refreshes:] == [xy + (w, h)]
+            assert os.path.getmtime(last_frame_path) == mtime
+            with open(os.path.join(workdir, 'last-frame.json')) as f:
+                assert json.load(f)['status'].startswith('Offline')
+
+            # Something else was drawn over it, the previous image is shown again
+            with bench.stand_ins():
+                main.mark_last_frame_off_screen()
+            refreshes = len(display.refreshes)
+            result = bench.run_wake()
+            assert result['error'] is None
+            assert result['awake'] < main.WAKE_BUDGET_SECS - main.SHUTDOWN_RESERVE_SECS
+            assert [kind for _, kind in display.refreshes[refreshes:]] == ['clear', 'full']
+            # Outside of the status bar, it's the previous image
+            shown = Image.open(os.path.join(workdir, 'display.png')).convert('L')
+            box = (xy[0], xy[1], xy[0] + w, xy[1] + h)
+            assert shown.crop(box).tobytes() != last_frame.crop(box).tobytes()
+            shown.paste(last_frame.crop(box), box)
+            assert shown.tobytes() == last_frame.tobytes()
+    finally:
+        server.close()
+        silent.close()
+
+
+def test_stream_deadline():
+    main = import_main()
+    dims = (main.DISPLAY_WIDTH, main.DISPLAY_HEIGHT)
+    display = FakeDisplay(main.BINARY_PATH, dims, bytes_per_sec=None)
+    png = make_fixture(dims)
+
+    class SlowResponse:
+        # A slow network gives smaller chunks than asked for
+        def iter_content(self, chunk_size):
+            for i in range(0, len(png), 1024):
+                time.sleep(0.05)
+                yield png[i:i + 1024]
+
+    silent = SilentServer()
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            bench = Bench(workdir, FakePiJuice(call_secs=0), silent, display)
+            with bench.stand_ins():
+                with pytest.raises(Exception, match='Out of time'):
+                    main.stream_frame(SlowResponse(), 'Updated 06:00  80%', 80,
+                                      deadline=time.monotonic() + 0.2)
+                # Not even started
+                with pytest.raises(Exception, match='Out of time'):
+                    main.stream_frame(SlowResponse(), 'Updated 06:00  80%', 80,
+                                      deadline=time.monotonic() - 1)
+    finally:
+        silent.close()
+    assert display.refreshes == []
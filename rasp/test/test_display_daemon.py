@@ -0,0 +1,153 @@
+import os
+import sys
+import socket
+import threading
+
+import pytest
+from PIL import Image, ImageOps
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('IT8951')
+from IT8951.constants import PowerStates
+from IT8951.emulator import EmulatedSPI
+from IT8951.interface import EPD
+
+import display_client
+import display_daemon
+
+DIMS = (64, 32)
+RASP_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+
+def panel_image(server):
+    return Image.frombytes('L', DIMS, bytes(server.display.epd.spi.panel))
+
+
+def quantized(img):
+    '''
+    What the panel shows for img, after the 4bpp transfer
+    '''
+    return img.point(lambda x: x & 0xF0)
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    '''
+    display_daemon.py listening on a socket in tmp_path, on an emulated display
+    '''
+    socket_path = str(tmp_path / 'display.sock')
+    monkeypatch.setattr(display_client, 'SOCKET_PATH', socket_path)
+    # The screens are relative to rasp/
+    monkeypatch.chdir(RASP_DIR)
+
+    spi = EmulatedSPI(width=DIMS[0], height=DIMS[1], img_buf_address=0x1000, frames=8)
+    display = display_daemon.open_display(None, PowerStates.STANDBY, epd=EPD(vcom=-2.0, spi=spi))
+    server = display_daemon.DisplayServer(socket_path, display)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def test_image(daemon, tmp_path):
+    path = str(tmp_path / 'image.png')
+    img = Image.new('L', DIMS, 0xFF)
+    img.paste(0x00, (8, 8, 24, 16))
+    img.save(path)
+
+    assert display_client.send_image(path) == {'ok': True}
+    assert panel_image(daemon).tobytes() == quantized(img).tobytes()
+
+    # Fitted to the display
+    Image.new('L', (DIMS[0] * 2, DIMS[1] * 2), 0x00).save(path)
+    display_client.send_image(path, fit=True)
+    assert set(panel_image(daemon).getdata()) == {0x00}
+
+
+def test_update_and_clear(daemon):
+    display_client.send_update(bytes([0x00] * 16 * 8), (16, 8), (16, 8))
+    panel = panel_image(daemon)
+    assert panel.crop((16, 8, 32, 16)).getextrema() == (0x00, 0x00)
+    assert panel.crop((0, 0, 16, 8)).getextrema() == (0xF0, 0xF0)
+
+    display_client.clear()
+    assert panel_image(daemon).getextrema() == (0xF0, 0xF0)
+
+
+def test_preloaded_screens(daemon):
+    assert set(daemon.display.preloaded) == set(display_client.SCREENS)
+
+    # Shown from device memory, without sending the image
+    written = []
+    spi = daemon.display.epd.spi
+    pack_and_write_pixels = spi.pack_and_write_pixels
+    spi.pack_and_write_pixels = lambda *args, **kwargs: written.append(args)
+    try:
+        display_client.show_screen('error')
+    finally:
+        spi.pack_and_write_pixels = pack_and_write_pixels
+    assert written == []
+
+    img = Image.open(os.path.join(RASP_DIR, display_client.SCREENS['error']))
+    expected = ImageOps.fit(display_daemon.to_grayscale(img), DIMS)
+    assert panel_image(daemon).tobytes() == quantized(expected).tobytes()
+
+
+def test_error_responses(daemon):
+    with pytest.raises(Exception, match='Unknown command: nope'):
+        display_client.request({'cmd': 'nope'})
+    with pytest.raises(Exception, match='Display daemon error'):
+        display_client.show_screen('no-such-screen')
+
+    # Not JSON
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(display_client.SOCKET_PATH)
+        s.sendall(b'hello\n')
+        with s.makefile('rb') as f:
+            assert b'"ok": false' in f.readline()
+
+    # The daemon still works
+    display_client.clear()
+
+
+def test_metrics(daemon):
+    for _ in range(3):
+        display_client.clear()
+    with pytest.raises(Exception):
+        display_client.request({'cmd': 'nope'})
+
+    metrics = display_client.get_metrics()
+    assert metrics['clear']['count'] == 3
+    assert metrics['nope']['count'] == 1
+    assert 0 <= metrics['clear']['p50_ms'] <= metrics['clear']['p90_ms'] <= metrics['clear']['max_ms']
+    assert set(metrics['clear']) == {'count', 'p50_ms', 'p90_ms', 'max_ms'}
+
+    # This request is recorded after its response
+    assert 'metrics' not in metrics
+    assert display_client.get_metrics()['metrics']['count'] == 1
+
+
+def test_power_stats(daemon):
+    display_client.clear()
+    stats = display_client.get_power_stats()
+    assert stats.keys() == daemon.display.epd.power.stats().keys()
+    assert stats['state'] == 'run'
+
+
+def test_is_daemon_running(daemon, tmp_path):
+    assert display_client.is_daemon_running()
+    # Probing isn't a request
+    assert display_client.is_daemon_running()
+    assert 'None' not in display_client.get_metrics()
+
+    assert not display_client.is_daemon_running(str(tmp_path / 'missing.sock'))
+
+    # Left behind by a daemon that was killed
+    stale_path = str(tmp_path / 'stale.sock')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.bind(stale_path)
+    assert os.path.exists(stale_path)
+    assert not display_client.is_daemon_running(stale_path)
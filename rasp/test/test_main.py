@@ -0,0 +1,50 @@
+import os
+import sys
+import threading
+from contextlib import ExitStack
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from stand_ins import FakePiJuice, import_main
+
+main = import_main()
+
+
+def patch_all(stack, patches):
+    for obj, name, value in patches:
+        stack.enter_context(mock.patch.object(obj, name, value))
+
+
+def test_watchdog_shutdown_completes():
+    pj = FakePiJuice()
+    shutting_down = threading.Event()
+
+    def slow_main(pj, budget, status_only=False):
+        # Still running when the watchdog fires, and returns while it shuts down
+        assert shutting_down.wait(5)
+
+    def is_ssh_active():
+        shutting_down.set()
+        return False
+
+    system = mock.Mock()
+    with ExitStack() as stack:
+        patch_all(stack, [
+            # The wake starts 0.2s before the watchdog is due
+            (main.run_budget, 'get_uptime',
+             lambda: main.WAKE_BUDGET_SECS - main.SHUTDOWN_RESERVE_SECS - 0.2),
+            (main.spans, '_recorder', main.spans.NullRecorder()),
+            (main.spans, 'record_boot', lambda uptime: None),
+            (main, 'get_pijuice', lambda deadline: pj),
+            (main, 'enable_wakeups', lambda pj: None),
+            (main, 'main', slow_main),
+            (main, 'is_ssh_active', is_ssh_active),
+            (main, 'SHUTDOWN_FLUSH_SECS', 0.5),
+            (main.display_client, 'is_daemon_running', lambda *args: False),
+            (main.logging, 'shutdown', lambda: None),
+            (main.os, 'system', system),
+        ])
+        main.main_wrapper([])
+
+    assert pj.calls[-2:] == ['SetSystemPowerSwitch', 'SetPowerOff']
+    system.assert_called_once_with('sudo shutdown -h now')
@@ -0,0 +1,145 @@
+import os
+import sys
+import json
+import time
+import types
+from datetime import datetime
+
+import pytest
+from PIL import Image, ImageOps
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import overlay
+
+# main.py needs these only on the Pi
+sys.modules.setdefault('config', types.SimpleNamespace(config={}))
+sys.modules.setdefault('pijuice', types.SimpleNamespace(PiJuice=None))
+import main as main_module
+from stand_ins import FakePiJuice
+
+NOW = time.time()
+
+
+def status_text(charge_level):
+    '''
+    The status text of an image updated at NOW, on battery
+    '''
+    return overlay.status_text(datetime.fromtimestamp(NOW), charge_level, False)
+
+
+def test_place():
+    img = Image.new('L', (4, 2), 0xFF)
+    img.putpixel((0, 0), 0x00)
+
+    placed, xy = overlay.place(img, (10, 5), 100, mirror=False)
+    assert placed is img and xy == (10, 5)
+
+    placed, xy = overlay.place(img, (10, 5), 100, mirror=True)
+    assert xy == (100 - 10 - 4, 5)
+    assert placed.getpixel((3, 0)) == 0x00 and placed.getpixel((0, 0)) == 0xFF
+
+
+def test_status_bar_is_black_and_white():
+    _, _, width, height = overlay.STATUS_BAR_BOX
+    for charge_level in (None, 0, 3, 50, 100, 120):
+        text = overlay.status_text(datetime(2023, 1, 9, 18, 5), charge_level, True, offline=True)
+        bar = overlay.status_bar(text, charge_level)
+        assert bar.mode == 'L' and bar.size == (width, height)
+        assert set(bar.getdata()) == {0x00, 0xFF}
+
+
+def test_status_text():
+    now = datetime(2023, 1, 10, 9, 30)
+    assert overlay.status_text(datetime(2023, 1, 10, 6, 5), 80, False, now=now) == 'Updated 06:05  80%'
+    assert overlay.status_text(datetime(2023, 1, 9, 21, 0), 80, True, now=now) == 'Updated 09.01. 21:00  80% +'
+    assert overlay.status_text(datetime(2023, 1, 10, 6, 5), None, False, offline=True, now=now) == \
+        'Offline, updated 06:05'
+
+
+@pytest.fixture
+def main(tmp_path, monkeypatch):
+    '''
+    main.py with the last frame in tmp_path, noting what would be displayed
+    '''
+    monkeypatch.setattr(main_module, 'LAST_FRAME_PATH', str(tmp_path / 'last-frame.png'))
+    monkeypatch.setattr(main_module, 'LAST_FRAME_STATE_PATH', str(tmp_path / 'last-frame.json'))
+    monkeypatch.setattr(main_module.time, 'time', lambda: NOW)
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(main_module, 'drawn', [], raising=False)
+    monkeypatch.setattr(main_module, 'display_region', lambda img, xy, mode=2: main_module.drawn.append(
+        ('region', img, xy, mode)))
+    monkeypatch.setattr(main_module, 'display_render_image', lambda path: main_module.drawn.append(
+        ('full', Image.open(path).convert('L'))))
+    return main_module
+
+
+def make_budget(main):
+    return main.run_budget.RunBudget(main.WAKE_BUDGET_SECS, main.SHUTDOWN_RESERVE_SECS)
+
+
+def test_status_bar_placement(main):
+    x, y, width, height = overlay.STATUS_BAR_BOX
+    main.display_status_bar('Updated 09:30  80%', 80)
+
+    [(kind, img, xy, mode)] = main.drawn
+    assert kind == 'region' and mode == main.STATUS_BAR_MODE
+    assert main.DISPLAY_MIRRORED
+    assert xy == (main.DISPLAY_WIDTH - x - width, y)
+    assert img.tobytes() == ImageOps.mirror(overlay.status_bar('Updated 09:30  80%', 80)).tobytes()
+
+
+def test_display_frame_unchanged_image(main):
+    frame = Image.new('L', (main.DISPLAY_WIDTH, main.DISPLAY_HEIGHT), 0xFF)
+    budget = make_budget(main)
+
+    main.display_frame(frame, 'a', 80, True, budget)
+    assert [d[0] for d in main.drawn] == ['full']
+    state = main.load_last_frame_state()
+    assert state['image_hash'] == 'a' and state['status'] == status_text(80)
+
+    # Same image and status, nothing to draw
+    main.drawn.clear()
+    main.display_frame(frame, 'a', 80, True, budget)
+    assert main.drawn == []
+
+    # Same image, only the status bar changed
+    main.display_frame(frame, 'a', 79, True, budget)
+    [(kind, img, xy, mode)] = main.drawn
+    assert kind == 'region' and mode == main.STATUS_BAR_MODE
+    assert img.size == overlay.STATUS_BAR_BOX[2:]
+    assert main.load_last_frame_state()['status'] == status_text(79)
+
+    # Unless something else was drawn over it
+    main.drawn.clear()
+    main.mark_last_frame_off_screen()
+    main.display_frame(frame, 'a', 79, True, budget)
+    assert [d[0] for d in main.drawn] == ['full']
+
+    # The render API said it's the last frame, which is read from the file
+    main.drawn.clear()
+    main.mark_last_frame_off_screen()
+    main.display_frame(None, 'a', 79, True, budget)
+    [(kind, img)] = main.drawn
+    assert kind == 'full' and img.size == frame.size
+
+
+def test_update_status_bar(main):
+    main.save_last_frame_state({
+        'updated_at': NOW,
+        'on_screen': True,
+        'image_hash': 'a',
+        'status': status_text(80),
+    })
+    pj = FakePiJuice(charge_level=80)
+    main.power_status.start(pj)
+
+    main.update_status_bar(pj)
+    assert main.drawn == []
+
+    pj.charge_level = 79
+    main.power_status.start(pj)
+    main.update_status_bar(pj)
+    assert [d[0] for d in main.drawn] == ['region']
+    with open(main.LAST_FRAME_STATE_PATH) as f:
+        assert json.load(f)['status'] == status_text(79)
@@ -0,0 +1,107 @@
+import io
+import os
+import sys
+from random import Random
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import png_stream
+
+
+def make_png(mode, size, seed=0):
+    rng = Random(seed)
+    # noisy rows, so that the encoder picks filters that refer to the row above
+    img = Image.frombytes('L', size, bytes(rng.randrange(256) for _ in range(size[0]*size[1])))
+    if mode == 'P':
+        img = img.convert('RGB').quantize(200)
+    else:
+        img = img.convert(mode)
+    buf = io.BytesIO()
+    img.save(buf, 'PNG', optimize=True)
+    return buf.getvalue()
+
+
+def split(data, n):
+    return [data[i:i + n] for i in range(0, len(data), n)]
+
+
+def assemble(data, band_rows):
+    expected = Image.open(io.BytesIO(data))
+    out = Image.new(expected.mode, expected.size)
+    y_next = 0
+    for y, band in png_stream.iter_bands(split(data, 100), band_rows):
+        assert y == y_next
+        assert band.mode == expected.mode
+        assert band.width == expected.width
+        assert band.height == min(band_rows, expected.height - y)
+        out.paste(band, (0, y))
+        y_next += band.height
+    assert y_next == expected.height
+    return out, expected
+
+
+def test_matches_pillow():
+    for mode in ('L', 'LA', 'RGB', 'RGBA', 'P'):
+        for height in (1, 63, 64, 130):
+            data = make_png(mode, (37, height))
+            for band_rows in (1, 7, 64):
+                out, expected = assemble(data, band_rows)
+                assert out.tobytes() == expected.tobytes(), (mode, height, band_rows)
+
+
+def test_bands_before_download_ends():
+    data = make_png('L', (50, 200))
+    chunks = split(data, 100)
+    received = []
+
+    def iter_chunks():
+        for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+
+    bands = png_stream.iter_bands(iter_chunks(), 16)
+    next(bands)
+    assert len(received) < len(chunks)
+
+
+def test_truncated():
+    data = make_png('L', (50, 200))
+    try:
+        list(png_stream.iter_bands(split(data[:len(data)//2], 100)))
+    except ValueError:
+        pass
+    else:
+        assert False, 'expected a ValueError'
+
+
+def test_not_a_png():
+    try:
+        list(png_stream.iter_bands([b'GIF89a' + bytes(100)]))
+    except ValueError:
+        pass
+    else:
+        assert False, 'expected a ValueError'
+
+
+def test_png_writer():
+    expected = Image.open(io.BytesIO(make_png('L', (50, 200)))).convert('L')
+    buf = io.BytesIO()
+    png = png_stream.PngWriter(buf, 50, 200)
+    for y in range(0, 200, 64):
+        png.write(expected.crop((0, y, 50, min(y + 64, 200))))
+    png.close()
+
+    written = Image.open(io.BytesIO(buf.getvalue()))
+    assert written.mode == 'L' and written.size == (50, 200)
+    assert written.tobytes() == expected.tobytes()
+
+
+def test_png_writer_incomplete():
+    png = png_stream.PngWriter(io.BytesIO(), 50, 200)
+    png.write(Image.new('L', (50, 100)))
+    try:
+        png.close()
+    except ValueError:
+        pass
+    else:
+        assert False, 'expected a ValueError'
@@ -0,0 +1,58 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import power_status
+from power_status import PowerStatus
+from stand_ins import FakePiJuice
+from fakes import FakeClock
+
+
+def test_snapshot_is_cached():
+    pj = FakePiJuice(charge_level=50, call_secs=0)
+    clock = FakeClock()
+    power = PowerStatus(pj, ttl=30, clock=clock)
+
+    snapshot = power.snapshot()
+    assert snapshot['charge_level']['data'] == 50
+    assert sorted(pj.calls) == sorted(['GetStatus', 'GetChargeLevel', 'GetBatteryVoltage',
+                                       'GetBatteryTemperature', 'GetBatteryCurrent'])
+
+    pj.calls.clear()
+    pj.charge_level = 49
+    assert power.charge_level() == 50
+    assert power.on_battery()
+    assert pj.calls == []
+
+    # only what is too old is read again
+    clock.now += 10
+    pj.on_battery = False
+    assert not power.on_battery(max_age=0)
+    assert pj.calls == ['GetStatus']
+
+    clock.now += 25
+    pj.calls.clear()
+    snapshot = power.snapshot()
+    assert snapshot['charge_level']['data'] == 49
+    assert 'GetStatus' not in pj.calls and len(pj.calls) == 4
+
+
+def test_errors_are_not_cached():
+    pj = FakePiJuice(call_secs=0, not_ready=1)
+    power = PowerStatus(pj, clock=FakeClock())
+    assert power.get('status')['error'] == 'COMMUNICATION_ERROR'
+    assert power.on_battery()
+    assert pj.calls == ['GetStatus', 'GetStatus']
+
+
+def test_shared_per_wake():
+    pj = FakePiJuice(call_secs=0)
+    status = pj.status.GetStatus()
+    shared = power_status.start(pj, status)
+    assert power_status.get(pj) is shared
+    assert shared.on_battery()
+    assert pj.calls == ['GetStatus']
+
+    # a new wake starts over
+    assert power_status.start(pj) is not shared
+    assert power_status.get(FakePiJuice()) is not shared
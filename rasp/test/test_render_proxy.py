@@ -0,0 +1,224 @@
+import io
+import os
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PIL import Image
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from render_proxy import RenderCache, ProxyServer, UpstreamError, canonicalize, fetch_upstream
+import tile_delta
+
+PARAMS = [('lat', '60.2'), ('lon', '24.90'), ('batteryLevel', '80'), ('flop', 'true')]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class StubUpstream:
+    '''
+    Stands in for the render API: responds with the query string as the image
+    '''
+
+    def __init__(self, delay=0):
+        self.calls = []
+        self.delay = delay
+
+    def __call__(self, params):
+        self.calls.append(params)
+        time.sleep(self.delay)
+        return '&'.join('{}={}'.format(*p) for p in params).encode('utf-8'), 'image/png'
+
+
+def test_canonicalize():
+    assert canonicalize(PARAMS) == canonicalize([
+        ('flop', 'true'), ('batteryLevel', '80.0'), ('lon', '24.9'), ('lat', '60.20'), ('width', ''),
+    ])
+    assert canonicalize([('flop', 'true')]) != canonicalize([('flop', 'false')])
+
+
+def test_cache_ttl():
+    upstream = StubUpstream()
+    clock = Clock()
+    cache = RenderCache(upstream, ttl=60, clock=clock)
+
+    first = cache.get(PARAMS)
+    assert cache.get(list(reversed(PARAMS))) is first
+    assert len(upstream.calls) == 1
+
+    clock.now = 61
+    cache.get(PARAMS)
+    assert len(upstream.calls) == 2
+
+
+def test_cache_lru():
+    upstream = StubUpstream()
+    cache = RenderCache(upstream, max_entries=2)
+
+    cache.get([('lat', '1')])
+    cache.get([('lat', '2')])
+    cache.get([('lat', '1')])
+    cache.get([('lat', '3')])
+    assert len(upstream.calls) == 3
+
+    # lat=2 was the least recently used
+    cache.get([('lat', '1')])
+    assert len(upstream.calls) == 3
+    cache.get([('lat', '2')])
+    assert len(upstream.calls) == 4
+
+
+def test_concurrent_requests_are_deduplicated():
+    upstream = StubUpstream(delay=0.2)
+    cache = RenderCache(upstream)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(PARAMS))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(upstream.calls) == 1
+    assert len(results) == 5 and all(r is results[0] for r in results)
+
+
+def test_errors_are_not_cached():
+    calls = []
+
+    def failing(params):
+        calls.append(params)
+        raise UpstreamError(500, b'render failed')
+
+    cache = RenderCache(failing)
+    for _ in range(2):
+        try:
+            cache.get(PARAMS)
+        except UpstreamError as e:
+            assert e.status == 500
+        else:
+            assert False, 'expected an error'
+    assert len(calls) == 2
+
+
+class UpstreamHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.calls += 1
+        body = b'png of ' + self.path.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return 'http://127.0.0.1:{}/render'.format(server.server_address[1])
+
+
+def test_proxy_conditional_requests():
+    upstream = ThreadingHTTPServer(('127.0.0.1', 0), UpstreamHandler)
+    upstream.calls = 0
+    proxy = ProxyServer(('127.0.0.1', 0), serve(upstream))
+    proxy_url = serve(proxy)
+
+    try:
+        res = requests.get(proxy_url, params=PARAMS)
+        assert res.status_code == 200
+        assert res.content.startswith(b'png of ')
+        etag = res.headers['ETag']
+
+        res = requests.get(proxy_url, params=PARAMS, headers={'If-None-Match': etag})
+        assert res.status_code == 304
+        assert res.content == b''
+        assert upstream.calls == 1
+
+        assert requests.get(proxy_url, params={'ping': 'true'}).status_code == 200
+    finally:
+        proxy.shutdown()
+        upstream.shutdown()
+
+
+class PngUpstreamHandler(BaseHTTPRequestHandler):
+    '''
+    Serves a white image with a black square that moves with server.version
+    '''
+
+    def do_GET(self):
+        img = Image.new('L', (256, 128), 0xFF)
+        x = self.server.version * 64
+        img.paste(0x00, (x, 0, x + 16, 16))
+        buf = io.BytesIO()
+        img.save(buf, 'PNG')
+        body = buf.getvalue()
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_proxy_tile_delta():
+    upstream = ThreadingHTTPServer(('127.0.0.1', 0), PngUpstreamHandler)
+    upstream.version = 0
+    upstream_url = serve(upstream)
+    # no caching, so that each request renders upstream.version
+    cache = RenderCache(lambda params: fetch_upstream(upstream_url, params), ttl=0)
+    proxy = ProxyServer(('127.0.0.1', 0), upstream_url, cache)
+    proxy_url = serve(proxy)
+
+    try:
+        # no frame yet, the full image is sent
+        res = requests.get(proxy_url, params=PARAMS + [('baseHash', '')])
+        assert res.headers['Content-Type'] == 'image/png'
+        frame = tile_delta.quantize(Image.open(io.BytesIO(res.content)).convert('L'))
+        assert res.headers['X-Frame-Hash'] == tile_delta.frame_hash(frame)
+
+        # the display already has it, which the headers tell before the body
+        res = requests.get(proxy_url, params=PARAMS + [('baseHash', tile_delta.frame_hash(frame))])
+        assert res.headers['X-Frame-Hash'] == tile_delta.frame_hash(frame)
+
+        upstream.version = 1
+        res = requests.get(proxy_url, params=PARAMS + [('baseHash', tile_delta.frame_hash(frame))])
+        assert res.headers['Content-Type'] == tile_delta.CONTENT_TYPE
+        _, _, frame_hash, tiles = tile_delta.decode_delta(res.content)
+        assert [box for box, _ in tiles] == [(0, 0, 64, 64), (64, 0, 128, 64)]
+
+        tile_delta.apply_delta(frame, tiles)
+        assert tile_delta.frame_hash(frame) == frame_hash
+
+        # an unknown frame gets the full image
+        res = requests.get(proxy_url, params=PARAMS + [('baseHash', 'unknown')])
+        assert res.headers['Content-Type'] == 'image/png'
+    finally:
+        proxy.shutdown()
+        upstream.shutdown()
+
+
+def main():
+    test_canonicalize()
+    test_cache_ttl()
+    test_cache_lru()
+    test_concurrent_requests_are_deduplicated()
+    test_errors_are_not_cached()
+    test_proxy_conditional_requests()
+    test_proxy_tile_delta()
+    print('All tests passed')
+
+
+if __name__ == '__main__':
+    main()
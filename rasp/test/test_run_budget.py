@@ -0,0 +1,42 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from run_budget import RunBudget
+from fakes import FakeClock
+
+
+def test_phase_deadlines():
+    clock = FakeClock()
+    # 30s of the wake went to booting
+    budget = RunBudget(240, 15, elapsed_secs=30, clock=clock)
+    assert budget.left() == 195
+
+    assert budget.phase_deadline('get_pijuice', 30) == 1030
+    clock.now += 10
+    # capped by max_secs, or by what must be left for later phases
+    assert budget.phase_deadline('fetch_image', 120, keep_secs=20) == 1130
+    clock.now += 100
+    assert budget.phase_deadline('fetch_image', 120, keep_secs=20) == 1175
+
+    assert budget.allows('full refresh', 20)
+    clock.now += 70
+    assert not budget.allows('full refresh', 20)
+    assert budget.allows('status bar', 5)
+    # out of time, phases get nothing
+    clock.now += 100
+    assert budget.phase_deadline('fetch_image', 120) == clock.now
+
+
+def test_watchdog():
+    called = threading.Event()
+    budget = RunBudget(0.2, 0.1)
+    budget.start_watchdog('shutdown', called.set)
+    assert called.wait(5)
+
+    called.clear()
+    budget = RunBudget(0.2, 0.1)
+    budget.start_watchdog('shutdown', called.set)
+    budget.cancel_watchdog()
+    assert not called.wait(0.3)
@@ -0,0 +1,136 @@
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import scheduler
+
+
+def make_history(changes, charge=80, on_battery=True):
+    '''
+    changes is {local_hour: [changed, ...]}, oldest first
+    '''
+    history = []
+    for local_hour, changed in changes.items():
+        for c in changed:
+            history.append({
+                'local_hour': local_hour,
+                'charge': charge,
+                'on_battery': on_battery,
+                'image_hash': 'x',
+                'changed': c,
+            })
+    return history
+
+
+def test_wakes_per_day():
+    assert scheduler.wakes_per_day(100) == 6
+    assert scheduler.wakes_per_day(50) == 6
+    assert scheduler.wakes_per_day(49) == 4
+    assert scheduler.wakes_per_day(30) == 4
+    assert scheduler.wakes_per_day(29) == 3
+    assert scheduler.wakes_per_day(15) == 3
+    assert scheduler.wakes_per_day(14) == 2
+    assert scheduler.wakes_per_day(0) == 2
+
+
+def test_default_hours():
+    assert scheduler.compute_wakeup_hours([]) == scheduler.DEFAULT_LOCAL_HOURS
+    # On cable the battery doesn't matter
+    history = make_history({9: [False] * 5}, charge=5, on_battery=False)
+    assert scheduler.compute_wakeup_hours(history) == scheduler.DEFAULT_LOCAL_HOURS
+
+
+def test_morning_is_always_kept():
+    # The morning image never changes, every other hour always does
+    changes = {h: [True] * 5 for h in scheduler.DEFAULT_LOCAL_HOURS}
+    changes[scheduler.MORNING_LOCAL_HOUR] = [False] * 5
+    for charge in (100, 40, 20, 5):
+        hours = scheduler.compute_wakeup_hours(make_history(changes, charge=charge))
+        assert scheduler.MORNING_LOCAL_HOUR in hours
+        assert len(hours) == scheduler.wakes_per_day(charge)
+        assert hours == sorted(hours)
+
+
+def test_hours_by_change_rate():
+    history = make_history({
+        9: [False] * 5,
+        12: [True, False, False, False],
+        15: [True] * 4,
+        18: [False, True, True],
+        21: [False] * 4,
+    }, charge=20)
+    # 3 wakes: the morning and the two hours that changed most often
+    assert scheduler.compute_wakeup_hours(history) == [6, 15, 18]
+
+    history[-1]['charge'] = 10
+    assert scheduler.compute_wakeup_hours(history) == [6, 15]
+
+
+def test_change_rate():
+    history = make_history({9: [True, False]})
+    # Too few samples to go by
+    assert scheduler.change_rate(history, 9) == 1.0
+    assert scheduler.change_rate(history, 12) == 1.0
+
+    # Only the most recent wakes count
+    history = make_history({9: [True] * 10 + [False] * scheduler.RECENT_WAKES_PER_HOUR})
+    assert scheduler.change_rate(history, 9) == 0.0
+    history = make_history({9: [True, False, None, False, None]})
+    assert scheduler.change_rate(history, 9) == 1 / 3
+
+
+def test_record_wake():
+    history = []
+    assert scheduler.record_wake(history, 6, 80, True, 'a') is None
+    assert scheduler.record_wake(history, 9, 79, True, 'a') is False
+    assert scheduler.record_wake(history, 15, 78, True, 'b') is True
+    assert [w['changed'] for w in history] == [None, False, True]
+    assert history[-1]['local_hour'] == 15 and history[-1]['charge'] == 78
+
+
+def test_history_round_trip(tmp_path):
+    path = str(tmp_path / 'wake-history.json')
+    assert scheduler.load_history(path) == []
+
+    history = make_history({h: [True, False] for h in range(24)})
+    history += make_history({9: [True] * scheduler.MAX_HISTORY_LENGTH})
+    scheduler.save_history(history, path)
+    loaded = scheduler.load_history(path)
+    assert loaded == history[-scheduler.MAX_HISTORY_LENGTH:]
+    assert not os.path.exists(path + '.tmp')
+
+    with open(path, 'w') as f:
+        f.write('{"trunc')
+    assert scheduler.load_history(path) == []
+
+
+def test_to_local_time():
+    assert scheduler.to_local_time(datetime(2023, 7, 10, 6), 'Europe/Helsinki') == datetime(2023, 7, 10, 6)
+    # Helsinki is UTC+2 in the winter and UTC+3 in the summer
+    assert scheduler.to_local_time(datetime(2023, 1, 10, 4), 'UTC') == datetime(2023, 1, 10, 6)
+    assert scheduler.to_local_time(datetime(2023, 7, 9, 22), 'UTC') == datetime(2023, 7, 10, 1)
+
+
+def make_wakes(times):
+    # A new image on every wake
+    return [{
+        'time': t,
+        'charge': 90 - i,
+        'on_battery': True,
+        'image_hash': str(i),
+    } for i, t in enumerate(times)]
+
+
+def test_simulate_across_dst():
+    # Logged every day at 6 local time, DST starts on 26 March
+    days = range(24, 29)
+    local = make_wakes([datetime(2023, 3, day, 6) for day in days])
+    utc = make_wakes([datetime(2023, 3, day, 4 if day < 26 else 3) for day in days])
+
+    for wakes, log_timezone in ((local, 'Europe/Helsinki'), (utc, 'UTC')):
+        results = scheduler.simulate(wakes, log_timezone=log_timezone)
+        # Every hour of every day is after a logged wake, up to 6 on the last day
+        assert results['fixed']['wakes'] == 4 * 6 + 1
+        assert results['fixed']['useful_updates'] == 5
+        assert results['cost_per_wake'] == 1.0
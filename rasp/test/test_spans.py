@@ -0,0 +1,135 @@
+import os
+import sys
+import struct
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import spans
+from spans import SpanRecorder, NullRecorder
+
+
+@pytest.fixture
+def no_recorder(monkeypatch):
+    monkeypatch.setattr(spans, '_recorder', None)
+
+
+def test_record_and_read(tmp_path):
+    recorder = SpanRecorder(str(tmp_path / 'spans.bin'), capacity=8)
+    recorder.wake_id = 1000.0
+    recorder.wake_start = 50.0
+    recorder.record('boot', 30.0, 20.0)
+    recorder.record('a_long_phase_name_here', 50.5, 1.25)
+
+    assert recorder.records() == [
+        (1000.0, -20.0, 20.0, 'boot'),
+        (1000.0, 0.5, 1.25, 'a_long_phase_nam'),
+    ]
+
+
+def test_span_records_duration(tmp_path):
+    recorder = SpanRecorder(str(tmp_path / 'spans.bin'), capacity=8)
+    with pytest.raises(RuntimeError):
+        with recorder.span('failing'):
+            raise RuntimeError()
+    with recorder.span('ok'):
+        pass
+    assert [r[3] for r in recorder.records()] == ['failing', 'ok']
+    assert all(0 <= r[2] < 1 for r in recorder.records())
+
+
+def test_wrap_around(tmp_path):
+    recorder = SpanRecorder(str(tmp_path / 'spans.bin'), capacity=4)
+    for i in range(10):
+        recorder.record('p{}'.format(i), recorder.wake_start, i)
+
+    # Only the last capacity records, oldest first
+    assert [r[3] for r in recorder.records()] == ['p6', 'p7', 'p8', 'p9']
+    assert [r[2] for r in recorder.records()] == [6, 7, 8, 9]
+    assert os.path.getsize(str(tmp_path / 'spans.bin')) == spans.HEADER.size + 4 * spans.RECORD.size
+
+
+def test_reopen(tmp_path):
+    path = str(tmp_path / 'spans.bin')
+    recorder = SpanRecorder(path, capacity=4)
+    for i in range(6):
+        recorder.record('p{}'.format(i), recorder.wake_start, i)
+    recorder.flush()
+
+    # The capacity of the file is kept, and records continue where they were
+    recorder = SpanRecorder(path)
+    assert recorder.capacity == 4
+    assert recorder.count == 6
+    recorder.record('p6', recorder.wake_start, 6)
+    assert [r[3] for r in recorder.records()] == ['p3', 'p4', 'p5', 'p6']
+
+    # Another capacity starts over
+    recorder = SpanRecorder(path, capacity=8)
+    assert recorder.records() == []
+    assert os.path.getsize(path) == spans.HEADER.size + 8 * spans.RECORD.size
+
+
+def test_incompatible_file_starts_over(tmp_path):
+    path = str(tmp_path / 'spans.bin')
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<4sHHII', b'SPAN', spans.VERSION + 1, spans.RECORD.size, 4, 3))
+    recorder = SpanRecorder(path)
+    assert recorder.capacity == 4
+    assert recorder.records() == []
+
+    with open(path, 'wb') as f:
+        f.write(b'garbage')
+    recorder = SpanRecorder(path)
+    assert recorder.capacity == spans.CAPACITY
+    assert recorder.records() == []
+
+
+def test_null_recorder_fallback(tmp_path, monkeypatch, no_recorder):
+    monkeypatch.setattr(spans, 'SPANS_PATH', str(tmp_path / 'missing' / 'spans.bin'))
+    recorder = spans.get_recorder()
+    assert isinstance(recorder, NullRecorder)
+
+    # Everything still works, nothing is recorded
+    with spans.span('phase'):
+        pass
+    recorder.start_wake()
+    recorder.record('phase', 0, 1)
+    spans.flush()
+    assert spans.get_recorder() is recorder
+
+
+def test_module_span(tmp_path, monkeypatch, no_recorder):
+    monkeypatch.setattr(spans, 'SPANS_PATH', str(tmp_path / 'spans.bin'))
+    with spans.span('phase'):
+        pass
+    spans.flush()
+    assert [r[3] for r in SpanRecorder(str(tmp_path / 'spans.bin')).records()] == ['phase']
+
+
+def test_summarize():
+    records = []
+    for wake in range(10):
+        # Spans of the same phase within a wake are added together
+        records.append((float(wake), 0, wake / 2, 'fetch'))
+        records.append((float(wake), 1, wake / 2, 'fetch'))
+        records.append((float(wake), 2, 1.0, 'it8951'))
+    records.append((10.0, 0, 100.0, 'boot'))
+
+    summary = spans.summarize(records, last=20)
+    assert summary['fetch'] == (10, 4.0, 8.0, 9.0)
+    assert summary['it8951'] == (10, 1.0, 1.0, 1.0)
+    assert summary['boot'] == (1, 100.0, 100.0, 100.0)
+
+    # Only the last wakes, by wake id
+    summary = spans.summarize(list(reversed(records)), last=5)
+    assert summary['fetch'] == (4, 8.0, 9.0, 9.0)
+    assert 'boot' in summary
+
+
+def test_percentile():
+    values = list(range(11))
+    assert spans.percentile(values, 0) == 0
+    assert spans.percentile(values, 50) == 5
+    assert spans.percentile(values, 90) == 9
+    assert spans.percentile(values, 100) == 10
+    assert spans.percentile([3.0], 90) == 3.0
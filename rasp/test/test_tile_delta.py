@@ -0,0 +1,58 @@
+import os
+import sys
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import tile_delta
+
+SIZE = (200, 130)
+
+
+def make_frame(color=0xFF):
+    return tile_delta.quantize(Image.new('L', SIZE, color))
+
+
+def test_pack_4bpp():
+    data = bytes([0x00, 0xFF, 0x12, 0x34, 0xA0])
+    packed = tile_delta.pack_4bpp(data)
+    assert packed == bytes([0x0F, 0x13, 0xA0])
+    assert tile_delta.unpack_4bpp(packed, len(data)) == bytes([0x00, 0xF0, 0x10, 0x30, 0xA0])
+
+
+def test_roundtrip():
+    old = make_frame()
+    new = old.copy()
+    new.paste(0x00, (10, 10, 20, 20))
+    # crosses a tile border, and touches the partial tiles at the edges
+    new.paste(0x80, (60, 100, 199, 129))
+
+    delta = tile_delta.encode_delta(old, new)
+    width, height, frame_hash, tiles = tile_delta.decode_delta(delta)
+    assert (width, height) == SIZE
+    assert frame_hash == tile_delta.frame_hash(new)
+    # one tile, and 4 columns x 2 rows of tiles
+    assert len(tiles) == 1 + 4*2
+
+    frame = old.copy()
+    bbox = tile_delta.apply_delta(frame, tiles)
+    assert frame.tobytes() == new.tobytes()
+    assert bbox == (0, 0, 200, 130)
+
+
+def test_no_changes():
+    frame = make_frame()
+    _, _, frame_hash, tiles = tile_delta.decode_delta(tile_delta.encode_delta(frame, frame))
+    assert tiles == []
+    assert frame_hash == tile_delta.frame_hash(frame)
+    assert tile_delta.apply_delta(frame.copy(), tiles) is None
+
+
+def main():
+    test_pack_4bpp()
+    test_roundtrip()
+    test_no_changes()
+    print('All tests passed')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+# Tile deltas between two frames, so that a display that already has the
+# previous frame only needs to download the tiles that changed.
+#
+# The client sends the hash of the frame it has (baseHash). If the server knows
+# that frame, it can respond with a delta instead of a PNG:
+#
+#     header: magic, version, width, height, tile size, new frame hash, tile count
+#     tiles:  x, y, width, height, then the pixels packed at 4 bits per pixel
+#
+# all zlib compressed. Frames are compared and hashed after reducing them to the
+# 16 gray levels the display can show, which is also what the tiles carry.
+
+import zlib
+import struct
+import hashlib
+from PIL import Image, ImageChops
+
+CONTENT_TYPE = 'application/x-tile-delta'
+TILE_SIZE = 64
+
+MAGIC = b'TDLT'
+VERSION = 1
+# magic, version, width, height, tile size, sha1 of the new frame, tile count
+HEADER = struct.Struct('<4sBHHH20sI')
+# x, y, width, height
+TILE = struct.Struct('<HHHH')
+
+# byte -> the byte's 4 most significant bits, in the high or low nibble
+HIGH_NIBBLE = bytes(x & 0xF0 for x in range(256))
+LOW_NIBBLE = bytes(x >> 4 for x in range(256))
+# packed byte -> its low nibble as an 8 bit gray level
+LOW_TO_HIGH = bytes((x & 0x0F) << 4 for x in range(256))
+
+
+def quantize(img):
+    '''
+    Reduce an 'L' image to the 16 gray levels the display shows
+    '''
+    return img.point(lambda x: x & 0xF0)
+
+
+def frame_hash(img):
+    '''
+    Hash of a quantized 'L' image, as a hex string
+    '''
+    return frame_hasher(img.tobytes()).hexdigest()
+
+
+def frame_hasher(data=b''):
+    '''
+    The hashlib object of frame_hash, for hashing a frame a band at a time:
+    update() with the bytes of each band, top to bottom
+    '''
+    return hashlib.sha1(data)
+
+
+def pack_4bpp(data):
+    '''
+    Pack 8 bit pixels into 4 bits each, first pixel in the high nibble
+    '''
+    if len(data) % 2:
+        data += b'\0'
+    high = data[0::2].translate(HIGH_NIBBLE)
+    low = data[1::2].translate(LOW_NIBBLE)
+    # OR the two byte strings together in one go
+    n = len(high)
+    return (int.from_bytes(high, 'big') | int.from_bytes(low, 'big')).to_bytes(n, 'big')
+
+
+def unpack_4bpp(packed, count):
+    '''
+    Unpack count pixels packed by pack_4bpp into 8 bit pixels
+    '''
+    out = bytearray(len(packed) * 2)
+    out[0::2] = packed.translate(HIGH_NIBBLE)
+    out[1::2] = packed.translate(LOW_TO_HIGH)
+    return bytes(out[:count])
+
+
+def changed_tiles(old, new, tile_size=TILE_SIZE):
+    '''
+    Return the boxes of the tiles that differ between two images of the same size
+    '''
+    bbox = ImageChops.difference(old, new).getbbox()
+    if bbox is None:
+        return []
+
+    width, height = new.size
+    boxes = []
+    for y in range(bbox[1] // tile_size * tile_size, bbox[3], tile_size):
+        for x in range(bbox[0] // tile_size * tile_size, bbox[2], tile_size):
+            box = (x, y, min(x + tile_size, width), min(y + tile_size, height))
+            if old.crop(box).tobytes() != new.crop(box).tobytes():
+                boxes.append(box)
+    return boxes
+
+
+def encode_delta(old, new, tile_size=TILE_SIZE):
+    '''
+    Encode the tiles of quantized image new that differ from quantized image old
+    '''
+    if old.size != new.size:
+        raise ValueError('Frames have different sizes')
+
+    boxes = changed_tiles(old, new, tile_size)
+    parts = [HEADER.pack(MAGIC, VERSION, new.width, new.height, tile_size,
+                         bytes.fromhex(frame_hash(new)), len(boxes))]
+    for box in boxes:
+        parts.append(TILE.pack(box[0], box[1], box[2] - box[0], box[3] - box[1]))
+        parts.append(pack_4bpp(new.crop(box).tobytes()))
+    return zlib.compress(b''.join(parts))
+
+
+def decode_delta(body):
+    '''
+    Return (width, height, new frame hash, tiles), where tiles is a list of
+    (box, 'L' image)
+    '''
+    data = zlib.decompress(body)
+    magic, version, width, height, _, digest, count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Not a tile delta of version {}'.format(VERSION))
+
+    offset = HEADER.size
+    tiles = []
+    for _ in range(count):
+        x, y, w, h = TILE.unpack_from(data, offset)
+        offset += TILE.size
+        size = (w * h + 1) // 2
+        pixels = unpack_4bpp(data[offset:offset + size], w * h)
+        offset += size
+        tiles.append(((x, y, x + w, y + h), Image.frombytes('L', (w, h), pixels)))
+
+    return width, height, digest.hex(), tiles
+
+
+def apply_delta(img, tiles):
+    '''
+    Paste decoded tiles into img. Returns the bounding box of the changes, or
+    None if there were no tiles.
+    '''
+    bbox = None
+    for box, tile in tiles:
+        img.paste(tile, box[:2])
+        if bbox is None:
+            bbox = box
+        else:
+            bbox = (min(bbox[0], box[0]), min(bbox[1], box[1]),
+                    max(bbox[2], box[2]), max(bbox[3], box[3]))
+    return bbox
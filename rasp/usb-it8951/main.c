@@ -56,6 +56,9 @@ typedef struct it8951_display_area {
 
 int debug = 0;
 int clear = 0;
+int no_refresh = 0;
+int refresh_only = 0;
+int standby = 0;
 
 int
 memory_write(int fd, unsigned int addr, unsigned int length, char *data)
@@ -134,9 +137,33 @@ load_image_area(int fd, int addr, int x, int y, int w, int h,
 	if (ioctl(fd, SG_IO, &io_hdr) < 0) {
 		perror("SG_IO image load failed");
 	}
+	free(data_buffer);
 	return 0;
 }
 
+/*
+ * Read exactly size bytes from stdin
+ */
+void
+read_stdin(unsigned char *buffer, size_t size)
+{
+	size_t total_left = size;
+	unsigned char *buffer_pointer = buffer;
+	while (total_left > 0) {
+		ssize_t current = read(STDIN_FILENO, buffer_pointer, total_left);
+		if (current < 0) {
+			perror("stdin read");
+			exit(EXIT_FAILURE);
+		} else if (current == 0) {
+			fprintf(stderr, "stdin input is truncated\n");
+			exit(EXIT_FAILURE);
+		} else {
+			total_left -= current;
+			buffer_pointer += current;
+		}
+	}
+}
+
 int
 display_area(int fd, int addr, int x, int y, int w, int h, int mode)
 {
@@ -270,6 +297,43 @@ int pmic_set(int fd, int vcom)
 	return 0;
 }
 
+int pmic_power(int fd, int on)
+{
+	unsigned char set_power_cmd[16] = {
+		0xfe, // Customer command.
+		0x00,
+		0x00,
+		0x00,
+		0x00,
+		0x00,
+		0xa3, // PMIC (Power Management Integrated Circuits) command.
+		0x00,
+		0x00, // Vcom, unused
+		0x00, // Do Set VCom? (0 – no, 1 – yes)
+		0x01, // Do Set Power? (0 – no, 1 – yes)
+		on ? 0x01 : 0x00, // Power (0 – off, 1 – on)
+		0x00,
+		0x00,
+		0x00,
+		0x00,
+	};
+
+	sg_io_hdr_t io_hdr;
+
+	memset(&io_hdr, 0, sizeof(sg_io_hdr_t));
+	io_hdr.interface_id = 'S';
+	io_hdr.cmd_len = 16;
+	io_hdr.dxfer_direction = SG_DXFER_TO_DEV;
+	io_hdr.dxfer_len = 0;
+	io_hdr.cmdp = set_power_cmd;
+	io_hdr.timeout = 5000;
+
+	if (ioctl(fd, SG_IO, &io_hdr) < 0) {
+		perror("SG_IO power on/off failed");
+	}
+	return 0;
+}
+
 
 void
 update_region(const char *filename, int x, int y, int w, int h, int mode, int vcom)
@@ -320,11 +384,21 @@ update_region(const char *filename, int x, int y, int w, int h, int mode, int vc
 		exit(EXIT_FAILURE);
 	}
 
+	if (standby == 1) {
+		if (debug == 1) {
+			printf("Turning the display power off\n");
+		}
+		pmic_power(fd, 0);
+		return;
+	}
+
 	if (debug == 1) {
 		printf("Setting vcom value to %d\n", vcom);
 	}
 
 	pmic_set(fd, vcom);
+	// It may have been turned off with -s
+	pmic_power(fd, 1);
 	print_vcom(fd);
 
 	if (debug == 1) {
@@ -372,39 +446,38 @@ update_region(const char *filename, int x, int y, int w, int h, int mode, int vc
 
 	int addr = deviceinfo->image_buffer_addr;
 
-	int size = w * h;
-	unsigned char *image = (unsigned char *) malloc(size);
+	/*
+	 * Each chunk is sent as soon as its lines have arrived on stdin, so that
+	 * whoever produces the image (e.g. downloads and decodes it) can run at the
+	 * same time as the transfer, and only one chunk is kept in memory.
+	 */
+	int lines = MAX_TRANSFER / w;
+	if (lines > h) {
+		lines = h;
+	}
+	unsigned char *chunk = (unsigned char *) malloc(lines * w);
 	if (clear == 1) {
-		memset(image, 0xff, size);
-	} else {
-		size_t total_left = size;
-		unsigned char *buffer_pointer = image;
-		while (total_left > 0) {
-			size_t current = read(STDIN_FILENO, buffer_pointer, total_left);
-			if (current < 0) {
-				perror("stdin read");
-				exit(EXIT_FAILURE);
-			} else if (current == 0) {
-				fprintf(stderr, "stdin input is truncated\n");
-				exit(EXIT_FAILURE);
-			} else {
-				total_left -= current;
-				buffer_pointer += current;
-			}
-		}
+		memset(chunk, 0xff, lines * w);
 	}
 
-	int offset = 0;
-	int lines = MAX_TRANSFER / w;
-	while (offset < size) {
-		if ((offset / w) + lines > h) {
-			lines = h - (offset / w);
+	int row = 0;
+	while (refresh_only == 0 && row < h) {
+		if (row + lines > h) {
+			lines = h - row;
+		}
+		if (clear == 0) {
+			read_stdin(chunk, lines * w);
 		}
 		if (debug == 1) {
-			printf("Sending %dx%d chunk to %d,%d\n", w, lines, x, y + (offset / w));
+			printf("Sending %dx%d chunk to %d,%d\n", w, lines, x, y + row);
 		}
-		load_image_area(fd, addr, x, y + (offset / w), w, lines, &image[offset]);
-		offset += lines * w;
+		load_image_area(fd, addr, x, y + row, w, lines, chunk);
+		row += lines;
+	}
+	free(chunk);
+
+	if (no_refresh == 1) {
+		return;
 	}
 	if (debug == 1) {
 		printf("Starting refresh\n");
@@ -415,11 +488,14 @@ update_region(const char *filename, int x, int y, int w, int h, int mode, int vc
 void
 print_usage(const char *name)
 {
-	fprintf(stderr, "Usage: %s [-v vcom] [-m mode] [-dc] device x y w h\n", name);
+	fprintf(stderr, "Usage: %s [-v vcom] [-m mode] [-dcnrs] device x y w h\n", name);
 	fprintf(stderr, "Options are:\n"
 			"		-m: Refresh mode, 0=blank, 2=G16 (default), 4=A2\n"
 			"		-d: Enable debug output\n"
 			"		-c: Use a clean image instead of stdin\n"
+			"		-n: Only load the image into the controller, don't refresh the display\n"
+			"		-r: Only refresh the display from the controller's memory, don't load an image\n"
+			"		-s: Only turn the display power off until the next image is sent\n"
 			"		-v: Set vcom value as positive millivoltage integer. E.g. 2500 (-2500 mV = -2.5V)\n"
 			"		device: path to the disk device\n"
 			"		x y: position of the image\n"
@@ -435,7 +511,7 @@ main(int argc, char *argv[])
 	int mode = 2;
 	int vcom = 1500;
 
-	while ((opt = getopt(argc, argv, "v:m:dc")) != -1) {
+	while ((opt = getopt(argc, argv, "v:m:dcnrs")) != -1) {
 		switch (opt) {
 			case 'm':
 				mode = strtol(optarg, NULL, 10);
@@ -449,6 +525,15 @@ main(int argc, char *argv[])
 			case 'c':
 				clear = 1;
 				break;
+			case 's':
+				standby = 1;
+				break;
+			case 'n':
+				no_refresh = 1;
+				break;
+			case 'r':
+				refresh_only = 1;
+				break;
 			default:
 				print_usage(argv[0]);
 		}
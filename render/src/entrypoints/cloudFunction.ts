@@ -117,6 +117,9 @@ async function renderHandler(req: Request, res: Response) {
     showBatteryPercentage: req.query.showBatteryPercentage
       ? req.query.showBatteryPercentage === 'true'
       : undefined,
+    showSystemInfo: req.query.showSystemInfo
+      ? req.query.showSystemInfo === 'true'
+      : undefined,
 
     width: req.query.width ? Number(req.query.width) : undefined,
     height: req.query.height ? Number(req.query.height) : undefined,
@@ -148,6 +151,13 @@ async function renderHandler(req: Request, res: Response) {
   if (!_.isFinite(opts.location.lon)) {
     throw new HttpError(400, `Invalid 'lon' query parameter: must be a number`)
   }
+  if (
+    opts.showSystemInfo === false &&
+    _.isUndefined(req.query.batteryLevel)
+  ) {
+    // Battery level isn't shown, so it's not required
+    opts.batteryLevel = 100
+  }
   if (
     !_.isFinite(opts.batteryLevel) ||
     opts.batteryLevel > 100 ||
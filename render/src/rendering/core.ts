@@ -40,6 +40,8 @@ export type GenerateOptions = {
   batteryLevel: number // 0-100
   showBatteryPercentage?: boolean
   batteryCharging?: boolean
+  // Hide the refresh time and battery status, e.g. when the device draws them itself
+  showSystemInfo?: boolean
   switchDayAtHour: number
   // Viewport width in headless Chrome
   width?: number
@@ -280,6 +282,15 @@ function getHtmlReplacements(
       match: { attrs: { id: 'refresh-timestamp' } },
       newContent: dateFnsTz.formatInTimeZone(now, opts.timezone, 'HH:mm'),
     },
+    {
+      match: { attrs: { id: 'system-info' } },
+      modifier: (node) => {
+        if (opts.showSystemInfo === false) {
+          // Keep the space, so that the rest of the top bar doesn't move
+          node.attrs = { ...node.attrs, style: 'visibility: hidden' }
+        }
+      },
+    },
     {
       match: { attrs: { id: 'battery-icon' } },
       modifier: (node) =>